@@ -0,0 +1,66 @@
+# benchmarks/bench_collision.py
+#
+# Compares the per-bullet spritecollide pass against the SpatialHash broadphase.
+# Run from the game folder: python benchmarks/bench_collision.py
+
+import os
+import sys
+import random
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import pygame
+
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, COLLISION_CELL_SIZE
+from spatial_hash import SpatialHash
+from bullet import Bullet
+from enemy import Enemy
+
+def make_scene(rng, bullet_count, enemy_count):
+    bullet_img = pygame.Surface((24, 33))
+    enemy_img = pygame.Surface((50, 64))
+    bullets = pygame.sprite.Group(
+        Bullet(rng.randint(0, SCREEN_WIDTH), rng.randint(0, SCREEN_HEIGHT), bullet_img) for _ in range(bullet_count))
+    enemies = pygame.sprite.Group(
+        Enemy(rng.randint(0, SCREEN_WIDTH), rng.randint(0, SCREEN_HEIGHT), enemy_img, rng) for _ in range(enemy_count))
+    return bullets, enemies
+
+def naive_pass(bullets, enemies):
+    return [pygame.sprite.spritecollide(bullet, enemies, False) for bullet in bullets]
+
+def hashed_pass(bullets, enemies, grid):
+    grid.rebuild(enemies)
+    return [grid.spritecollide(bullet, False) for bullet in bullets]
+
+def best_of(repeats, func, *args):
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Compare spritecollide against the SpatialHash broadphase")
+    parser.add_argument("--bullets", type=int, default=2000)
+    parser.add_argument("--enemies", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    bullets, enemies = make_scene(random.Random(args.seed), args.bullets, args.enemies)
+    grid = SpatialHash(COLLISION_CELL_SIZE)
+
+    if naive_pass(bullets, enemies) != hashed_pass(bullets, enemies, grid):
+        sys.exit("broadphase results differ from spritecollide")
+
+    naive = best_of(args.repeats, naive_pass, bullets, enemies)
+    hashed = best_of(args.repeats, hashed_pass, bullets, enemies, grid)
+    print(f"{args.bullets} bullets vs {args.enemies} enemies")
+    print(f"  spritecollide: {naive * 1000:8.2f} ms/pass")
+    print(f"  spatial hash:  {hashed * 1000:8.2f} ms/pass  ({naive / hashed:.1f}x)")
+
+if __name__ == "__main__":
+    main()
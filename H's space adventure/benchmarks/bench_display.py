@@ -0,0 +1,79 @@
+# benchmarks/bench_display.py
+#
+# Presentation cost per frame of each display backend (see display.py). A
+# seeded World plays on its own while every frame is drawn through a
+# Renderer, HUD included, then presented; the table shows the time spent
+# drawing and the time spent in present() (for "texture": uploading the
+# frame and drawing the sprite textures; for "scaled": SDL's upload and
+# stretch). Uses SDL's software renderer unless --driver says otherwise,
+# so it runs on a machine without a GPU. Run from the game folder:
+#   python benchmarks/bench_display.py [--frames 600] [--window 1600x1280] [--driver software]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+def measure(backend, frames, window, driver, seed):
+    import random
+    from assets import assets
+    from display import open_display, get_display, close_display, upload
+    from renderer import Renderer
+    from text_cache import GlyphAtlas
+    from world import World, load_images, sprite_images
+    from policies import random_policy
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = open_display(backend, window_size=window, driver=driver)
+    images = load_images()
+    atlas = assets.atlas()
+    upload({atlas.source(image)[0] if atlas is not None else image for image in sprite_images(*images)})
+    world = World(*images, seed=seed)
+    policy = random_policy(random.Random(seed))
+    renderer = Renderer(screen, (5, 5, 20))
+    glyphs = GlyphAtlas(assets.font(None, 30), True, (255, 255, 255))
+    display = get_display()
+
+    draws, presents = [], []
+    for _ in range(frames):
+        if world.game_over:
+            world = World(*images, seed=seed)
+        world.step(policy(world))
+        started = time.perf_counter()
+        renderer.begin()
+        world.draw(renderer)
+        glyphs.draw(renderer, "Score: ", world.score, (10, 10))
+        draws.append(time.perf_counter() - started)
+        renderer.present()
+        presents.append(display.last_present)
+    close_display()
+    pygame.display.quit()
+    return draws, presents
+
+def main():
+    import argparse
+    from display import BACKENDS
+    parser = argparse.ArgumentParser(description="Per-frame draw and present cost of each display backend")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--window", default="1600x1280", help="window size for the texture backend")
+    parser.add_argument("--driver", default="software", help="SDL render driver for scaled and texture")
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("backends", nargs="*", default=list(BACKENDS))
+    args = parser.parse_args()
+    window = tuple(int(n) for n in args.window.split("x"))
+
+    print(f"{args.frames} frames, {args.driver} renderer, texture window {window[0]}x{window[1]}; ms per frame")
+    print(f"{'backend':10} {'draw':>7} {'present':>8} {'p99':>7}")
+    for backend in args.backends:
+        draws, presents = measure(backend, args.frames, window, args.driver, args.seed)
+        presents.sort()
+        p99 = presents[min(len(presents) - 1, len(presents) * 99 // 100)]
+        print(f"{backend:10} {sum(draws) / len(draws) * 1000:7.2f} {sum(presents) / len(presents) * 1000:8.2f} {p99 * 1000:7.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# benchmarks/bench_masks.py
+#
+# Cost of pixel-perfect hits next to plain rect hits, through the same
+# SpatialHash pass World uses: rect overlap only, masks.collide_mask (cached
+# masks behind a rect prefilter), and pygame.sprite.collide_mask, which builds
+# both masks on every test. Also times the player against a field of enemy
+# shots. Run from the game folder: python benchmarks/bench_masks.py
+
+import os
+import sys
+import random
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, COLLISION_CELL_SIZE
+from spatial_hash import SpatialHash
+from masks import collide_mask, mask_for
+from bullet import Bullet
+from enemy import Enemy
+from player import Player
+from projectiles import ProjectilePool
+
+def make_scene(rng, images, bullet_count, enemy_count):
+    player_img, bullet_img, enemy_img = images
+    bullets = [Bullet(rng.randint(0, SCREEN_WIDTH), rng.randint(0, SCREEN_HEIGHT), bullet_img) for _ in range(bullet_count)]
+    enemies = pygame.sprite.Group(
+        Enemy(rng.randint(0, SCREEN_WIDTH), rng.randint(0, SCREEN_HEIGHT), enemy_img, rng) for _ in range(enemy_count))
+    return bullets, enemies
+
+def collision_pass(bullets, enemies, grid, collided):
+    grid.rebuild(enemies)
+    return sum(len(grid.spritecollide(bullet, False, collided)) for bullet in bullets)
+
+def best_of(repeats, func, *args):
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Rect vs cached-mask vs uncached-mask collision cost")
+    parser.add_argument("--bullets", type=int, default=300)
+    parser.add_argument("--enemies", type=int, default=60)
+    parser.add_argument("--shots", type=int, default=2000, help="enemy shots tested against the player")
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    images = [pygame.image.load(f"assets/images/{name}.png").convert_alpha() for name in ("player", "bullet", "enemy")]
+    rng = random.Random(args.seed)
+    bullets, enemies = make_scene(rng, images, args.bullets, args.enemies)
+    grid = SpatialHash(COLLISION_CELL_SIZE)
+
+    print(f"{args.bullets} bullets vs {args.enemies} enemies (ms/pass, hits)")
+    rect_time, rect_hits = best_of(args.repeats, collision_pass, bullets, enemies, grid, None)
+    print(f"  {'rect':14} {rect_time * 1000:7.3f}  {rect_hits:5}")
+    for name, collided in (("cached mask", collide_mask), ("uncached mask", pygame.sprite.collide_mask)):
+        seconds, hits = best_of(args.repeats, collision_pass, bullets, enemies, grid, collided)
+        print(f"  {name:14} {seconds * 1000:7.3f}  {hits:5}  ({seconds / rect_time:.2f}x rect)")
+
+    player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50, images[0])
+    pool = ProjectilePool(capacity=args.shots)
+    def player_pass(mask):
+        pool.clear()
+        rng = random.Random(args.seed)
+        for _ in range(args.shots):
+            pool.emit(rng.randint(0, SCREEN_WIDTH), rng.randint(SCREEN_HEIGHT - 200, SCREEN_HEIGHT), 90, 5)
+        started = time.perf_counter()
+        hits = pool.collide_rect(player.rect, mask)
+        return time.perf_counter() - started, hits
+    print(f"player vs {args.shots} enemy shots (ms/pass, hits)")
+    rect_time, rect_hits = min(player_pass(None) for _ in range(args.repeats))
+    print(f"  {'rect':14} {rect_time * 1000:7.3f}  {rect_hits:5}")
+    seconds, hits = min(player_pass(mask_for(player.image)) for _ in range(args.repeats))
+    print(f"  {'cached mask':14} {seconds * 1000:7.3f}  {hits:5}  ({seconds / rect_time:.2f}x rect)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# benchmarks/bench_projectiles.py
+#
+# Enemy fire at bullet-hell density: one EnemyBullet sprite per shot vs the
+# ProjectilePool. Both keep --bullets live shots falling down the screen,
+# topping up every tick, and test them all against the player each tick.
+# Run from the game folder: python benchmarks/bench_projectiles.py --bullets 20000
+
+import os
+import sys
+import random
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+PLAYER = pygame.Rect(SCREEN_WIDTH // 2 - 32, SCREEN_HEIGHT - 82, 64, 64)
+
+def run(ticks, top_up, update, collide, draw):
+    """Milliseconds per tick spent in update, collide and draw"""
+    totals = [0.0, 0.0, 0.0]
+    for _ in range(ticks):
+        top_up()
+        t0 = time.perf_counter()
+        update()
+        t1 = time.perf_counter()
+        collide()
+        t2 = time.perf_counter()
+        draw()
+        t3 = time.perf_counter()
+        totals[0] += t1 - t0
+        totals[1] += t2 - t1
+        totals[2] += t3 - t2
+    return [t * 1000 / ticks for t in totals]
+
+def time_sprites(screen, count, ticks):
+    from enemy_bullet import EnemyBullet
+    rng = random.Random(0)
+    player = pygame.sprite.Sprite()
+    player.rect = PLAYER
+    group = pygame.sprite.Group()
+    def top_up():
+        while len(group) < count:
+            group.add(EnemyBullet(rng.randint(0, SCREEN_WIDTH), rng.randint(0, SCREEN_HEIGHT // 2)))
+    return run(ticks, top_up, group.update,
+               lambda: pygame.sprite.spritecollide(player, group, True),
+               lambda: group.draw(screen))
+
+def time_pool(screen, count, ticks):
+    from projectiles import ProjectilePool
+    rng = random.Random(0)
+    pool = ProjectilePool(capacity=count)
+    def top_up():
+        while len(pool) < count:
+            pool.emit(rng.randint(0, SCREEN_WIDTH), rng.randint(0, SCREEN_HEIGHT // 2), 90, 5)
+    return run(ticks, top_up, pool.update, lambda: pool.collide_rect(PLAYER), lambda: pool.draw(screen))
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="EnemyBullet sprites vs ProjectilePool")
+    parser.add_argument("--bullets", type=int, default=20000)
+    parser.add_argument("--ticks", type=int, default=120)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    sprites = time_sprites(screen, args.bullets, args.ticks)
+    pool = time_pool(screen, args.bullets, args.ticks)
+    print(f"{args.bullets} live enemy bullets, {args.ticks} ticks (ms/tick)")
+    print("                   update  collide     draw    total")
+    for name, row in (("EnemyBullet:   ", sprites), ("ProjectilePool:", pool)):
+        print(f"  {name} {row[0]:7.2f}  {row[1]:7.2f}  {row[2]:7.2f}  {sum(row):7.2f}")
+    print(f"  pool is {sum(sprites) / sum(pool):.1f}x faster")
+
+if __name__ == "__main__":
+    main()
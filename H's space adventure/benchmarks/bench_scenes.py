@@ -0,0 +1,54 @@
+# benchmarks/bench_scenes.py
+#
+# CPU the menu screens burn while nobody touches them. Each case runs a screen
+# through SceneManager for a few seconds of wall time and reports frames drawn
+# and process CPU time as a share of one core: the menu at the full FPS every
+# screen used to loop at, at MENU_FPS, at IDLE_FPS, and the game over screen,
+# which waits for events only. Run from the game folder:
+#   python benchmarks/bench_scenes.py [--seconds 5]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, MENU_FPS, IDLE_FPS
+from scenes import SceneManager
+from main import Menu, GameOverScreen
+
+def measure(scene, seconds):
+    manager = SceneManager(scene)
+    pygame.event.clear()
+    pygame.time.set_timer(pygame.QUIT, int(seconds * 1000), 1)
+    wall, cpu = time.perf_counter(), time.process_time()
+    manager.run()
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return manager.frames, manager.waits, cpu / wall
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="CPU use of idle menu screens under the scene manager")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    print(f"{'case':28} {'frames':>7} {'waits':>7} {'cpu':>6}")
+    for name, fps in ((f"menu at FPS ({FPS})", FPS), (f"menu at MENU_FPS ({MENU_FPS})", MENU_FPS),
+                      (f"menu at IDLE_FPS ({IDLE_FPS})", IDLE_FPS)):
+        menu = Menu(screen)
+        menu.fps = menu.idle_fps = fps
+        frames, waits, cpu = measure(menu, args.seconds)
+        print(f"{name:28} {frames:7} {waits:7} {cpu:6.1%}")
+    frames, waits, cpu = measure(GameOverScreen(screen, 0, 0), args.seconds)
+    print(f"{'game over (events only)':28} {frames:7} {waits:7} {cpu:6.1%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# benchmarks/bench_sim_process.py
+#
+# Main-process frame time with the World stepped in the frame loop versus in
+# a sim_worker process. Each case renders at RENDER_FPS (or 60) for a few
+# seconds of wall time with fire held, and reports the time each frame spent
+# before it could present: stepping the due ticks and drawing in-process, or
+# reading the latest snapshot and drawing it with the worker. Ticks reached
+# shows the worker kept up. On a single core the two processes still share
+# it, so the worker only moves the step off the frame, not onto idle
+# hardware. Run from the game folder:
+#   python benchmarks/bench_sim_process.py [--seconds 10] [--seed 3] [--bullet-hell]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, RENDER_FPS, TICK_RATE
+from inputs import INPUT_FIRE
+
+def paced(seconds, frame):
+    """Call frame() once per render frame for seconds; returns each call's duration"""
+    period = 1.0 / (RENDER_FPS or 60)
+    times = []
+    start = next_frame = time.perf_counter()
+    while next_frame - start < seconds:
+        now = time.perf_counter()
+        if now < next_frame:
+            time.sleep(next_frame - now)
+        began = time.perf_counter()
+        frame()
+        times.append(time.perf_counter() - began)
+        next_frame += period
+    return times
+
+def in_process(renderer, seed, bullet_hell, seconds):
+    from world import create_headless_world
+    from timestep import FixedTimestep
+    world = create_headless_world(seed, bullet_hell=bullet_hell)
+    timestep = FixedTimestep()
+    last = [time.perf_counter()]
+
+    def frame():
+        now = time.perf_counter()
+        for _ in range(timestep.advance(now - last[0])):
+            world.step(INPUT_FIRE)
+        last[0] = now
+        renderer.begin()
+        world.draw(renderer, timestep.alpha)
+
+    return paced(seconds, frame), world.tick
+
+def in_worker(renderer, seed, bullet_hell, seconds):
+    from assets import assets
+    from world import load_images, sprite_images
+    from sim_worker import SimProcess, draw_snapshot, TICK
+    atlas = assets.atlas()
+    sources = [atlas.source(image) if atlas is not None else (image, None)
+               for image in sprite_images(*load_images())]
+    sim = SimProcess(seed, bullet_hell, record=False)
+    seen = [-1, 0.0]
+    # Let the worker start up before timing frames
+    while sim.read() is None and sim.alive():
+        time.sleep(0.01)
+
+    def frame():
+        sim.send(INPUT_FIRE)
+        header, rows = sim.read()
+        if header[TICK] != seen[0]:
+            seen[:] = header[TICK], time.perf_counter()
+        renderer.begin()
+        draw_snapshot(renderer, sources, rows, min(1.0, (time.perf_counter() - seen[1]) * TICK_RATE))
+
+    try:
+        return paced(seconds, frame), int(sim.read()[0][TICK])
+    finally:
+        sim.close()
+
+def main():
+    import argparse
+    from renderer import Renderer
+    parser = argparse.ArgumentParser(description="Frame times with the simulation in-process and in a worker process")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--bullet-hell", action="store_true")
+    args = parser.parse_args()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    renderer = Renderer(screen, (5, 5, 20))
+
+    print(f"{os.cpu_count()} cpu(s); frame work before present, ms")
+    print(f"{'case':12} {'frames':>7} {'ticks':>6} {'mean':>7} {'p99':>7} {'max':>7}")
+    for name, case in (("in-process", in_process), ("worker", in_worker)):
+        times, ticks = case(renderer, args.seed, args.bullet_hell, args.seconds)
+        times.sort()
+        mean = sum(times) / len(times)
+        p99 = times[min(len(times) - 1, int(len(times) * 0.99))]
+        print(f"{name:12} {len(times):7} {ticks:6} {mean * 1000:7.2f} {p99 * 1000:7.2f} {times[-1] * 1000:7.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/bench_swarm.py
+#
+# Update + draw cost of a large enemy wave: Enemy sprites vs the NumPy EnemySwarm.
+# Run from the game folder: python benchmarks/bench_swarm.py --enemies 5000
+
+import os
+import sys
+import random
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from enemy import Enemy
+from enemy_swarm import EnemySwarm
+
+def positions(seed, count):
+    rng = random.Random(seed)
+    return [(rng.randint(30, SCREEN_WIDTH - 30), rng.randint(-300, 300)) for _ in range(count)]
+
+def run(ticks, update, draw):
+    """Seconds per tick spent in update and in draw"""
+    update_time = draw_time = 0.0
+    for _ in range(ticks):
+        started = time.perf_counter()
+        update()
+        drawn = time.perf_counter()
+        draw()
+        update_time += drawn - started
+        draw_time += time.perf_counter() - drawn
+    return update_time / ticks, draw_time / ticks
+
+# Both only move here: World fires enemy shots off its timing wheel, and
+# an Enemy without a projectile pool never shoots
+
+def time_sprites(screen, image, spots, ticks):
+    rng = random.Random(0)
+    enemies = pygame.sprite.Group(Enemy(x, y, image, rng) for x, y in spots)
+    return run(ticks, enemies.update, lambda: enemies.draw(screen))
+
+def time_swarm(screen, image, spots, ticks):
+    swarm = EnemySwarm(image, random.Random(0))
+    for x, y in spots:
+        swarm.spawn(x, y)
+    return run(ticks, swarm.update, lambda: swarm.draw(screen))
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Enemy sprites vs EnemySwarm update+draw")
+    parser.add_argument("--enemies", type=int, default=5000)
+    parser.add_argument("--ticks", type=int, default=120)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    image = pygame.image.load("assets/images/enemy.png").convert_alpha()
+    spots = positions(1, args.enemies)
+
+    sprite_update, sprite_draw = time_sprites(screen, image, spots, args.ticks)
+    swarm_update, swarm_draw = time_swarm(screen, image, spots, args.ticks)
+    print(f"{args.enemies} enemies, {args.ticks} ticks (ms/tick)")
+    print("                 update     draw")
+    print(f"  Enemy sprites: {sprite_update * 1000:7.2f}  {sprite_draw * 1000:7.2f}")
+    print(f"  EnemySwarm:    {swarm_update * 1000:7.2f}  {swarm_draw * 1000:7.2f}"
+          f"  (update {sprite_update / swarm_update:.0f}x faster)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+# benchmarks/suite.py
+#
+# Named stress scenarios run headless under the SDL dummy drivers.
+# Run from the game folder:
+#   python benchmarks/suite.py run [--ticks N] [--output results.json] [scenario ...]
+#   python benchmarks/suite.py compare baseline.json results.json [--tolerance 0.10]
+# Each scenario runs in its own process, so peak memory is per scenario.
+# "startup" is the odd one out: it times fresh processes from launch to the
+# first frame main() presents, --startup-runs times over.
+
+import os
+import sys
+import json
+import random
+import subprocess
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, "..", "src"))
+
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "results", "latest.json")
+
+def open_display():
+    import pygame
+    pygame.init()
+    return pygame.display.set_mode((800, 640))
+
+def new_world(seed, **kwargs):
+    from world import World, load_images
+    return World(*load_images(), seed=seed, **kwargs)
+
+def scenario_steady_play(screen):
+    """Normal game: random inputs, restarting on game over"""
+    from policies import random_policy
+    rng = random.Random(1)
+    policy = random_policy(rng)
+    state = {"world": new_world(1)}
+    def tick():
+        world = state["world"]
+        if world.game_over:
+            world = state["world"] = new_world(rng.getrandbits(32))
+        world.step(policy(world))
+        world.draw(screen)
+    return tick
+
+def scenario_player_bullets_5k(screen):
+    """5000 live player bullets, topped up every tick"""
+    from bullet import Bullet
+    world = new_world(2)
+    rng = random.Random(2)
+    def tick():
+        while len(world.bullets) < 5000:
+            world.bullets.add(Bullet(rng.randint(0, 800), rng.randint(40, 640), world.bullet_img))
+        world.step(0)
+        world.health = 10**9
+        world.draw(screen)
+    return tick
+
+def scenario_enemies_firing_1k(screen):
+    """1000 enemies shooting every 10-20 ticks, topped up every tick"""
+    from enemy import Enemy
+    world = new_world(3)
+    rng = random.Random(3)
+    def tick():
+        while world.enemy_count() < 1000:
+            enemy = Enemy(rng.randint(30, 770), rng.randint(-50, 400), world.enemy_img, rng, world.projectiles)
+            enemy.shoot_delay = rng.randint(10, 20)
+            world.add_enemy(enemy)
+        world.step(0)
+        world.health = 10**9
+        world.draw(screen)
+    return tick
+
+def scenario_bullet_hell_20k(screen):
+    """Bullet-hell mode with the enemy projectile pool topped up to 20000 shots"""
+    from projectiles import Ring
+    world = new_world(5, bullet_hell=True)
+    rng = random.Random(5)
+    ring = Ring(count=40, speed=3)
+    def tick():
+        while len(world.projectiles) < 20000:
+            ring.fire(world.projectiles, rng.randint(0, 800), rng.randint(0, 640))
+        world.step(0)
+        world.health = 10**9
+        world.draw(screen)
+    return tick
+
+def scenario_explosion_storm(screen):
+    """60 new explosions a tick, half of each Explosion class"""
+    import explosion
+    from world import Explosion
+    world = new_world(4)
+    rng = random.Random(4)
+    def tick():
+        for _ in range(30):
+            world.explosions.add(Explosion(rng.randint(0, 800), rng.randint(0, 640), world.explosion_frames, world.timers, scale=1.5, speed=4))
+            world.explosions.add(explosion.Explosion(rng.randint(0, 800), rng.randint(0, 640), world.explosion_frames, world.timers))
+        world.step(0)
+        world.health = 10**9
+        world.draw(screen)
+    return tick
+
+def scenario_menu_idle(screen):
+    """Main menu with nobody touching it"""
+    from main import Menu
+    menu = Menu(screen)
+    def tick():
+        menu.update(1 / 60)
+        menu.draw()
+    return tick
+
+SCENARIOS = {
+    "steady_play": scenario_steady_play,
+    "player_bullets_5k": scenario_player_bullets_5k,
+    "enemies_firing_1k": scenario_enemies_firing_1k,
+    "bullet_hell_20k": scenario_bullet_hell_20k,
+    "explosion_storm": scenario_explosion_storm,
+    "menu_idle": scenario_menu_idle,
+}
+
+STARTUP = "startup"
+
+class FirstFrame(Exception):
+    pass
+
+def first_frame_time():
+    """Run main() in this process until it presents a frame; returns time.time() then"""
+    os.chdir(os.path.join(BENCH_DIR, ".."))
+    import pygame
+    def presented(*args):
+        raise FirstFrame
+    pygame.display.flip = pygame.display.update = presented
+    import main
+    try:
+        main.main([])
+    except FirstFrame:
+        return time.time()
+    sys.exit("main() returned without presenting a frame")
+
+def percentile(values, p):
+    return values[min(len(values) - 1, len(values) * p // 100)]
+
+def peak_memory_kb():
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+def run_one(name, ticks):
+    """Run one scenario in this process and return its metrics"""
+    os.chdir(os.path.join(BENCH_DIR, ".."))
+    tick = SCENARIOS[name](open_display())
+    for _ in range(min(60, ticks)):  # warm up caches before timing
+        tick()
+    times = []
+    clock = time.perf_counter
+    started = clock()
+    for _ in range(ticks):
+        t0 = clock()
+        tick()
+        times.append(clock() - t0)
+    elapsed = clock() - started
+    times.sort()
+    return {
+        "ticks": ticks,
+        "ticks_per_sec": ticks / elapsed,
+        "p50_ms": percentile(times, 50) * 1000,
+        "p95_ms": percentile(times, 95) * 1000,
+        "p99_ms": percentile(times, 99) * 1000,
+        "peak_memory_kb": peak_memory_kb(),
+    }
+
+def run_startup(runs):
+    """Launch-to-first-frame times of fresh processes, so imports are never cached in memory"""
+    times = []
+    for _ in range(runs):
+        started = time.time()
+        proc = subprocess.run([sys.executable, os.path.abspath(__file__), "_startup"], capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(proc.stderr)
+            sys.exit("startup benchmark failed")
+        times.append(float(proc.stdout.strip().splitlines()[-1]) - started)
+    times.sort()
+    return {
+        "runs": runs,
+        "p50_ms": percentile(times, 50) * 1000,
+        "p95_ms": percentile(times, 95) * 1000,
+        "p99_ms": percentile(times, 99) * 1000,
+    }
+
+def run(names, ticks, output, startup_runs=10):
+    results = {"created": time.strftime("%Y-%m-%d %H:%M:%S"), "python": sys.version.split()[0], "scenarios": {}}
+    for name in names:
+        if name == STARTUP:
+            metrics = results["scenarios"][name] = run_startup(startup_runs)
+            print(f"{name:20} {metrics['runs']:9} runs     p50 {metrics['p50_ms']:6.1f}  "
+                  f"p95 {metrics['p95_ms']:6.1f}  p99 {metrics['p99_ms']:6.1f} ms to first frame")
+            continue
+        proc = subprocess.run([sys.executable, os.path.abspath(__file__), "_one", name, str(ticks)],
+                              capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(proc.stderr)
+            sys.exit(f"scenario {name} failed")
+        metrics = json.loads(proc.stdout.strip().splitlines()[-1])
+        results["scenarios"][name] = metrics
+        print(f"{name:20} {metrics['ticks_per_sec']:9.0f} ticks/s  p50 {metrics['p50_ms']:6.2f}  "
+              f"p95 {metrics['p95_ms']:6.2f}  p99 {metrics['p99_ms']:6.2f} ms  peak {metrics['peak_memory_kb']} KB")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"results written to {output}")
+
+def compare(baseline_path, current_path, tolerance):
+    """Print both runs side by side; exit 1 if any scenario regressed past tolerance"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)["scenarios"]
+    with open(current_path) as f:
+        current = json.load(f)["scenarios"]
+    regressions = []
+    for name, now in current.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:20} (no baseline)")
+            continue
+        checks = []
+        for metric, worse in (("ticks_per_sec", -1), ("p50_ms", 1), ("p95_ms", 1), ("p99_ms", 1), ("peak_memory_kb", 1)):
+            if metric == "p50_ms" and name != STARTUP:
+                continue  # per-tick medians are too noisy to gate on
+            if before.get(metric) and now.get(metric):
+                checks.append((metric, before[metric], now[metric], worse))
+        for metric, old, new, worse in checks:
+            change = (new - old) / old if old else 0.0
+            flag = ""
+            if change * worse > tolerance:
+                flag = "  REGRESSION"
+                regressions.append((name, metric))
+            print(f"{name:20} {metric:15} {old:12.2f} -> {new:12.2f}  {change:+7.1%}{flag}")
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {tolerance:.0%}")
+        sys.exit(1)
+    print("no regressions")
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Headless stress benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run scenarios and write a results file")
+    run_parser.add_argument("scenarios", nargs="*", help=f"any of {', '.join(SCENARIOS)}, {STARTUP} (default: all)")
+    run_parser.add_argument("--ticks", type=int, default=600)
+    run_parser.add_argument("--startup-runs", type=int, default=10)
+    run_parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    compare_parser = commands.add_parser("compare", help="flag regressions against a baseline results file")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current", nargs="?", default=DEFAULT_OUTPUT)
+    compare_parser.add_argument("--tolerance", type=float, default=0.10)
+    one_parser = commands.add_parser("_one")
+    one_parser.add_argument("scenario", choices=list(SCENARIOS))
+    one_parser.add_argument("ticks", type=int)
+    commands.add_parser("_startup")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        unknown = [name for name in args.scenarios if name not in SCENARIOS and name != STARTUP]
+        if unknown:
+            parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+        run(args.scenarios or [STARTUP] + list(SCENARIOS), args.ticks, args.output, args.startup_runs)
+    elif args.command == "compare":
+        compare(args.baseline, args.current, args.tolerance)
+    elif args.command == "_startup":
+        print(first_frame_time())
+    else:
+        print(json.dumps(run_one(args.scenario, args.ticks)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+# src/assets.py
+
+import os
+import threading
+import time
+
+import pygame
+
+import atlas as atlas_file
+from settings import ATLAS_PATH, USE_ATLAS
+from transform_cache import cache as transform_cache
+from utils import load_sound
+
+# Everything GameScene needs, preloaded while the menu and story are showing
+GAMEPLAY_IMAGES = [
+    "assets/images/player.png",
+    "assets/images/bullet.png",
+    "assets/images/enemy.png",
+    "assets/images/explosion.png",
+]
+GAMEPLAY_SOUNDS = [
+    "assets/sounds/shoot.wav",
+    "assets/sounds/explosion.wav",
+    "assets/sounds/hit.wav",
+]
+
+class AssetManager:
+    """Process-wide cache of converted images, sounds and fonts.
+
+    Each asset is read from disk once, so restarting a game costs nothing.
+    preload() decodes files on a background thread; the pixel-format convert
+    still happens on the main thread the first time an image is asked for.
+    Per-asset load time and size are kept in self.metrics.
+    """
+
+    def __init__(self):
+        self.images = {}
+        self.sheets = {}
+        self.sounds = {}
+        self.fonts = {}
+        self.raw_images = {}
+        self.atlases = {}
+        self.metrics = {}
+        self.lock = threading.Lock()
+        self.thread = None
+        self.pending = set()
+
+    def _record(self, kind, name, seconds, size):
+        with self.lock:
+            entry = self.metrics.get(name)
+            if entry is None:
+                self.metrics[name] = {"kind": kind, "seconds": seconds, "bytes": size}
+            else:
+                entry["seconds"] += seconds
+                entry["bytes"] = size or entry["bytes"]
+
+    def image(self, path):
+        image = self.images.get(path)
+        if image is not None:
+            return image
+        self.wait_for(path)
+        started = time.perf_counter()
+        with self.lock:
+            raw = self.raw_images.pop(path, None)
+        if raw is None:
+            raw = pygame.image.load(path)
+        image = self.images[path] = raw.convert_alpha()
+        self._record("image", path, time.perf_counter() - started, image.get_pitch() * image.get_height())
+        return image
+
+    def atlas(self, path=ATLAS_PATH):
+        """The packed sprite atlas, or None when USE_ATLAS is off or there is no atlas file.
+
+        Its pre-scaled frames are pinned in transform_cache on first load.
+        """
+        if path in self.atlases:
+            return self.atlases[path]
+        atlas = None
+        if USE_ATLAS and os.path.exists(path):
+            self.wait_for(path)
+            started = time.perf_counter()
+            with self.lock:
+                raw = self.raw_images.pop(path, None)
+            atlas = atlas_file.from_data(*raw) if raw is not None else atlas_file.load(path)
+            atlas.install_scaled(transform_cache)
+            surface = atlas.surface
+            self._record("atlas", path, time.perf_counter() - started, surface.get_pitch() * surface.get_height())
+        self.atlases[path] = atlas
+        return atlas
+
+    def sheet(self, path, frame_w, frame_h):
+        """Frames of a horizontal sprite sheet, as shared subsurfaces"""
+        key = (path, frame_w, frame_h)
+        frames = self.sheets.get(key)
+        if frames is None:
+            sheet = self.image(path)
+            frames = self.sheets[key] = [sheet.subsurface(pygame.Rect(i * frame_w, 0, frame_w, frame_h)) for i in range(sheet.get_width() // frame_w)]
+        return frames
+
+    def sound(self, path):
+        sound = self.sounds.get(path)
+        if sound is None:
+            self.wait_for(path)
+            sound = self.sounds.get(path)
+        if sound is None:
+            sound = self._load_sound(path)
+        return sound
+
+    def _load_sound(self, path):
+        started = time.perf_counter()
+        sound = load_sound(path)
+        frequency, size, channels = pygame.mixer.get_init()
+        self.sounds[path] = sound
+        self._record("sound", path, time.perf_counter() - started,
+                     int(sound.get_length() * frequency) * abs(size) // 8 * channels)
+        return sound
+
+    def font(self, path, size):
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            started = time.perf_counter()
+            font = self.fonts[key] = pygame.font.Font(path, size)
+            file_size = os.path.getsize(path) if path else 0
+            self._record("font", f"{path or 'default'}@{size}", time.perf_counter() - started, file_size)
+        return font
+
+    def music(self, path):
+        """Load streamed background music; it can't be cached, only timed"""
+        started = time.perf_counter()
+        pygame.mixer.music.load(path)
+        self._record("music", path, time.perf_counter() - started, os.path.getsize(path))
+
+    def preload(self, images=GAMEPLAY_IMAGES, sounds=GAMEPLAY_SOUNDS):
+        """Start decoding files on a daemon thread; returns immediately"""
+        if self.thread is not None and self.thread.is_alive():
+            return
+        atlases = []
+        if USE_ATLAS and os.path.exists(ATLAS_PATH) and ATLAS_PATH not in self.atlases:
+            atlases = [ATLAS_PATH]
+            images = []  # everything they hold is in the atlas
+        images = [p for p in images if p not in self.images]
+        sounds = [p for p in sounds if p not in self.sounds]
+        self.pending = set(atlases) | set(images) | set(sounds)
+        self.thread = threading.Thread(target=self._preload, args=(atlases, images, sounds), name="asset-preload", daemon=True)
+        self.thread.start()
+
+    def _preload(self, atlases, images, sounds):
+        for path in atlases:
+            started = time.perf_counter()
+            try:
+                raw = atlas_file.read(path)
+            except Exception as e:
+                print(f"Preload failed for {path}: {e}")
+                continue
+            self._record("atlas", path, time.perf_counter() - started, 0)
+            with self.lock:
+                self.raw_images[path] = raw
+        for path in images:
+            started = time.perf_counter()
+            try:
+                raw = pygame.image.load(path)
+            except Exception as e:
+                print(f"Preload failed for {path}: {e}")
+                raw = None
+            if raw is not None:
+                self._record("image", path, time.perf_counter() - started, 0)
+                with self.lock:
+                    self.raw_images[path] = raw
+        for path in sounds:
+            try:
+                self._load_sound(path)
+            except Exception as e:
+                print(f"Preload failed for {path}: {e}")
+
+    def wait_for(self, path):
+        """Block until the preloader is done if it still owes us path"""
+        if self.thread is not None and path in self.pending and self.thread.is_alive():
+            self.thread.join()
+
+    def report(self):
+        """Per-asset (name, kind, milliseconds, kilobytes), slowest first"""
+        with self.lock:
+            items = list(self.metrics.items())
+        rows = [(name, m["kind"], m["seconds"] * 1000, m["bytes"] / 1024) for name, m in items]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+    def print_report(self):
+        rows = self.report()
+        for name, kind, ms, kb in rows:
+            print(f"{kind:6} {ms:8.2f} ms {kb:9.1f} KB  {name}")
+        print(f"total  {sum(r[2] for r in rows):8.2f} ms {sum(r[3] for r in rows):9.1f} KB")
+
+# Shared by every screen
+assets = AssetManager()
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    assets.preload()
+    if assets.atlas() is None:
+        for path in GAMEPLAY_IMAGES:
+            assets.image(path)
+    for path in GAMEPLAY_SOUNDS:
+        assets.sound(path)
+    assets.print_report()
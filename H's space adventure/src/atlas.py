@@ -0,0 +1,174 @@
+# src/atlas.py
+#
+# Packs every gameplay sprite into one surface. Run from the game folder to
+# rebuild the atlas file after changing any of the images:
+#   python src/atlas.py            (writes ATLAS_PATH)
+#   python src/atlas.py --check    (exit 1 if it is missing or out of date)
+
+import json
+import os
+import struct
+import zlib
+
+import pygame
+
+from settings import ATLAS_PATH
+
+# (name, image path) for single sprites, and (name, sheet path, frame width,
+# frame height, extra scales) for sprite sheets. Sheet frames are named
+# "name/i"; a frame pre-scaled by s is "name@s/i" and is handed to
+# transform_cache, so transformed(frame, s) returns the atlas copy.
+ATLAS_IMAGES = [
+    ("player", "assets/images/player.png"),
+    ("bullet", "assets/images/bullet.png"),
+    ("enemy", "assets/images/enemy.png"),
+]
+ATLAS_SHEETS = [
+    ("explosion", "assets/images/explosion.png", 64, 64, (1.5, 2)),
+]
+ATLAS_WIDTH = 512
+PADDING = 1
+
+# File layout: magic "H2AT", version u8, header length u32, JSON header
+# ({"size": [w, h], "regions": {name: [x, y, w, h]}, "sources": {path: crc32}}),
+# then w * h * 4 bytes of RGBA pixels, row by row
+MAGIC = b"H2AT"
+VERSION = 1
+PREFIX = struct.Struct("<4sBI")
+
+class Atlas:
+    """One converted surface holding every sprite, plus where each one is.
+
+    image(name) is a subsurface, so sprites can keep using it as their image
+    (Group.draw, masks and rects all still work). source(image) turns any
+    image back into (atlas surface, area) for batched blits; images that
+    aren't in the atlas come back as (image, None).
+    """
+
+    def __init__(self, surface, regions):
+        self.surface = surface
+        self.regions = {name: pygame.Rect(rect) for name, rect in regions.items()}
+        self.images = {name: surface.subsurface(rect) for name, rect in self.regions.items()}
+        self.areas = {self.images[name]: rect for name, rect in self.regions.items()}
+
+    def image(self, name):
+        return self.images[name]
+
+    def frames(self, name):
+        """Sheet frames "name/0", "name/1", ... in order"""
+        frames = []
+        while f"{name}/{len(frames)}" in self.images:
+            frames.append(self.images[f"{name}/{len(frames)}"])
+        return frames
+
+    def source(self, image):
+        area = self.areas.get(image)
+        if area is None:
+            return image, None
+        return self.surface, area
+
+    def install_scaled(self, cache):
+        """Register the pre-scaled "name@s/i" frames with a TransformCache"""
+        for name, image in self.images.items():
+            base, at, rest = name.partition("@")
+            if not at:
+                continue
+            scale, _, index = rest.partition("/")
+            cache.pin(self.images[f"{base}/{index}"], float(scale), image)
+
+def _entries():
+    """(name, surface) for every sprite that goes into the atlas"""
+    entries = [(name, pygame.image.load(path)) for name, path in ATLAS_IMAGES]
+    for name, path, frame_w, frame_h, scales in ATLAS_SHEETS:
+        sheet = pygame.image.load(path)
+        for i in range(sheet.get_width() // frame_w):
+            frame = sheet.subsurface(pygame.Rect(i * frame_w, 0, frame_w, frame_h))
+            entries.append((f"{name}/{i}", frame))
+            for scale in scales:
+                size = (int(frame_w * scale), int(frame_h * scale))
+                entries.append((f"{name}@{scale:g}/{i}", pygame.transform.scale(frame, size)))
+    return entries
+
+def _sources():
+    paths = [path for _, path in ATLAS_IMAGES] + [sheet[1] for sheet in ATLAS_SHEETS]
+    sources = {}
+    for path in paths:
+        with open(path, "rb") as f:
+            sources[path] = zlib.crc32(f.read())
+    return sources
+
+def pack(entries, width=ATLAS_WIDTH, padding=PADDING):
+    """Shelf-pack (name, surface) entries, tallest first; returns (RGBA surface, regions)"""
+    order = sorted(entries, key=lambda entry: entry[1].get_height(), reverse=True)
+    regions = {}
+    x = y = shelf = 0
+    for name, image in order:
+        w, h = image.get_size()
+        if x + w > width:
+            x, y = 0, y + shelf + padding
+            shelf = 0
+        regions[name] = (x, y, w, h)
+        x += w + padding
+        shelf = max(shelf, h)
+    surface = pygame.Surface((width, y + shelf), pygame.SRCALPHA, 32)
+    surface.fill((0, 0, 0, 0))
+    images = dict(entries)
+    for name, rect in regions.items():
+        # MAX onto the cleared surface copies pixels as they are; a normal
+        # blit would blend soft edges against the transparent black
+        surface.blit(images[name], rect[:2], special_flags=pygame.BLEND_RGBA_MAX)
+    return surface, regions
+
+def build(path=ATLAS_PATH):
+    surface, regions = pack(_entries())
+    header = json.dumps({"size": surface.get_size(), "regions": regions, "sources": _sources()}).encode()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(PREFIX.pack(MAGIC, VERSION, len(header)))
+        f.write(header)
+        f.write(pygame.image.tobytes(surface, "RGBA"))
+    return surface, regions
+
+def read(path=ATLAS_PATH):
+    """(header dict, pixel bytes) of an atlas file"""
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, header_len = PREFIX.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not an atlas file, or an unsupported version")
+    start = PREFIX.size + header_len
+    return json.loads(data[PREFIX.size:start]), memoryview(data)[start:]
+
+def load(path=ATLAS_PATH):
+    """Load a prebuilt atlas: no PNG decoding, just one raw copy and convert (needs a display mode)"""
+    return from_data(*read(path))
+
+def from_data(header, pixels):
+    surface = pygame.image.frombuffer(pixels, header["size"], "RGBA").convert_alpha()
+    return Atlas(surface, header["regions"])
+
+def is_current(path=ATLAS_PATH):
+    """Whether the atlas file exists and was built from the images as they are now"""
+    try:
+        header, _ = read(path)
+    except (OSError, ValueError):
+        return False
+    return header["sources"] == _sources()
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Pack the gameplay sprites into one atlas file")
+    parser.add_argument("--output", default=ATLAS_PATH)
+    parser.add_argument("--check", action="store_true", help="only check the atlas file is up to date")
+    args = parser.parse_args()
+
+    if args.check:
+        current = is_current(args.output)
+        print(f"{args.output} is {'up to date' if current else 'missing or stale; run python src/atlas.py'}")
+        raise SystemExit(0 if current else 1)
+    surface, regions = build(args.output)
+    width, height = surface.get_size()
+    print(f"packed {len(regions)} sprites into {width}x{height}, wrote {args.output} "
+          f"({os.path.getsize(args.output) / 1024:.0f} KB)")
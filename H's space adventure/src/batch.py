@@ -0,0 +1,125 @@
+# src/batch.py
+
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import time
+
+GAME_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+def _init_worker():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    # SDL would otherwise catch SIGTERM and turn it into a QUIT event nobody
+    # reads, so Pool.terminate() would wait forever on the workers
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"
+    os.chdir(GAME_DIR)
+
+def run_episode(job):
+    """Play one seeded headless episode; job is (seed, policy name, overrides, max ticks)"""
+    from world import create_headless_world, run
+    from policies import get_policy
+    seed, policy_name, overrides, max_ticks = job
+    world = create_headless_world(seed, overrides=overrides)
+    run(world, max_ticks, get_policy(policy_name)(random.Random(seed)))
+    return {
+        "seed": seed,
+        "policy": policy_name,
+        "overrides": overrides,
+        "score": world.score,
+        "survival_ticks": world.tick,
+        "kills": world.kills,
+        "damage_taken": world.damage_taken,
+        "died": world.game_over,
+    }
+
+def sweep(grid):
+    """Every combination of a {setting: [values]} grid as override dicts"""
+    names = sorted(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+
+def summarize(results):
+    """Mean/median/stdev of each metric, per distinct set of overrides"""
+    groups = {}
+    for result in results:
+        groups.setdefault(json.dumps(result["overrides"], sort_keys=True), []).append(result)
+    report = []
+    for key, episodes in groups.items():
+        row = {"overrides": json.loads(key), "episodes": len(episodes),
+               "death_rate": sum(e["died"] for e in episodes) / len(episodes)}
+        for metric in ("score", "survival_ticks", "kills", "damage_taken"):
+            values = [e[metric] for e in episodes]
+            row[metric] = {"mean": statistics.fmean(values), "median": statistics.median(values),
+                           "stdev": statistics.pstdev(values)}
+        report.append(row)
+    return report
+
+def run_batch(jobs, workers=None, results_path=None):
+    """Spread jobs over a process pool, streaming each result to results_path as JSON lines"""
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 8))
+    results = []
+    out = open(results_path, "w") if results_path else None
+    pool = multiprocessing.Pool(workers, initializer=_init_worker)
+    try:
+        for result in pool.imap_unordered(run_episode, jobs, chunksize):
+            results.append(result)
+            if out:
+                out.write(json.dumps(result) + "\n")
+        pool.close()
+        pool.join()
+    except BaseException:
+        # On Ctrl+C or an error, stop the episodes still queued rather than
+        # waiting for them; _init_worker keeps SDL from swallowing SIGTERM
+        pool.terminate()
+        raise
+    finally:
+        if out:
+            out.close()
+    return results
+
+def _parse_value(text):
+    for kind in (int, float):
+        try:
+            return kind(text)
+        except ValueError:
+            pass
+    return text  # e.g. a WAVES_PATH
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Run seeded headless episodes in parallel")
+    parser.add_argument("--episodes", type=int, default=100, help="episodes per parameter set")
+    parser.add_argument("--policy", default="random", help="idle, random, dodge or module:function")
+    parser.add_argument("--max-ticks", type=int, default=36000)
+    parser.add_argument("--seed", type=int, default=0, help="first seed; episode i uses seed + i")
+    parser.add_argument("--sweep", action="append", default=[], metavar="SETTING=V1,V2,...",
+                        help="values to try for a setting, e.g. ENEMY_SPEED=1,2,3 (repeatable)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--results", default="batch_results.jsonl", help="per-episode JSON lines")
+    parser.add_argument("--report", default="batch_report.json", help="aggregated report")
+    args = parser.parse_args()
+
+    grid = {}
+    for item in args.sweep:
+        name, _, values = item.partition("=")
+        grid[name] = [_parse_value(v) for v in values.split(",")]
+    jobs = [(args.seed + i, args.policy, overrides, args.max_ticks)
+            for overrides in sweep(grid) for i in range(args.episodes)]
+
+    started = time.perf_counter()
+    results = run_batch(jobs, args.workers, args.results)
+    elapsed = time.perf_counter() - started
+    report = summarize(results)
+    with open(args.report, "w") as f:
+        json.dump(report, f, indent=2)
+
+    ticks = sum(r["survival_ticks"] for r in results)
+    print(f"{len(results)} episodes, {ticks} ticks in {elapsed:.1f}s ({ticks / elapsed:.0f} ticks/sec)")
+    for row in report:
+        print(f"{row['overrides'] or 'defaults'}: score {row['score']['mean']:.0f}, "
+              f"survival {row['survival_ticks']['mean']:.0f} ticks, kills {row['kills']['mean']:.1f}, "
+              f"death rate {row['death_rate']:.0%}")
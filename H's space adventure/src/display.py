@@ -0,0 +1,173 @@
+# src/display.py
+
+import os
+import time
+
+import pygame
+
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, DISPLAY_BACKEND, WINDOW_SIZE, RENDER_DRIVER
+
+BACKENDS = ("window", "scaled", "texture")
+
+class Display:
+    """The game's window. Everything draws to self.surface at the internal
+    resolution SCREEN_WIDTH x SCREEN_HEIGHT, and present() shows it:
+
+    "window"   the surface is the window itself, the way the game always ran.
+    "scaled"   pygame's SCALED window: SDL stretches the surface to the
+               largest whole multiple that fits the desktop and maps the mouse.
+    "texture"  the surface is an offscreen frame, uploaded each present() to
+               one streaming texture that pygame._sdl2.video draws letterboxed
+               into a WINDOW_SIZE window. Sprites registered with upload()
+               become textures once and are drawn by SDL rather than blitted:
+               a Renderer on this surface queues them, and anything it draws
+               after them goes to self.overlay, a second texture on top.
+
+    driver picks SDL's renderer for "scaled" and "texture", e.g. "software"
+    on a machine without a GPU. Time spent in present() is kept in
+    self.present_seconds.
+    """
+
+    def __init__(self, backend=DISPLAY_BACKEND, window_size=WINDOW_SIZE, driver=RENDER_DRIVER,
+                 caption="2100: Space Adventure"):
+        if backend not in BACKENDS:
+            raise ValueError(f"display backend must be one of {', '.join(BACKENDS)}, not {backend!r}")
+        self.backend = backend
+        self.size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.textures = {}
+        self.sprites = []
+        self.overlay_rect = None  # area drawn on the overlay this frame
+        self.presents = 0
+        self.present_seconds = 0.0
+        self.last_present = 0.0
+        if driver:
+            os.environ["SDL_RENDER_DRIVER"] = driver
+        pygame.display.set_caption(caption)
+
+        if backend == "window":
+            self.surface = pygame.display.set_mode(self.size)
+        elif backend == "scaled":
+            self.surface = pygame.display.set_mode(self.size, pygame.SCALED)
+        else:
+            from pygame._sdl2.video import Window, Renderer, Texture, get_drivers
+            # convert() and convert_alpha() still need a display mode; a
+            # hidden one-pixel window gives them the pixel format
+            pygame.display.set_mode((1, 1), pygame.HIDDEN)
+            self.window = Window(caption, size=window_size or self.size, resizable=True)
+            index = -1
+            if driver:
+                names = [info.name for info in get_drivers()]
+                if driver not in names:
+                    raise ValueError(f"RENDER_DRIVER {driver!r} is not available here; "
+                                     f"choose one of {', '.join(names)}")
+                index = names.index(driver)
+            self.renderer = Renderer(self.window, index=index)
+            self.renderer.logical_size = self.size
+            self.Texture = Texture
+            self.surface = pygame.Surface(self.size).convert()
+            self.frame = Texture(self.renderer, self.size, streaming=True)
+            self.overlay = pygame.Surface(self.size, pygame.SRCALPHA).convert_alpha()
+            self.overlay.fill((0, 0, 0, 0))
+            self.overlay_texture = Texture(self.renderer, self.size, streaming=True)
+            self.overlay_texture.blend_mode = 1  # SDL_BLENDMODE_BLEND
+
+    @property
+    def textured(self):
+        return self.backend == "texture"
+
+    def upload(self, surfaces):
+        """Make textures of sprite surfaces that never change, for the texture backend"""
+        if self.textured:
+            for surface in surfaces:
+                if surface not in self.textures:
+                    self.textures[surface] = self.Texture.from_surface(self.renderer, surface)
+
+    def queue(self, image, dest, area=None):
+        """Draw an uploaded sprite over the surface at present(); returns its rect"""
+        rect = pygame.Rect(dest[0], dest[1], *(area.size if area is not None else image.get_size()))
+        self.sprites.append((self.textures[image], area, rect))
+        return rect
+
+    def begin(self):
+        """Clear the overlay of what was drawn on it last frame"""
+        if self.overlay_rect is not None:
+            self.overlay.fill((0, 0, 0, 0), self.overlay_rect)
+            self.overlay_rect = None
+
+    def draw_over(self, image, dest, area=None):
+        """Blit onto the overlay, above the queued sprites; returns the rect"""
+        rect = self.overlay.blit(image, dest, area)
+        self.overlay_rect = rect if self.overlay_rect is None else self.overlay_rect.union(rect)
+        return rect
+
+    def present(self, rects=None):
+        """Show the frame; rects limits a window update to those areas"""
+        started = time.perf_counter()
+        if self.textured:
+            renderer = self.renderer
+            self.frame.update(self.surface)
+            renderer.draw_color = (0, 0, 0, 255)
+            renderer.clear()
+            self.frame.draw()
+            for texture, area, rect in self.sprites:
+                texture.draw(area, rect)
+            self.sprites.clear()
+            # Only the part of the overlay in use is uploaded and blended
+            rect = self.overlay_rect
+            if rect is not None:
+                rect = rect.clip(self.overlay.get_rect())
+                if rect:
+                    self.overlay_texture.update(self.overlay.subsurface(rect), rect)
+                    self.overlay_texture.draw(rect, rect)
+            renderer.present()
+        elif rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+        self.last_present = time.perf_counter() - started
+        self.present_seconds += self.last_present
+        self.presents += 1
+
+    def mouse_pos(self):
+        """Mouse position in internal-resolution pixels"""
+        x, y = pygame.mouse.get_pos()
+        if not self.textured:
+            return x, y
+        # Undo the letterboxed scaling SDL's logical size applies
+        width, height = self.window.size
+        scale = min(width / self.size[0], height / self.size[1])
+        left = (width - self.size[0] * scale) / 2
+        top = (height - self.size[1] * scale) / 2
+        return int((x - left) / scale), int((y - top) / scale)
+
+_display = None
+
+def open_display(backend=DISPLAY_BACKEND, **options):
+    """Open the game window; returns the surface to draw on"""
+    global _display
+    _display = Display(backend, **options)
+    return _display.surface
+
+def get_display():
+    """The open Display, or None when nothing opened one (benchmarks, headless runs)"""
+    return _display
+
+def close_display():
+    global _display
+    _display = None
+
+def present(rects=None):
+    """Show the frame through the open Display, or flip the display module's window"""
+    if _display is not None:
+        _display.present(rects)
+    elif rects is None:
+        pygame.display.flip()
+    else:
+        pygame.display.update(rects)
+
+def get_mouse_pos():
+    return _display.mouse_pos() if _display is not None else pygame.mouse.get_pos()
+
+def upload(surfaces):
+    if _display is not None:
+        _display.upload(surfaces)
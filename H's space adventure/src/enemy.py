@@ -1,16 +1,18 @@
 import pygame
 import random
 from settings import ENEMY_SPEED
+from projectiles import Straight
 
 class Enemy(pygame.sprite.Sprite):
-    def __init__(self, x, y, image):
+    def __init__(self, x, y, image, rng=random, projectiles=None, emitter=None):
         super().__init__()
         self.image = image
         self.rect = self.image.get_rect(center=(x, y))
         self.speed_y = ENEMY_SPEED
-        self.speed_x = random.choice([-2, 2])  # Move left or right randomly
-        self.shoot_delay = random.randint(60, 120)  # frames between shots
-        self.shoot_timer = 0
+        self.speed_x = rng.choice([-2, 2])  # Move left or right randomly
+        self.shoot_delay = rng.randint(60, 120)  # ticks between shots, timed by World
+        self.projectiles = projectiles  # ProjectilePool the shots go into; None never shoots
+        self.emitter = emitter or Straight()
 
     def update(self):
         # Move enemy
@@ -21,17 +23,10 @@ class Enemy(pygame.sprite.Sprite):
         if self.rect.left <= 0 or self.rect.right >= 800:  # Assuming screen width = 800
             self.speed_x *= -1
 
-        # Shoot timer
-        self.shoot_timer += 1
-        if self.shoot_timer >= self.shoot_delay:
-            self.shoot()
-            self.shoot_timer = 0
-
         # Remove enemy if off screen
         if self.rect.top > 600:  # Assuming screen height = 600
             self.kill()
 
     def shoot(self):
-        from enemy_bullet import EnemyBullet  # Avoid circular import
-        bullet = EnemyBullet(self.rect.centerx, self.rect.bottom)
-        self.groups()[0].add(bullet)  # Add to same group
+        if self.projectiles is not None:
+            self.emitter.fire(self.projectiles, self.rect.centerx, self.rect.bottom)
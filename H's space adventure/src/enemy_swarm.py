@@ -0,0 +1,142 @@
+# src/enemy_swarm.py
+
+import random
+
+import numpy as np
+
+from settings import ENEMY_SPEED, SCREEN_WIDTH
+from masks import mask_for, mask_hits
+
+class EnemySwarm:
+    """Struct-of-arrays enemy store, the NumPy alternative to one Enemy sprite each.
+
+    Positions, velocities, shot delays and alive flags live in parallel arrays
+    and the whole swarm moves in a handful of vectorized operations per tick.
+    Dead slots go on a free list and are reused by the next spawn; a slot's
+    generation counts its spawns, so timers scheduled for an enemy that has
+    since died can tell. Behaviour mirrors Enemy.update: bounce off the side
+    walls and despawn below y=600. World fires the shots off its timing wheel.
+    """
+
+    def __init__(self, image, rng=random, capacity=256):
+        self.image = image
+        self.rng = rng
+        self.width, self.height = image.get_size()
+        self.speed_y = ENEMY_SPEED
+        self.size = 0  # high-water mark: every live slot is below it
+        self.free = []
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        old = self.size
+        def grow(array, dtype):
+            new = np.zeros(capacity, dtype=dtype)
+            if array is not None:
+                new[:old] = array[:old]
+            return new
+        self.x = grow(getattr(self, "x", None), np.int32)
+        self.y = grow(getattr(self, "y", None), np.int32)
+        self.prev_x = grow(getattr(self, "prev_x", None), np.int32)
+        self.prev_y = grow(getattr(self, "prev_y", None), np.int32)
+        self.vx = grow(getattr(self, "vx", None), np.int32)
+        self.vy = grow(getattr(self, "vy", None), np.int32)
+        self.generation = grow(getattr(self, "generation", None), np.int32)
+        self.shoot_delay = grow(getattr(self, "shoot_delay", None), np.int32)
+        self.alive = grow(getattr(self, "alive", None), np.bool_)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.size - len(self.free)
+
+    def spawn(self, x, y, speed=None):
+        """Add one enemy centred on (x, y); draws from rng in the same order as Enemy"""
+        if self.free:
+            i = self.free.pop()
+        else:
+            if self.size == self.capacity:
+                self._allocate(self.capacity * 2)
+            i = self.size
+            self.size += 1
+        self.x[i] = self.prev_x[i] = x - self.width // 2
+        self.y[i] = self.prev_y[i] = y - self.height // 2
+        self.vx[i] = self.rng.choice([-2, 2])
+        self.vy[i] = self.speed_y if speed is None else speed
+        self.shoot_delay[i] = self.rng.randint(60, 120)
+        self.generation[i] += 1
+        self.alive[i] = True
+        return i
+
+    def update(self):
+        """Move the swarm one tick"""
+        n = self.size
+        if not n:
+            return
+        alive = self.alive[:n]
+        x, y, vx = self.x[:n], self.y[:n], self.vx[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        x += vx
+        y += self.vy[:n]
+        vx[(x <= 0) | (x + self.width >= SCREEN_WIDTH)] *= -1
+        self.kill(np.flatnonzero(alive & (y > 600)))
+
+    def kill(self, indices):
+        """Free the given slots and trim dead slots off the end of the arrays"""
+        if not len(indices):
+            return
+        self.alive[indices] = False
+        self.free.extend(int(i) for i in indices)
+        size = self.size
+        while size and not self.alive[size - 1]:
+            size -= 1
+        if size != self.size:
+            self.size = size
+            self.free = [i for i in self.free if i < size]
+
+    def collide_rect(self, rect, mask=None):
+        """Indices of live enemies whose rect overlaps rect, in slot order.
+
+        Given mask, the mask of the image drawn at rect, only enemies whose
+        opaque pixels touch it are returned.
+        """
+        n = self.size
+        if not n:
+            return []
+        x, y = self.x[:n], self.y[:n]
+        hit = (self.alive[:n] & (x < rect.right) & (x + self.width > rect.left)
+               & (y < rect.bottom) & (y + self.height > rect.top))
+        candidates = np.flatnonzero(hit).tolist()
+        if mask is None or not candidates:
+            return candidates
+        touching = mask_hits(mask, rect.left, rect.top, mask_for(self.image),
+                             x[candidates].tolist(), y[candidates].tolist())
+        return [i for i, touch in zip(candidates, touching) if touch]
+
+    def centers(self):
+        live = np.flatnonzero(self.alive[:self.size])
+        xs = (self.x[live] + self.width // 2).tolist()
+        ys = (self.y[live] + self.height // 2).tolist()
+        return list(zip(xs, ys))
+
+    def center(self, i):
+        return int(self.x[i]) + self.width // 2, int(self.y[i]) + self.height // 2
+
+    def muzzle(self, i):
+        """Where enemy i's shots start, matching Enemy.shoot (centerx, bottom)"""
+        return int(self.x[i]) + self.width // 2, int(self.y[i]) + self.height
+
+    def positions(self, alpha=1.0):
+        """Top-left x and y lists of every live enemy, alpha of the way from its previous position"""
+        live = np.flatnonzero(self.alive[:self.size])
+        x, y = self.x[live], self.y[live]
+        if alpha < 1.0:
+            px, py = self.prev_x[live], self.prev_y[live]
+            x = np.rint(px + (x - px) * alpha).astype(np.int32)
+            y = np.rint(py + (y - py) * alpha).astype(np.int32)
+        return x.tolist(), y.tolist()
+
+    def draw(self, surface, alpha=1.0):
+        """Blit every live enemy"""
+        xs, ys = self.positions(alpha)
+        image = self.image
+        surface.blits([(image, pos) for pos in zip(xs, ys)], False)
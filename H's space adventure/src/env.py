@@ -0,0 +1,184 @@
+# src/env.py
+#
+# Reinforcement-learning wrappers around World with a Gym-style interface:
+#   obs, info = env.reset(seed)
+#   obs, reward, terminated, truncated, info = env.step(action)
+# An action is the input bitmask from inputs.py (0-31: arrow keys plus fire).
+# Needs numpy; runs headless under the SDL dummy video driver.
+
+import random
+
+import numpy as np
+import pygame
+
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK
+from world import World, create_headless_world
+
+N_ACTIONS = 32
+STATE_ENEMIES = 8  # nearest enemies/shots included in the state vector
+STATE_SIZE = 4 + 3 * STATE_ENEMIES
+
+class SpaceShooterEnv:
+    """One game as an environment.
+
+    obs="state" gives a float32 vector: player x and y, health and time left
+    (all scaled to 0..1), then (dx, dy, present) for the STATE_ENEMIES nearest
+    enemies and enemy shots, offsets scaled by the screen size.
+
+    obs="pixels" gives a uint8 (width, height, 3) array that is a
+    pygame.surfarray.pixels3d view of a small render target, so reading it
+    copies nothing. The same array is updated in place every step; copy it
+    if you need to keep a frame. Note surfarray's x-major axis order.
+
+    Reward is 1 per enemy kill scoring (100 points) and -1 per hit taken.
+    frame_skip repeats each action for that many ticks.
+    """
+
+    def __init__(self, obs="state", seed=None, max_ticks=36000, frame_skip=1, obs_size=(84, 84),
+                 enemy_backend="sprites", overrides=None):
+        if obs not in ("state", "pixels"):
+            raise ValueError("obs must be 'state' or 'pixels'")
+        self.obs_type = obs
+        self.max_ticks = max_ticks
+        self.frame_skip = frame_skip
+        self.enemy_backend = enemy_backend
+        self.overrides = overrides
+        self.rng = random.Random(seed)
+        self.world = create_headless_world(self.rng.getrandbits(32), enemy_backend, overrides)
+        self.images = (self.world.player.image, self.world.bullet_img, self.world.enemy_img, self.world.explosion_frames)
+        self.episode_return = 0.0
+
+        if obs == "pixels":
+            self.canvas = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.target = pygame.Surface(obs_size)
+            self.pixels = pygame.surfarray.pixels3d(self.target)  # keeps target locked; only scale() writes to it
+            self.observation_shape = self.pixels.shape
+            self.observation_dtype = np.uint8
+        else:
+            self.state = np.zeros(STATE_SIZE, dtype=np.float32)
+            self.observation_shape = self.state.shape
+            self.observation_dtype = np.float32
+
+    def reset(self, seed=None, out=None):
+        """Start a new episode; seed defaults to the next one from the env's own RNG"""
+        if seed is None:
+            seed = self.rng.getrandbits(32)
+        self.world = World(*self.images, seed=seed, enemy_backend=self.enemy_backend, overrides=self.overrides)
+        self.episode_return = 0.0
+        return self.observe(out), {"seed": seed}
+
+    def step(self, action, out=None):
+        world = self.world
+        score, damage = world.score, world.damage_taken
+        for _ in range(self.frame_skip):
+            world.step(action)
+            if world.game_over:
+                break
+        reward = (world.score - score) / 100 - (world.damage_taken - damage)
+        self.episode_return += reward
+        terminated = world.game_over
+        truncated = not terminated and world.tick >= self.max_ticks
+        info = {"score": world.score, "tick": world.tick}
+        return self.observe(out), reward, terminated, truncated, info
+
+    def observe(self, out=None):
+        """The current observation, written into out when given (VecEnv passes a row of its buffer)"""
+        if self.obs_type == "pixels":
+            self.canvas.fill(BLACK)
+            self.world.draw(self.canvas)
+            pygame.transform.scale(self.canvas, self.target.get_size(), self.target)
+            if out is not None:
+                out[...] = self.pixels
+                return out
+            return self.pixels
+        state = self.state if out is None else out
+        self._fill_state(state)
+        return state
+
+    def _fill_state(self, state):
+        world = self.world
+        px, py = world.player.rect.center
+        state.fill(0.0)
+        state[0] = px / SCREEN_WIDTH
+        state[1] = py / SCREEN_HEIGHT
+        state[2] = world.health / world.max_health
+        state[3] = 1.0 - world.tick / self.max_ticks
+        centers = world.enemy_centers()
+        if not centers:
+            return
+        offsets = np.array(centers, dtype=np.float32)
+        offsets[:, 0] -= px
+        offsets[:, 1] -= py
+        nearest = offsets
+        if len(offsets) > STATE_ENEMIES:
+            distance = offsets[:, 0] ** 2 + offsets[:, 1] ** 2
+            nearest = offsets[np.argpartition(distance, STATE_ENEMIES)[:STATE_ENEMIES]]
+        enemies = state[4:].reshape(STATE_ENEMIES, 3)
+        count = len(nearest)
+        enemies[:count, 0] = nearest[:, 0] / SCREEN_WIDTH
+        enemies[:count, 1] = nearest[:, 1] / SCREEN_HEIGHT
+        enemies[:count, 2] = 1.0
+
+class VecEnv:
+    """n SpaceShooterEnvs stepped in lockstep in this process.
+
+    step(actions) takes n actions and returns stacked arrays: observations
+    (n, *obs_shape), rewards, terminated and truncated flags (n,), plus a list
+    of info dicts. Observations are written straight into one preallocated
+    buffer that is reused every step. Envs that finish are reset on the spot;
+    their info carries the finished episode's "final_score" and
+    "episode_return", and their row holds the new episode's first observation.
+    """
+
+    def __init__(self, n, obs="state", seed=0, **kwargs):
+        self.envs = [SpaceShooterEnv(obs, seed=seed + i, **kwargs) for i in range(n)]
+        first = self.envs[0]
+        self.observations = np.zeros((n,) + first.observation_shape, dtype=first.observation_dtype)
+        self.rewards = np.zeros(n, dtype=np.float32)
+        self.terminated = np.zeros(n, dtype=np.bool_)
+        self.truncated = np.zeros(n, dtype=np.bool_)
+
+    def __len__(self):
+        return len(self.envs)
+
+    def reset(self):
+        for i, env in enumerate(self.envs):
+            env.reset(out=self.observations[i])
+        return self.observations
+
+    def step(self, actions):
+        observations = self.observations
+        infos = []
+        for i, (env, action) in enumerate(zip(self.envs, actions)):
+            _, reward, terminated, truncated, info = env.step(int(action), out=observations[i])
+            if terminated or truncated:
+                info["final_score"] = env.world.score
+                info["episode_return"] = env.episode_return
+                env.reset(out=observations[i])
+            self.rewards[i] = reward
+            self.terminated[i] = terminated
+            self.truncated[i] = truncated
+            infos.append(info)
+        return observations, self.rewards, self.terminated, self.truncated, infos
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    parser = argparse.ArgumentParser(description="Measure env-steps/sec with random actions")
+    parser.add_argument("--envs", type=int, default=8)
+    parser.add_argument("--obs", choices=["state", "pixels"], default="state")
+    parser.add_argument("--steps", type=int, default=2000, help="vector steps")
+    parser.add_argument("--frame-skip", type=int, default=1)
+    args = parser.parse_args()
+
+    vec = VecEnv(args.envs, args.obs, frame_skip=args.frame_skip)
+    vec.reset()
+    rng = np.random.default_rng(0)
+    episodes = 0
+    started = time.perf_counter()
+    for _ in range(args.steps):
+        _, _, terminated, truncated, _ = vec.step(rng.integers(0, N_ACTIONS, len(vec)))
+        episodes += int(terminated.sum() + truncated.sum())
+    elapsed = time.perf_counter() - started
+    print(f"{args.envs} envs x {args.steps} steps ({args.obs}): "
+          f"{args.envs * args.steps / elapsed:.0f} env-steps/sec, {episodes} episodes finished")
@@ -1,21 +1,20 @@
 import pygame
 
 class Explosion(pygame.sprite.Sprite):
-    def __init__(self, x, y, frames):
+    def __init__(self, x, y, frames, timers):
         super().__init__()
         self.frames = frames
         self.index = 0
         self.image = self.frames[self.index]
         self.rect = self.image.get_rect(center=(x, y))
-        self.animation_speed = 0.2
-        self.timer = 0
+        self.frame_ticks = 5  # ticks each frame shows for
+        self.timers = timers  # TimingWheel that advances the frames
+        timers.after(self.frame_ticks, self.next_frame)
 
-    def update(self):
-        self.timer += self.animation_speed
-        if self.timer >= 1:
-            self.timer = 0
-            self.index += 1
-            if self.index < len(self.frames):
-                self.image = self.frames[self.index]
-            else:
-                self.kill()  # Destroy the explosion sprite after animation finishes
+    def next_frame(self):
+        self.index += 1
+        if self.index < len(self.frames):
+            self.image = self.frames[self.index]
+            self.timers.after(self.frame_ticks, self.next_frame)
+        else:
+            self.kill()  # Destroy the explosion sprite after animation finishes
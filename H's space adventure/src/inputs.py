@@ -0,0 +1,25 @@
+# src/inputs.py
+
+import pygame
+
+# One bit per control, so the input for a whole tick fits in a byte
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_UP = 4
+INPUT_DOWN = 8
+INPUT_FIRE = 16
+
+def read_keys(keys, fire=False):
+    """Pack the arrow keys from pygame.key.get_pressed() plus a fire flag into a bitmask"""
+    inputs = 0
+    if keys[pygame.K_LEFT]:
+        inputs |= INPUT_LEFT
+    if keys[pygame.K_RIGHT]:
+        inputs |= INPUT_RIGHT
+    if keys[pygame.K_UP]:
+        inputs |= INPUT_UP
+    if keys[pygame.K_DOWN]:
+        inputs |= INPUT_DOWN
+    if fire:
+        inputs |= INPUT_FIRE
+    return inputs
@@ -0,0 +1,205 @@
+# src/leaderboard.py
+
+import json
+import os
+import queue
+import threading
+import time
+
+from settings import SCORES_DIR, LEADERBOARD_SIZE, SCORE_FLUSH_INTERVAL
+
+LOG_NAME = "scores.log"
+INDEX_NAME = "top.json"
+
+class Leaderboard:
+    """High scores kept across runs: an append-only log of every game plus a top-N index.
+
+    scores.log gets one JSON line per finished game and is never rewritten.
+    top.json holds the best LEADERBOARD_SIZE entries and how many bytes of the
+    log they cover, so startup reads the index (plus any log tail a crash
+    left unindexed) and never the whole history.
+
+    submit() only updates the in-memory table and queues the record; a
+    background thread appends whatever has queued up in one write, fsyncs
+    once per batch and at most every flush_interval seconds, then replaces
+    the index atomically. Call close() before exiting to flush the queue.
+    """
+
+    def __init__(self, directory=SCORES_DIR, size=LEADERBOARD_SIZE, flush_interval=SCORE_FLUSH_INTERVAL):
+        self.directory = directory
+        self.log_path = os.path.join(directory, LOG_NAME)
+        self.index_path = os.path.join(directory, INDEX_NAME)
+        self.size = size
+        self.flush_interval = flush_interval
+        self.top = []
+        self.durable = []  # the table as of what is in the log; only this goes in the index
+        self.log_size = 0
+        self.lock = threading.Lock()
+        self.queue = queue.Queue()
+        self.thread = None
+        self.batches = 0
+        self.fsyncs = 0
+        self._load()
+
+    @property
+    def high_score(self):
+        with self.lock:
+            return self.top[0]["score"] if self.top else 0
+
+    def entries(self):
+        with self.lock:
+            return list(self.top)
+
+    def submit(self, score, **info):
+        """Record a finished game; returns its 1-based rank, or None if it missed the table"""
+        record = {"time": round(time.time(), 3), "score": score, **info}
+        with self.lock:
+            rank = insert(self.top, record, self.size)
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._writer, name="leaderboard-writer", daemon=True)
+            self.thread.start()
+        self.queue.put(record)
+        return rank
+
+    def flush(self):
+        """Block until everything submitted so far is on disk"""
+        if self.thread is not None:
+            self.queue.join()
+
+    def close(self):
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+    def _load(self):
+        try:
+            with open(self.index_path) as f:
+                index = json.load(f)
+            self.top = index["top"][:self.size]
+            self.log_size = index["log_size"]
+        except (OSError, ValueError, KeyError):
+            self.top, self.log_size = [], 0  # no usable index: rebuild it from the log below
+        self.durable = list(self.top)
+        try:
+            actual = os.path.getsize(self.log_path)
+        except OSError:
+            return
+        if actual < self.log_size:  # log replaced or truncated behind the index's back
+            self.top, self.log_size = [], 0
+        if actual > self.log_size:
+            with open(self.log_path, "rb") as f:
+                f.seek(self.log_size)
+                tail = f.read()
+            complete = tail.rfind(b"\n") + 1
+            for line in tail[:complete].splitlines():
+                try:
+                    insert(self.top, json.loads(line), self.size)
+                except ValueError:
+                    pass
+            if complete < len(tail):
+                # A crash tore the last line mid-write; drop it so appends start on a fresh line
+                with open(self.log_path, "r+b") as f:
+                    f.truncate(self.log_size + complete)
+            self.log_size += complete
+        self.durable = list(self.top)
+
+    def _writer(self):
+        last_sync = 0.0
+        done = False
+        while not done:
+            batch = [self.queue.get()]
+            # Coalesce: take whatever else is queued, waiting out the rest of
+            # the flush interval so a burst of games costs one fsync
+            deadline = last_sync + self.flush_interval
+            while True:
+                try:
+                    batch.append(self.queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            records = [r for r in batch if r is not None]
+            done = len(records) != len(batch)
+            try:
+                if records:
+                    self._write(records)
+                    last_sync = time.monotonic()
+            except OSError as e:
+                print(f"Could not save scores: {e}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    def _write(self, records):
+        os.makedirs(self.directory, exist_ok=True)
+        data = "".join(json.dumps(r) + "\n" for r in records).encode()
+        with open(self.log_path, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            log_size = f.tell()
+        for record in records:
+            insert(self.durable, record, self.size)
+        index = {"log_size": log_size, "top": self.durable}
+        temp = self.index_path + ".tmp"
+        with open(temp, "w") as f:
+            json.dump(index, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, self.index_path)
+        self.log_size = log_size
+        self.batches += 1
+        self.fsyncs += 2
+
+def insert(table, record, size):
+    """Put record into a best-first table of at most size entries; returns its rank or None"""
+    i = len(table)
+    while i and table[i - 1]["score"] < record["score"]:  # ties keep the earlier game ahead
+        i -= 1
+    if i >= size:
+        return None
+    table.insert(i, record)
+    del table[size:]
+    return i + 1
+
+_leaderboard = None
+
+def get_leaderboard():
+    """The process-wide leaderboard, loaded on first use"""
+    global _leaderboard
+    if _leaderboard is None:
+        _leaderboard = Leaderboard()
+    return _leaderboard
+
+def close_leaderboard():
+    """Flush the process-wide leaderboard, if anything has used it"""
+    if _leaderboard is not None:
+        _leaderboard.close()
+
+if __name__ == "__main__":
+    import argparse
+    import random
+    parser = argparse.ArgumentParser(description="Show the leaderboard, or time submits against a scratch one")
+    parser.add_argument("--dir", default=SCORES_DIR)
+    parser.add_argument("--bench", type=int, metavar="N", help="submit N random scores to a leaderboard in --dir")
+    args = parser.parse_args()
+
+    if args.bench:
+        board = Leaderboard(args.dir)
+        rng = random.Random(0)
+        worst = 0.0
+        started = time.perf_counter()
+        for i in range(args.bench):
+            t0 = time.perf_counter()
+            board.submit(rng.randint(0, 100) * 100, ticks=rng.randint(60, 36000), seed=i)
+            worst = max(worst, time.perf_counter() - t0)
+        submitted = time.perf_counter() - started
+        board.close()
+        total = time.perf_counter() - started
+        print(f"{args.bench} submits: {submitted / args.bench * 1e6:.1f} us each, worst {worst * 1e6:.0f} us; "
+              f"on disk after {total:.2f}s in {board.batches} batches ({board.fsyncs} fsyncs)")
+        started = time.perf_counter()
+        Leaderboard(args.dir)
+        print(f"reload from index: {(time.perf_counter() - started) * 1000:.2f} ms")
+    else:
+        for rank, entry in enumerate(Leaderboard(args.dir).entries(), 1):
+            print(f"{rank:3}. {entry['score']:8}  {time.strftime('%Y-%m-%d %H:%M', time.localtime(entry['time']))}")
@@ -1,50 +1,17 @@
 import pygame
 import sys
-import random
+import os
+import time
 
 from settings import *
-from utils import load_image, load_sound
-from player import Player
-from bullet import Bullet
-from enemy import Enemy
-
-# Star class for animated background
-class Star:
-    def __init__(self):
-        self.x = random.randint(0, SCREEN_WIDTH)
-        self.y = random.randint(0, SCREEN_HEIGHT)
-        self.speed = random.uniform(0.5, 2)
-        self.size = random.randint(1, 3)
-
-    def update(self):
-        self.y += self.speed
-        if self.y > SCREEN_HEIGHT:
-            self.y = 0
-            self.x = random.randint(0, SCREEN_WIDTH)
-
-    def draw(self, surface):
-        pygame.draw.circle(surface, (255, 255, 255), (int(self.x), int(self.y)), self.size)
-
-# Explosion class for handling explosion animations
-class Explosion(pygame.sprite.Sprite):
-    def __init__(self, x, y, frames, scale=1.0, speed=5):
-        super().__init__()
-        self.frames = [pygame.transform.scale(frame, (int(frame.get_width()*scale), int(frame.get_height()*scale))) for frame in frames]
-        self.index = 0
-        self.image = self.frames[self.index]
-        self.rect = self.image.get_rect(center=(x, y))
-        self.speed = speed
-        self.timer = 0
-
-    def update(self):
-        self.timer += 1
-        if self.timer >= self.speed:
-            self.index += 1
-            self.timer = 0
-            if self.index >= len(self.frames):
-                self.kill()
-            else:
-                self.image = self.frames[self.index]
+from assets import assets
+from starfield import get_starfield
+from renderer import Renderer
+from text_cache import render_text, GlyphAtlas
+from profiler import profiler
+from leaderboard import get_leaderboard, close_leaderboard
+from scenes import Scene, SceneManager, Flash
+from display import open_display, get_mouse_pos, upload, BACKENDS
 
 # UI Button
 class Button:
@@ -54,13 +21,13 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.is_hovered = False
-        self.font = pygame.font.Font(None, 36)
+        self.font = assets.font(None, 36)
 
     def draw(self, surface):
         color = self.hover_color if self.is_hovered else self.color
         pygame.draw.rect(surface, color, self.rect, border_radius=10)
         pygame.draw.rect(surface, (255, 255, 255), self.rect, 2, border_radius=10)
-        text_surface = self.font.render(self.text, True, (255, 255, 255))
+        text_surface = render_text(self.font, self.text, True, (255, 255, 255))
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
 
@@ -71,15 +38,27 @@ class Button:
     def is_clicked(self, pos, event):
         return event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.rect.collidepoint(pos)
 
+def update_hover(buttons):
+    """Recheck which buttons the mouse is over; True if any of them changed"""
+    pos = get_mouse_pos()
+    changed = False
+    for button in buttons:
+        was_hovered = button.is_hovered
+        changed |= button.check_hover(pos) != was_hovered
+    return changed
+
 # Game Menu
-class Menu:
+class Menu(Scene):
+    fps = MENU_FPS
+    idle_fps = IDLE_FPS
+
     def __init__(self, screen):
+        super().__init__()
         self.screen = screen
-        self.clock = pygame.time.Clock()
         self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.background.fill((5, 5, 20))
         
-        self.title_font = pygame.font.Font("assets/font/ARCADE_R.TTF", 28)
+        self.title_font = assets.font("assets/font/ARCADE_R.TTF", 28)
         self.title_text = self.title_font.render("2100: Space Adventure", True, (255, 255, 255))
         self.title_rect = self.title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4))
 
@@ -88,192 +67,476 @@ class Menu:
         x_center = SCREEN_WIDTH // 2 - button_width // 2
         self.start_button = Button(x_center, SCREEN_HEIGHT // 2, button_width, button_height, "Start Game", (0, 100, 0), (0, 150, 0))
         self.quit_button = Button(x_center, SCREEN_HEIGHT // 2 + 70, button_width, button_height, "Quit", (100, 0, 0), (150, 0, 0))
-        self.stars = [Star() for _ in range(100)]
-
-    def run(self):
-        while True:
-            mouse_pos = pygame.mouse.get_pos()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "quit"
-                if self.start_button.is_clicked(mouse_pos, event):
-                    return "story"  # Start Story Screen first before game
-                if self.quit_button.is_clicked(mouse_pos, event):
-                    return "quit"
-
-            for star in self.stars:
-                star.update()
-            self.start_button.check_hover(mouse_pos)
-            self.quit_button.check_hover(mouse_pos)
-
-            self.screen.blit(self.background, (0, 0))
-            for star in self.stars:
-                star.draw(self.screen)
-            self.screen.blit(self.title_text, self.title_rect)
-            self.start_button.draw(self.screen)
-            self.quit_button.draw(self.screen)
-
-            pygame.display.flip()
-            self.clock.tick(FPS)
-
-class GameOverScreen:
+        self.renderer = Renderer(screen, self.background, get_starfield())
+        self.seconds = None
+
+    def enter(self):
+        super().enter()
+        self.renderer.invalidate()
+        update_hover((self.start_button, self.quit_button))
+
+    def handle(self, event):
+        mouse_pos = get_mouse_pos()
+        if self.start_button.is_clicked(mouse_pos, event):
+            self.manager.push(StoryScreen(self.screen))  # Start Story Screen first before game
+        elif self.quit_button.is_clicked(mouse_pos, event):
+            self.manager.quit("quit")
+        elif event.type == pygame.MOUSEMOTION and update_hover((self.start_button, self.quit_button)):
+            self.redraw = True
+
+    def update(self, seconds):
+        self.seconds = seconds
+
+    def draw(self):
+        renderer = self.renderer
+        renderer.begin(self.seconds)
+        renderer.blit(self.title_text, self.title_rect)
+        for button in (self.start_button, self.quit_button):
+            button.draw(renderer.surface)
+            renderer.mark(button.rect)
+
+        renderer.present()
+
+class GameOverScreen(Scene):
+    # Nothing moves here, so it is only redrawn when the mouse changes a button
+    fps = None
+
     def __init__(self, screen, score, high_score):
+        super().__init__()
         self.screen = screen
         self.score = score
         self.high_score = high_score
-        self.font = pygame.font.Font("assets/font/ARCADE_R.TTF", 32)
-        self.small_font = pygame.font.Font(None, 24)
-        self.clock = pygame.time.Clock()
+        self.font = assets.font("assets/font/ARCADE_R.TTF", 32)
+        self.small_font = assets.font(None, 24)
         self.restart_button = Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 50, 200, 50, "Play Again", (0, 0, 128), (0, 0, 180))
         self.menu_button = Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 120, 200, 50, "Main Menu", (100, 0, 0), (150, 0, 0))
+        self.renderer = Renderer(screen, (0, 0, 0))
+
+    def enter(self):
+        super().enter()
+        self.renderer.invalidate()
+        update_hover((self.restart_button, self.menu_button))
+
+    def handle(self, event):
+        mouse_pos = get_mouse_pos()
+        if self.restart_button.is_clicked(mouse_pos, event):
+            self.manager.switch(new_game(self.screen))
+        elif self.menu_button.is_clicked(mouse_pos, event):
+            self.manager.pop()  # back to the menu underneath
+        elif event.type == pygame.MOUSEMOTION and update_hover((self.restart_button, self.menu_button)):
+            self.redraw = True
+
+    def draw(self):
+        renderer = self.renderer
+        renderer.begin()
+        game_over_text = render_text(self.font, "YOU DIED", True, (255, 0, 0))
+        score_text = render_text(self.small_font, f"Your Score: {self.score}", True, (255, 255, 255))
+        high_score_text = render_text(self.small_font, f"High Score: {self.high_score}", True, (255, 255, 100))
+
+        renderer.blit(game_over_text, game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 60)))
+        renderer.blit(score_text, score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 20)))
+        renderer.blit(high_score_text, high_score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 10)))
+        for button in (self.restart_button, self.menu_button):
+            button.draw(renderer.surface)
+            renderer.mark(button.rect)
+
+        renderer.present()
+
+def save_replay(recorder, world):
+    from replay import replay_path
+    if recorder is not None and recorder.ticks:
+        recorder.save(replay_path(REPLAY_DIR, world.seed), world)
+
+# The game itself: a thin renderer over World, which owns all the game rules
+class GameScene(Scene):
+    fps = RENDER_FPS
+    idle_fps = RENDER_FPS
 
-    def run(self):
-        while True:
-            mouse_pos = pygame.mouse.get_pos()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "quit"
-                if self.restart_button.is_clicked(mouse_pos, event):
-                    return "game"
-                if self.menu_button.is_clicked(mouse_pos, event):
-                    return "menu"
-
-            self.restart_button.check_hover(mouse_pos)
-            self.menu_button.check_hover(mouse_pos)
-
-            self.screen.fill((0, 0, 0))
-            game_over_text = self.font.render("YOU DIED", True, (255, 0, 0))
-            score_text = self.small_font.render(f"Your Score: {self.score}", True, (255, 255, 255))
-            high_score_text = self.small_font.render(f"High Score: {self.high_score}", True, (255, 255, 100))
-
-            self.screen.blit(game_over_text, game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 60)))
-            self.screen.blit(score_text, score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 20)))
-            self.screen.blit(high_score_text, high_score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 10)))
-            self.restart_button.draw(self.screen)
-            self.menu_button.draw(self.screen)
-
-            pygame.display.flip()
-            self.clock.tick(FPS)
-
-# Flash screen animation before Game Over
-def flash_screen(screen, duration=400):
-    flash_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    flash_surface.fill((255, 255, 255))
-    start_time = pygame.time.get_ticks()
-    while pygame.time.get_ticks() - start_time < duration:
-        screen.blit(flash_surface, (0, 0))
-        pygame.display.flip()
-#Main game loop
-def game_loop(screen):
-    clock = pygame.time.Clock()
-    stars = [Star() for _ in range(50)]
-    bg_color = (5, 5, 20)
-
-    try:
-        player_img = load_image("assets/images/player.png")
-        bullet_img = load_image("assets/images/bullet.png")
-        enemy_img = load_image("assets/images/enemy.png")
-        shoot_sound = load_sound("assets/sounds/shoot.wav")
-        explosion_sound = load_sound("assets/sounds/explosion.wav")
-        pygame.mixer.music.load("assets/sounds/background_music.mp3")
-        pygame.mixer.music.play(-1 )
-    except Exception as e:
-        print(f"Error loading assets: {e}")
-        return "menu"
-
-    player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50, player_img)
-    player_group = pygame.sprite.Group(player)
-    bullets = pygame.sprite.Group()
-    enemies = pygame.sprite.Group()
-    explosions = pygame.sprite.Group()
-
-    try:
-        explosion_sheet = load_image("assets/images/explosion.png")
-        frame_w, frame_h = 64, 64
-        frames = [explosion_sheet.subsurface(pygame.Rect(i * frame_w, 0, frame_w, frame_h)) for i in range(explosion_sheet.get_width() // frame_w)]
-    except Exception as e:
-        print(f"Failed to load explosion frames: {e}")
-        return "menu"
-
-    score = 0
-    health = 10
-    if not hasattr(game_loop, "high_score"):
-        game_loop.high_score = 0
-    font = pygame.font.Font(None, 30)
-    enemy_spawn_timer = 0
-
-    while True:
-        clock.tick(FPS)
+    def __init__(self, screen):
+        super().__init__()
+        # Gameplay modules are imported here rather than at startup, so the menu
+        # comes up without waiting for them
+        from inputs import read_keys
+        from world import World, load_images, sprite_images
+        from timestep import FixedTimestep
+        from replay import ReplayRecorder
+        from voices import VoiceManager
+        self.screen = screen
+        self.read_keys = read_keys
+        self.renderer = Renderer(screen, (5, 5, 20), get_starfield())
+        self.world = None
+
+        try:
+            player_img, bullet_img, enemy_img, frames = load_images()
+            self.voices = VoiceManager()
+            assets.music("assets/sounds/background_music.mp3")
+            pygame.mixer.music.play(-1 )
+        except Exception as e:
+            print(f"Error loading assets: {e}")
+            return
+
+        # The atlas covers the loaded images; the projectile pool's bullet is
+        # drawn outside it and needs a texture of its own
+        atlas = assets.atlas()
+        upload({atlas.source(image)[0] if atlas is not None else image
+                for image in sprite_images(player_img, bullet_img, enemy_img, frames)})
+        self.world = World(player_img, bullet_img, enemy_img, frames)
+        self.recorder = ReplayRecorder(self.world.seed) if RECORD_REPLAYS else None
+
+        font = assets.font(None, 30)
+        # Score and health change often, so draw their digits from cached glyphs
+        self.score_glyphs = GlyphAtlas(font, True, (255, 255, 255))
+        self.health_glyphs = GlyphAtlas(font, True, (255, 0, 0))
+        self.overlay_font = assets.font(None, 20)
+        self.frame_budget = 1.0 / (RENDER_FPS or TICK_RATE)
+
+        # The world ticks at TICK_RATE whatever the render rate; frames in between
+        # draw sprites interpolated between their last two tick positions
+        self.timestep = FixedTimestep()
+        self.fire = False
+        self.frame_seconds = 0.0
+
+    def exit(self):
+        if self.world is not None:
+            save_replay(self.recorder, self.world)
+            self.recorder = None
+
+    def handle(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.manager.pop()
+            if event.key == pygame.K_SPACE:
+                self.fire = True
+            if event.key == pygame.K_F3:
+                profiler.toggle_overlay()
+            if event.key == pygame.K_F4:
+                path = os.path.join(PROFILER_EXPORT_DIR, time.strftime("frames-%Y%m%d-%H%M%S.") + PROFILER_EXPORT_FORMAT)
+                print(f"Frame profile written to {profiler.export(path)}")
+
+    def update(self, seconds):
+        world = self.world
+        if world is None:
+            self.manager.pop()
+            return
+        self.frame_seconds = seconds
         keys = pygame.key.get_pressed()
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "quit"
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return "menu"
-                if event.key == pygame.K_SPACE:
-                    bullet = Bullet(player.rect.centerx, player.rect.top, bullet_img)
-                    bullets.add(bullet)
-                    shoot_sound.play()
-
-        if enemy_spawn_timer >= ENEMY_SPAWN_RATE:
-            enemy = Enemy(random.randint(30, SCREEN_WIDTH - 30), -50, enemy_img)
-            enemies.add(enemy)
-            enemy_spawn_timer = 5
-        else:
-            enemy_spawn_timer += 1
-
-        player_group.update(keys)
-        bullets.update()
-        enemies.update()
-        explosions.update()
-        for star in stars:
-            star.update()
-
-        for bullet in bullets:
-            hit = pygame.sprite.spritecollide(bullet, enemies, True)
-            if hit:
-                bullet.kill()
-                for e in hit:
-                    explosions.add(Explosion(e.rect.centerx, e.rect.centery, frames, scale=1.5, speed=4))
-                score += 100
-                explosion_sound.play()
-
-        hits = pygame.sprite.spritecollide(player, enemies, True)
-        if hits:
-            health -= 1
-            explosions.add(Explosion(player.rect.centerx, player.rect.centery, frames, scale=2, speed=4))
-            explosion_sound.play()
-            if health <= 0:
-                flash_screen(screen)
-                if score > game_loop.high_score:
-                    game_loop.high_score = score
-                return "game_over", score, game_loop.high_score
-
-        screen.fill(bg_color)
-        for star in stars:
-            star.draw(screen)
-        player_group.draw(screen)
-        bullets.draw(screen)
-        enemies.draw(screen)
-        explosions.draw(screen)
-
-        score_text = font.render(f"Score: {score}", True, (255, 255, 255))
-        health_text = font.render(f"Health: {health}", True, (255, 0, 0))
-        screen.blit(score_text, (10, 10))
-        screen.blit(health_text, (SCREEN_WIDTH - 120, 10))
-        
-        
+        profiler.lap("events")
+
+        for _ in range(self.timestep.advance(seconds)):
+            inputs = self.read_keys(keys, self.fire)
+            if self.recorder is not None:
+                self.recorder.record(inputs)
+            self.step_world(inputs)
+            self.fire = False
+
+            for event in world.events:
+                self.voices.play(event, world.tick)
+            profiler.lap("sound")
+
+            if world.game_over:
+                self.exit()
+                # Written to disk in the background; the table itself updates now
+                board = get_leaderboard()
+                board.submit(world.score, ticks=world.tick, seed=world.seed)
+                game_over = GameOverScreen(self.screen, world.score, board.high_score)
+                self.manager.switch(Flash(self.screen, game_over))
+                return
+
+    def step_world(self, inputs):
+        self.world.step(inputs)
+
+    def draw(self):
+        world, renderer = self.world, self.renderer
+        renderer.begin(self.frame_seconds)
+        world.draw(renderer, self.timestep.alpha)
+        profiler.lap("draw")
+
+        self.score_glyphs.draw(renderer, "Score: ", world.score, (10, 10))
+        self.health_glyphs.draw(renderer, "Health: ", world.health, (SCREEN_WIDTH - 120, 10))
+        profiler.draw_overlay(renderer, self.overlay_font)
+        profiler.lap("hud")
+
+        renderer.present()
+        profiler.lap("flip")
+        profiler.count("bullets", len(world.bullets))
+        profiler.count("enemies", world.enemy_count())
+        profiler.count("shots", len(world.projectiles))
+        profiler.count("explosions", len(world.explosions))
+        profiler.count("voices", self.voices.busy())
+        profiler.count("voices_dropped", self.voices.counters["dropped"])
+        profiler.end_frame(self.frame_seconds, self.frame_budget)
+
+class SimGameScene(GameScene):
+    """GameScene with the World ticking in a worker process (SIM_PROCESS).
+
+    This side only forwards input and draws the latest snapshot the worker
+    published in shared memory, so a slow tick never holds up a frame and
+    the simulation gets a core of its own.
+    """
 
-        pygame.display.flip()
+    def __init__(self, screen):
+        Scene.__init__(self)
+        from inputs import read_keys
+        from world import load_images, sprite_images
+        from voices import VoiceManager
+        import sim_worker
+        # The snapshot header word indexes and draw_snapshot live there
+        self.sim_worker = sim_worker
+        self.screen = screen
+        self.read_keys = read_keys
+        self.renderer = Renderer(screen, (5, 5, 20), get_starfield())
+        self.sim = None
+
+        try:
+            images = load_images()
+            self.voices = VoiceManager()
+            assets.music("assets/sounds/background_music.mp3")
+            pygame.mixer.music.play(-1 )
+        except Exception as e:
+            print(f"Error loading assets: {e}")
+            return
+
+        atlas = assets.atlas()
+        # (surface, area) to blit for each sprite id, atlas regions where possible
+        self.sources = [atlas.source(image) if atlas is not None else (image, None)
+                        for image in sprite_images(*images)]
+        upload({image for image, _ in self.sources})
+        self.sim = sim_worker.SimProcess(bullet_hell=BULLET_HELL)
+        self.heard = dict.fromkeys(sim_worker.EVENT_WORDS, 0)
+        self.snapshot = None
+        self.tick = -1
+        self.tick_seen = 0.0
+
+        font = assets.font(None, 30)
+        self.score_glyphs = GlyphAtlas(font, True, (255, 255, 255))
+        self.health_glyphs = GlyphAtlas(font, True, (255, 0, 0))
+        self.overlay_font = assets.font(None, 20)
+        self.frame_budget = 1.0 / (RENDER_FPS or TICK_RATE)
+        self.fire = False
+        self.frame_seconds = 0.0
+
+    def exit(self):
+        # The worker saves the replay itself when it stops
+        if self.sim is not None:
+            self.sim.close()
+            self.sim = None
+
+    def update(self, seconds):
+        sim, sim_worker = self.sim, self.sim_worker
+        if sim is None:
+            self.manager.pop()
+            return
+        self.frame_seconds = seconds
+        sim.send(self.read_keys(pygame.key.get_pressed(), self.fire))
+        self.fire = False
+        profiler.lap("events")
+
+        self.snapshot = sim.read()
+        profiler.lap("snapshot")
+        if self.snapshot is None:
+            if not sim.alive():
+                print("Simulation process stopped")
+                self.manager.pop()
+            return
+        header = self.snapshot[0]
+        if header[sim_worker.TICK] != self.tick:
+            self.tick = header[sim_worker.TICK]
+            self.tick_seen = time.perf_counter()
+        for event, word in sim_worker.EVENT_WORDS.items():
+            if header[word] > self.heard[event]:
+                self.heard[event] = header[word]
+                self.voices.play(event, int(self.tick))
+        profiler.lap("sound")
+
+        if header[sim_worker.GAME_OVER]:
+            self.exit()
+            score = int(header[sim_worker.SCORE])
+            board = get_leaderboard()
+            board.submit(score, ticks=int(header[sim_worker.TICK]), seed=int(header[sim_worker.SEED]))
+            game_over = GameOverScreen(self.screen, score, board.high_score)
+            self.manager.switch(Flash(self.screen, game_over))
+
+    def draw(self):
+        renderer = self.renderer
+        renderer.begin(self.frame_seconds)
+        if self.snapshot is not None:
+            header, rows = self.snapshot
+            # Draw entities as far between their last two tick positions as
+            # time has moved since this tick was published
+            sim_worker = self.sim_worker
+            alpha = min(1.0, (time.perf_counter() - self.tick_seen) * TICK_RATE)
+            sim_worker.draw_snapshot(renderer, self.sources, rows, alpha)
+            profiler.lap("draw")
+
+            self.score_glyphs.draw(renderer, "Score: ", int(header[sim_worker.SCORE]), (10, 10))
+            self.health_glyphs.draw(renderer, "Health: ", int(header[sim_worker.HEALTH]), (SCREEN_WIDTH - 120, 10))
+            profiler.count("entities", len(rows))
+            profiler.count("sim_step_us", int(header[sim_worker.STEP_US]))
+        profiler.draw_overlay(renderer, self.overlay_font)
+        profiler.lap("hud")
+
+        renderer.present()
+        profiler.lap("flip")
+        profiler.count("inputs_dropped", int(self.sim.state.control[self.sim_worker.DROPPED]) if self.sim else 0)
+        profiler.count("torn_reads", self.sim.torn if self.sim else 0)
+        profiler.end_frame(self.frame_seconds, self.frame_budget)
+
+class HostGameScene(GameScene):
+    """GameScene that also runs a co-op game for a second cabinet (--host).
+
+    The remote ship joins when its first inputs arrive. Co-op games aren't
+    recorded, since a replay holds only one ship's inputs.
+    """
+
+    def __init__(self, screen, port=NET_PORT):
+        super().__init__(screen)
+        self.host = None
+        if self.world is None:
+            return
+        from netplay import NetHost
+        self.recorder = None
+        self.host = NetHost(self.world, port)
+        print(f"Hosting co-op on UDP port {port}")
+
+    def exit(self):
+        super().exit()
+        if self.host is not None:
+            self.host.close()
+            self.host = None
+
+    def step_world(self, inputs):
+        host = self.host
+        host.poll()
+        self.world.step(inputs, host.next_input())
+        host.after_tick()
+
+    def draw(self):
+        for name, value in self.host.stats.counts().items():
+            profiler.count(name, value)
+        super().draw()
+
+class ClientGameScene(GameScene):
+    """The joining cabinet's game (--join): draws the host's snapshots, predicts its own ship"""
+
+    def __init__(self, screen, address, port=NET_PORT):
+        Scene.__init__(self)
+        from inputs import read_keys
+        from world import load_images, sprite_images
+        from voices import VoiceManager
+        from timestep import FixedTimestep
+        from netplay import NetClient, EVENTS
+        self.screen = screen
+        self.read_keys = read_keys
+        self.renderer = Renderer(screen, (5, 5, 20), get_starfield())
+        self.client = None
+
+        try:
+            images = load_images()
+            self.voices = VoiceManager()
+            assets.music("assets/sounds/background_music.mp3")
+            pygame.mixer.music.play(-1 )
+        except Exception as e:
+            print(f"Error loading assets: {e}")
+            return
+
+        atlas = assets.atlas()
+        self.sources = [atlas.source(image) if atlas is not None else (image, None)
+                        for image in sprite_images(*images)]
+        upload({image for image, _ in self.sources})
+        self.client = NetClient(address, images[0], port)
+        self.events = EVENTS
+        self.heard = None
+
+        font = assets.font(None, 30)
+        self.score_glyphs = GlyphAtlas(font, True, (255, 255, 255))
+        self.health_glyphs = GlyphAtlas(font, True, (255, 0, 0))
+        self.overlay_font = assets.font(None, 20)
+        self.frame_budget = 1.0 / (RENDER_FPS or TICK_RATE)
+        # Inputs go out once per tick, like the host consumes them
+        self.timestep = FixedTimestep()
+        self.fire = False
+        self.frame_seconds = 0.0
+
+    def exit(self):
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+
+    def update(self, seconds):
+        client = self.client
+        if client is None:
+            self.manager.pop()
+            return
+        self.frame_seconds = seconds
+        keys = pygame.key.get_pressed()
+        for _ in range(self.timestep.advance(seconds)):
+            client.send_input(self.read_keys(keys, self.fire))
+            self.fire = False
+        profiler.lap("events")
+
+        if client.poll():
+            snapshot = client.snapshot
+            # Event counters wrap at 256; anything that moved plays once
+            counters = (snapshot.shots, snapshot.explosions, snapshot.hits)
+            if self.heard is not None:
+                for event, count, heard in zip(self.events, counters, self.heard):
+                    if count != heard:
+                        self.voices.play(event, snapshot.tick)
+            self.heard = counters
+        profiler.lap("network")
+
+        if not client.connected:
+            print("Lost connection to the host")
+            self.manager.pop()
+        elif client.snapshot is not None and client.snapshot.game_over:
+            self.exit()
+            score = client.snapshot.score
+            board = get_leaderboard()
+            board.submit(score, ticks=client.snapshot.tick)
+            game_over = GameOverScreen(self.screen, score, board.high_score)
+            self.manager.switch(Flash(self.screen, game_over))
+
+    def draw(self):
+        client, renderer = self.client, self.renderer
+        renderer.begin(self.frame_seconds)
+        snapshot = client.snapshot
+        if snapshot is not None:
+            renderer.blits(client.blits(self.sources), False)
+            profiler.lap("draw")
+            self.score_glyphs.draw(renderer, "Score: ", snapshot.score, (10, 10))
+            self.health_glyphs.draw(renderer, "Health: ", snapshot.health, (SCREEN_WIDTH - 120, 10))
+            profiler.count("entities", len(client.entities))
+        for name, value in client.stats.counts().items():
+            profiler.count(name, value)
+        profiler.draw_overlay(renderer, self.overlay_font)
+        profiler.lap("hud")
+
+        renderer.present()
+        profiler.lap("flip")
+        profiler.end_frame(self.frame_seconds, self.frame_budget)
+
+# ("host", port) or ("join", address, port) from the command line, for co-op
+NETPLAY = None
+
+def new_game(screen):
+    """The game scene for how the game was started: co-op host or client, or
+    a local game with the simulation in this process or a worker one (SIM_PROCESS)"""
+    if NETPLAY is not None:
+        if NETPLAY[0] == "host":
+            return HostGameScene(screen, NETPLAY[1])
+        return ClientGameScene(screen, *NETPLAY[1:])
+    return SimGameScene(screen) if SIM_PROCESS else GameScene(screen)
 
 # Story screen showing a simple narrative with Continue button
-class StoryScreen:
+class StoryScreen(Scene):
+    fps = MENU_FPS
+    idle_fps = IDLE_FPS
+
     def __init__(self, screen):
+        super().__init__()
         self.screen = screen
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font("assets/font/ARCADE_R.TTF", 12)
-        self.small_font = pygame.font.Font(None, 12)
+        self.font = assets.font("assets/font/ARCADE_R.TTF", 12)
+        self.small_font = assets.font(None, 12)
         self.text_lines = [
             "In the year 2100, humanity fights for survival...",
             "You are the last hope to defend Earth from alien invaders.",
@@ -287,84 +550,65 @@ class StoryScreen:
         self.continue_button = Button(SCREEN_WIDTH//2 - button_width//2, SCREEN_HEIGHT - 100, button_width, button_height, "Continue", (0, 100, 0), (0, 150, 0))
         self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.background.fill((5, 5, 20))
-        self.stars = [Star() for _ in range(80)]
-
-    def run(self):
-        while True:
-            mouse_pos = pygame.mouse.get_pos()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "quit"
-                if self.continue_button.is_clicked(mouse_pos, event):
-                    return "game"
-
-            for star in self.stars:
-                star.update()
-
-            self.continue_button.check_hover(mouse_pos)
-            self.screen.blit(self.background, (0, 0))
-            for star in self.stars:
-                star.draw(self.screen)
-
-            # Draw the text lines centered horizontally
-            start_y = SCREEN_HEIGHT // 4
-            for i, line in enumerate(self.text_lines):
-                rendered_text = self.font.render(line, True, (255, 255, 255))
-                rect = rendered_text.get_rect(center=(SCREEN_WIDTH//2, start_y + i * 35))
-                self.screen.blit(rendered_text, rect)
-
-            self.continue_button.draw(self.screen)
-            pygame.display.flip()
-            self.clock.tick(FPS)
-
-def main():
-    pygame.init()
+        self.renderer = Renderer(screen, self.background, get_starfield())
+        self.seconds = None
+
+    def enter(self):
+        super().enter()
+        self.renderer.invalidate()
+        update_hover((self.continue_button,))
+
+    def handle(self, event):
+        if self.continue_button.is_clicked(get_mouse_pos(), event):
+            self.manager.switch(new_game(self.screen))
+        elif event.type == pygame.MOUSEMOTION and update_hover((self.continue_button,)):
+            self.redraw = True
+
+    def update(self, seconds):
+        self.seconds = seconds
+
+    def draw(self):
+        renderer = self.renderer
+        renderer.begin(self.seconds)
+
+        # Draw the text lines centered horizontally
+        start_y = SCREEN_HEIGHT // 4
+        for i, line in enumerate(self.text_lines):
+            rendered_text = render_text(self.font, line, True, (255, 255, 255))
+            rect = rendered_text.get_rect(center=(SCREEN_WIDTH//2, start_y + i * 35))
+            renderer.blit(rendered_text, rect)
+
+        self.continue_button.draw(renderer.surface)
+        renderer.mark(self.continue_button.rect)
+        renderer.present()
+
+def main(argv=None):
+    import argparse
+    global NETPLAY
+    parser = argparse.ArgumentParser(description="2100: Space Adventure")
+    parser.add_argument("--host", action="store_true", help="run a co-op game another cabinet can --join")
+    parser.add_argument("--join", metavar="ADDRESS", help="join the co-op game hosted at ADDRESS")
+    parser.add_argument("--port", type=int, default=NET_PORT)
+    parser.add_argument("--display", choices=BACKENDS, default=DISPLAY_BACKEND,
+                        help="how frames reach the window (see display.py)")
+    args = parser.parse_args(argv)
+    if args.host:
+        NETPLAY = ("host", args.port)
+    elif args.join:
+        NETPLAY = ("join", args.join, args.port)
+
+    # The only place the game initialises pygame and opens its window
+    pygame.display.init()
+    pygame.font.init()
     pygame.mixer.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("2100: Space Adventure")
-    current_screen = "menu"
-    score = 0
-    high_score = 0
-
-    menu = Menu(screen)
-    story = StoryScreen(screen)
-    game_over_screen = None
-
-    while True:
-        if current_screen == "menu":
-            result = menu.run()
-            if result == "story":
-                current_screen = "story"
-            elif result == "quit":
-                break
-
-        elif current_screen == "story":
-            result = story.run()
-            if result == "game":
-                current_screen = "game"
-            elif result == "quit":
-                break
-
-        elif current_screen == "game":
-            result = game_loop(screen)
-            if isinstance(result, tuple) and result[0] == "game_over":
-                _, score, high_score = result
-                game_over_screen = GameOverScreen(screen, score, high_score)
-                current_screen = "game_over"
-            elif result == "menu":
-                current_screen = "menu"
-            elif result == "quit":
-                break
-
-        elif current_screen == "game_over":
-            result = game_over_screen.run()
-            if result == "game":
-                current_screen = "game"
-            elif result == "menu":
-                current_screen = "menu"
-            elif result == "quit":
-                break
+    screen = open_display(args.display)
+    # Decode gameplay assets in the background while the menu and story are up
+    assets.preload()
+
+    # Menu at the bottom of the stack; story, game and game over go on top of it
+    SceneManager(Menu(screen)).run()
 
+    close_leaderboard()  # wait for the last scores to reach the disk
     pygame.quit()
     sys.exit()
 
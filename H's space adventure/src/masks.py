@@ -0,0 +1,52 @@
+# src/masks.py
+
+import weakref
+
+import pygame
+
+class MaskCache:
+    """pygame.mask.Mask per image surface, built the first time it is asked for.
+
+    Every sprite drawn with the same surface (the loaded image, or one shared
+    variant from transform_cache) shares one mask. Masks are keyed by the
+    surface's id, which is a cheaper lookup than a WeakKeyDictionary, and
+    dropped when the surface is garbage collected, so transform_cache
+    evictions don't leave masks behind.
+    """
+
+    def __init__(self):
+        self.masks = {}
+        self.builds = 0
+
+    def get(self, surface):
+        mask = self.masks.get(id(surface))
+        if mask is None:
+            key = id(surface)
+            mask = self.masks[key] = pygame.mask.from_surface(surface)
+            weakref.finalize(surface, self.masks.pop, key, None)
+            self.builds += 1
+        return mask
+
+    def clear(self):
+        self.masks.clear()
+
+# Process-wide cache shared by every sprite
+cache = MaskCache()
+
+def mask_for(surface):
+    return cache.get(surface)
+
+def collide_mask(left, right):
+    """Sprite collision test: rect overlap first, then the opaque pixels of their images.
+
+    Drop-in for the collided argument of spritecollide, SpatialHash included.
+    """
+    if not left.rect.colliderect(right.rect):
+        return False
+    offset = (right.rect.x - left.rect.x, right.rect.y - left.rect.y)
+    return cache.get(left.image).overlap(cache.get(right.image), offset) is not None
+
+def mask_hits(mask, left, top, other, xs, ys):
+    """Which of the candidate positions (xs, ys top-lefts) of other's mask overlap mask at (left, top)"""
+    overlap = mask.overlap
+    return [overlap(other, (x - left, y - top)) is not None for x, y in zip(xs, ys)]
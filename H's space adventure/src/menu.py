@@ -1,6 +1,14 @@
+import os
 import pygame
-import random
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, PLAYER_HEALTH, FONT_NAME, FONT_SIZE
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, MENU_FPS, IDLE_FPS, PLAYER_HEALTH, FONT_NAME, SCORE_FONT_SIZE
+from starfield import get_starfield
+from text_cache import render_text
+from assets import assets
+from leaderboard import get_leaderboard
+from scenes import Scene
+from display import present, get_mouse_pos
+
+FONT_PATH = os.path.join("assets", "font", FONT_NAME)
 
 class Button:
     def __init__(self, x, y, width, height, text, color, hover_color):
@@ -9,14 +17,14 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.is_hovered = False
-        self.font = pygame.font.Font(FONT_NAME, 36)
+        self.font = assets.font(FONT_PATH, 36)
         
     def draw(self, surface):
         color = self.hover_color if self.is_hovered else self.color
         pygame.draw.rect(surface, color, self.rect, border_radius=10)
         pygame.draw.rect(surface, (255, 255, 255), self.rect, 2, border_radius=10)
         
-        text_surface = self.font.render(self.text, True, (255, 255, 255))
+        text_surface = render_text(self.font, self.text, True, (255, 255, 255))
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
         
@@ -29,26 +37,32 @@ class Button:
             return self.rect.collidepoint(pos)
         return False
 
-class Menu:
+class Menu(Scene):
+    """Standalone menu; run() returns "game" or "quit"."""
+    fps = MENU_FPS
+    idle_fps = IDLE_FPS
+    
     def __init__(self, screen):
+        super().__init__()
         self.screen = screen
-        self.clock = pygame.time.Clock()
         self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.background.fill((5, 5, 20))
-        self.font = pygame.font.Font(FONT_NAME, FONT_SIZE)
-        self.title_font = pygame.font.Font(FONT_NAME, 72)
+        self.font = assets.font(FONT_PATH, SCORE_FONT_SIZE)
+        self.title_font = assets.font(FONT_PATH, 72)
         
         # Game state variables
         self.current_score = 0
-        self.high_score = 0
         
         # Initialize UI elements
         self.init_ui()
         
         # Stars for background
-        self.stars = []
         self.init_stars()
     
+    @property
+    def high_score(self):
+        return get_leaderboard().high_score
+    
     def init_ui(self):
         """Initialize all UI elements"""
         # Title
@@ -77,32 +91,16 @@ class Menu:
         self.score_rect = self.score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4 + 100))
     
     def init_stars(self):
-        """Initialize starfield background"""
-        for _ in range(100):
-            self.stars.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT),
-                'speed': random.uniform(0.5, 2),
-                'size': random.randint(1, 3)
-            })
-    
-    def update_stars(self):
+        """Use the starfield shared with the other screens"""
+        self.stars = get_starfield()
+    
+    def update_stars(self, seconds):
         """Update star positions"""
-        for star in self.stars:
-            star['y'] += star['speed']
-            if star['y'] > SCREEN_HEIGHT:
-                star['y'] = 0
-                star['x'] = random.randint(0, SCREEN_WIDTH)
+        self.stars.update(seconds)
     
     def draw_stars(self):
         """Draw starfield background"""
-        for star in self.stars:
-            pygame.draw.circle(
-                self.screen, 
-                (255, 255, 255), 
-                (int(star['x']), int(star['y'])), 
-                star['size']
-            )
+        self.stars.draw(self.screen)
     
     def draw_health_bar(self, current_health, max_health):
         """Draw health bar at top of screen"""
@@ -118,85 +116,89 @@ class Menu:
         pygame.draw.rect(self.screen, (255, 255, 255), (10, 10, bar_width, bar_height), 2)
         
         # Health text
-        health_text = self.font.render(f"Health: {current_health}/{max_health}", True, (255, 255, 255))
+        health_text = render_text(self.font, f"Health: {current_health}/{max_health}", True, (255, 255, 255))
         self.screen.blit(health_text, (bar_width + 20, 10))
     
     def show_game_over(self, final_score):
-        """Display game over screen with final score"""
-        running = True
-        
-        # Update high score if needed
-        if final_score > self.high_score:
-            self.high_score = final_score
-        
-        while running:
-            mouse_pos = pygame.mouse.get_pos()
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "quit"
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                    return "menu"
-                if self.quit_button.is_clicked(mouse_pos, event):
-                    return "quit"
-            
-            # Update
-            self.update_stars()
-            self.quit_button.check_hover(mouse_pos)
-            
-            # Draw
-            self.screen.blit(self.background, (0, 0))
-            self.draw_stars()
-            
-            # Game over text
-            game_over_text = self.title_font.render("GAME OVER", True, (255, 0, 0))
-            score_text = self.font.render(f"Final Score: {final_score}", True, (255, 255, 255))
-            high_score_text = self.font.render(f"High Score: {self.high_score}", True, (255, 255, 255))
-            prompt_text = self.font.render("Press ENTER to continue", True, (255, 255, 255))
-            
-            self.screen.blit(game_over_text, (SCREEN_WIDTH//2 - game_over_text.get_width()//2, SCREEN_HEIGHT//3))
-            self.screen.blit(score_text, (SCREEN_WIDTH//2 - score_text.get_width()//2, SCREEN_HEIGHT//2))
-            self.screen.blit(high_score_text, (SCREEN_WIDTH//2 - high_score_text.get_width()//2, SCREEN_HEIGHT//2 + 40))
-            self.screen.blit(prompt_text, (SCREEN_WIDTH//2 - prompt_text.get_width()//2, SCREEN_HEIGHT//2 + 80))
-            
-            self.quit_button.draw(self.screen)
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
-        
-        return "quit"
-    
-    def run(self):
-        """Main menu loop"""
-        running = True
-        while running:
-            mouse_pos = pygame.mouse.get_pos()
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "quit"
-                if self.start_button.is_clicked(mouse_pos, event):
-                    return "game"
-                if self.quit_button.is_clicked(mouse_pos, event):
-                    return "quit"
-            
-            # Update
-            self.update_stars()
-            self.start_button.check_hover(mouse_pos)
-            self.quit_button.check_hover(mouse_pos)
-            
-            # Draw
-            self.screen.blit(self.background, (0, 0))
-            self.draw_stars()
-            
-            # Draw title and buttons
-            self.screen.blit(self.title_text, self.title_rect)
-            self.screen.blit(self.score_text, (SCREEN_WIDTH//2 - self.score_text.get_width()//2, SCREEN_HEIGHT//4 + 100))
-            
-            self.start_button.draw(self.screen)
-            self.quit_button.draw(self.screen)
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
-        
-        return "quit"
\ No newline at end of file
+        """Display game over screen with final score; returns "menu" or "quit"."""
+        return GameOverScene(self, final_score).run()
+    
+    def handle(self, event):
+        mouse_pos = get_mouse_pos()
+        if self.start_button.is_clicked(mouse_pos, event):
+            self.manager.quit("game")
+        elif self.quit_button.is_clicked(mouse_pos, event):
+            self.manager.quit("quit")
+        elif event.type == pygame.MOUSEMOTION and self.check_hover(self.start_button, self.quit_button):
+            self.redraw = True
+    
+    def check_hover(self, *buttons):
+        """Recheck which buttons the mouse is over; True if any of them changed"""
+        pos = get_mouse_pos()
+        changed = False
+        for button in buttons:
+            was_hovered = button.is_hovered
+            changed |= button.check_hover(pos) != was_hovered
+        return changed
+    
+    def update(self, seconds):
+        """Update star positions"""
+        self.update_stars(seconds)
+    
+    def draw(self):
+        """Draw the main menu"""
+        self.screen.blit(self.background, (0, 0))
+        self.draw_stars()
+        
+        # Draw title and buttons
+        self.screen.blit(self.title_text, self.title_rect)
+        self.screen.blit(self.score_text, (SCREEN_WIDTH//2 - self.score_text.get_width()//2, SCREEN_HEIGHT//4 + 100))
+        
+        self.start_button.draw(self.screen)
+        self.quit_button.draw(self.screen)
+        
+        present()
+
+class GameOverScene(Scene):
+    """Game over screen over the menu's starfield, drawn by Menu.show_game_over"""
+    fps = MENU_FPS
+    idle_fps = IDLE_FPS
+    
+    def __init__(self, menu, final_score):
+        super().__init__()
+        self.menu = menu
+        self.final_score = final_score
+    
+    def handle(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+            self.manager.quit("menu")
+        elif self.menu.quit_button.is_clicked(get_mouse_pos(), event):
+            self.manager.quit("quit")
+        elif event.type == pygame.MOUSEMOTION and self.menu.check_hover(self.menu.quit_button):
+            self.redraw = True
+    
+    def update(self, seconds):
+        self.menu.update_stars(seconds)
+    
+    def draw(self):
+        menu = self.menu
+        screen = menu.screen
+        screen.blit(menu.background, (0, 0))
+        menu.draw_stars()
+        
+        # Game over text
+        game_over_text = render_text(menu.title_font, "GAME OVER", True, (255, 0, 0))
+        score_text = render_text(menu.font, f"Final Score: {self.final_score}", True, (255, 255, 255))
+        # The caller submits the score, if at all; don't show a best below it
+        high_score = max(self.final_score, menu.high_score)
+        high_score_text = render_text(menu.font, f"High Score: {high_score}", True, (255, 255, 255))
+        prompt_text = render_text(menu.font, "Press ENTER to continue", True, (255, 255, 255))
+        
+        screen.blit(game_over_text, (SCREEN_WIDTH//2 - game_over_text.get_width()//2, SCREEN_HEIGHT//3))
+        screen.blit(score_text, (SCREEN_WIDTH//2 - score_text.get_width()//2, SCREEN_HEIGHT//2))
+        screen.blit(high_score_text, (SCREEN_WIDTH//2 - high_score_text.get_width()//2, SCREEN_HEIGHT//2 + 40))
+        screen.blit(prompt_text, (SCREEN_WIDTH//2 - prompt_text.get_width()//2, SCREEN_HEIGHT//2 + 80))
+        
+        menu.quit_button.draw(screen)
+        
+        present()
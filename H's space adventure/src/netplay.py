@@ -0,0 +1,614 @@
+# src/netplay.py
+
+import heapq
+import socket
+import struct
+import time
+from collections import deque, namedtuple
+
+import numpy as np
+
+from settings import (TICK_RATE, SCREEN_HEIGHT, NET_PORT, NET_SNAPSHOT_RATE,
+                      NET_POSITION_STEP, NET_TIMEOUT)
+from inputs import INPUT_FIRE
+
+# Packets, little-endian:
+#   INPUT     client -> host: newest input seq, newest snapshot tick the client
+#             has, client clock in ms, then the last count input bitmasks
+#             (oldest first), so one that arrives makes up for lost ones
+#   SNAPSHOT  host -> client: SNAPSHOT_HEADER, then the bit-packed changes
+#             since the baseline snapshot (see encode_delta)
+INPUT, SNAPSHOT = 1, 2
+INPUT_HEADER = struct.Struct("<BIIIB")
+SNAPSHOT_HEADER = struct.Struct("<BIIIIHIhBBBBIhh")
+Snapshot = namedtuple("Snapshot", "tick baseline ack echo held score health game_over "
+                                  "shots explosions hits ship ship_x ship_y")
+EVENTS = ("shoot", "explosion", "hit")
+MAX_INPUTS = 32  # unacknowledged inputs resent with each INPUT packet
+INPUT_BUFFER = 6  # remote inputs the host queues before dropping the oldest
+BASELINES = 64  # snapshots kept on each side to delta against
+UDP_OVERHEAD = 28  # IPv4 + UDP header bytes per packet, for wire rates
+
+# Entity encoding: 2-bit op, then for MOVE dx, dy; for MORPH a new kind plus
+# dx, dy; for FULL kind, x, y. Positions are in NET_POSITION_STEP steps from
+# POSITION_OFFSET pixels off the top-left, so spawns above the screen fit
+MOVE, MORPH, FULL = range(3)
+KIND_BITS = 6
+POSITION_BITS = 10
+DELTA_BITS = 6
+DELTA_RANGE = 1 << (DELTA_BITS - 1)
+POSITION_OFFSET = 128
+POSITION_MAX = (1 << POSITION_BITS) - 1
+
+class BitWriter:
+    """Packs unsigned fields of any width into bytes, least significant bit first"""
+
+    def __init__(self):
+        self.out = bytearray()
+        self.acc = 0
+        self.bits = 0
+
+    def write(self, value, bits):
+        self.acc |= (value & ((1 << bits) - 1)) << self.bits
+        self.bits += bits
+        while self.bits >= 8:
+            self.out.append(self.acc & 0xFF)
+            self.acc >>= 8
+            self.bits -= 8
+
+    def varint(self, value):
+        """Four bits at a time, each group followed by a continue bit"""
+        while True:
+            more = value > 15
+            self.write((value & 15) | (more << 4), 5)
+            value >>= 4
+            if not more:
+                return
+
+    def getvalue(self):
+        return bytes(self.out) + (bytes([self.acc]) if self.bits else b"")
+
+class BitReader:
+    def __init__(self, data, pos=0):
+        self.data = data
+        self.pos = pos
+        self.acc = 0
+        self.bits = 0
+
+    def read(self, bits):
+        while self.bits < bits:
+            self.acc |= self.data[self.pos] << self.bits
+            self.pos += 1
+            self.bits += 8
+        value = self.acc & ((1 << bits) - 1)
+        self.acc >>= bits
+        self.bits -= bits
+        return value
+
+    def signed(self, bits):
+        value = self.read(bits)
+        return value - (1 << bits) if value >> (bits - 1) else value
+
+    def varint(self):
+        value = shift = 0
+        while True:
+            group = self.read(5)
+            value |= (group & 15) << shift
+            shift += 4
+            if not group & 16:
+                return value
+
+def quantize(value):
+    q = (int(value) + POSITION_OFFSET) // NET_POSITION_STEP
+    return 0 if q < 0 else POSITION_MAX if q > POSITION_MAX else q
+
+def dequantize(q):
+    return q * NET_POSITION_STEP - POSITION_OFFSET
+
+def encode_delta(writer, baseline, current):
+    """Write what changed from baseline to current, both {id: (kind, qx, qy)}.
+
+    Ids go out in ascending order as gaps from the previous one: first the
+    ids that are gone, then every entity that is new or changed. Entities
+    the same as in the baseline cost nothing.
+    """
+    removed = sorted(i for i in baseline if i not in current)
+    changed = sorted(i for i, state in current.items() if baseline.get(i) != state)
+    writer.varint(len(removed))
+    last = 0
+    for i in removed:
+        writer.varint(i - last)
+        last = i
+    writer.varint(len(changed))
+    last = 0
+    for i in changed:
+        writer.varint(i - last)
+        last = i
+        kind, x, y = current[i]
+        old = baseline.get(i)
+        if old is not None:
+            dx, dy = x - old[1], y - old[2]
+            if -DELTA_RANGE <= dx < DELTA_RANGE and -DELTA_RANGE <= dy < DELTA_RANGE:
+                if kind == old[0]:
+                    writer.write(MOVE, 2)
+                else:
+                    writer.write(MORPH, 2)
+                    writer.write(kind, KIND_BITS)
+                writer.write(dx, DELTA_BITS)
+                writer.write(dy, DELTA_BITS)
+                continue
+        writer.write(FULL, 2)
+        writer.write(kind, KIND_BITS)
+        writer.write(x, POSITION_BITS)
+        writer.write(y, POSITION_BITS)
+
+def decode_delta(reader, baseline):
+    """The entities encode_delta described, applied to a copy of baseline"""
+    current = dict(baseline)
+    last = 0
+    for _ in range(reader.varint()):
+        last += reader.varint()
+        current.pop(last, None)
+    last = 0
+    for _ in range(reader.varint()):
+        last += reader.varint()
+        op = reader.read(2)
+        if op == FULL:
+            current[last] = (reader.read(KIND_BITS), reader.read(POSITION_BITS), reader.read(POSITION_BITS))
+            continue
+        kind, x, y = current[last]
+        if op == MORPH:
+            kind = reader.read(KIND_BITS)
+        current[last] = (kind, x + reader.signed(DELTA_BITS), y + reader.signed(DELTA_BITS))
+    return current
+
+class NetStats:
+    """Traffic and link counters for one end of a connection, with rates over the last second"""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.sent_bytes = self.sent_packets = 0
+        self.received_bytes = self.received_packets = 0
+        self.lost = 0  # snapshots that never arrived (client) or inputs dropped (host)
+        self.late = 0  # packets older than one already handled
+        self.corrupt = 0  # packets that could not be decoded
+        self.rtt = None  # smoothed round trip, seconds
+        self.correction = 0.0  # last distance the predicted ship was pulled back, pixels
+        self.window = deque()  # (time, bytes sent, bytes received)
+
+    def sent(self, size):
+        self.sent_bytes += size
+        self.sent_packets += 1
+        self._note(size, 0)
+
+    def received(self, size):
+        self.received_bytes += size
+        self.received_packets += 1
+        self._note(0, size)
+
+    def round_trip(self, seconds):
+        self.rtt = seconds if self.rtt is None else self.rtt + (seconds - self.rtt) / 8
+
+    def _note(self, sent, received):
+        now = self.clock()
+        window = self.window
+        window.append((now, sent, received))
+        while window[0][0] < now - 1.0:
+            window.popleft()
+
+    def rates(self):
+        """(bytes sent, bytes received) over the last second"""
+        now = self.clock()
+        window = [entry for entry in self.window if entry[0] >= now - 1.0]
+        return sum(entry[1] for entry in window), sum(entry[2] for entry in window)
+
+    def counts(self):
+        """Name -> value, for the profiler overlay"""
+        up, down = self.rates()
+        return {"net_up_Bps": up, "net_down_Bps": down, "net_lost": self.lost, "net_late": self.late,
+                "net_corrupt": self.corrupt, "net_rtt_ms": int(self.rtt * 1000) if self.rtt is not None else -1,
+                "net_correction_px": round(self.correction, 1)}
+
+def sprite_kinds(world):
+    """image -> kind number; kinds index world.sprite_images on both sides"""
+    from world import sprite_images
+    images = sprite_images(world.player.image, world.bullet_img, world.enemy_img, world.explosion_frames)
+    if len(images) > 1 << KIND_BITS:
+        raise ValueError(f"{len(images)} sprite kinds do not fit in {KIND_BITS} bits")
+    return {image: i for i, image in enumerate(images)}
+
+def _open(address, port):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind((address, port))
+    sock.setblocking(False)
+    return sock
+
+def _receive(sock):
+    """Every datagram waiting on sock, as (data, address) pairs"""
+    packets = []
+    while True:
+        try:
+            packets.append(sock.recvfrom(65535))
+        except (BlockingIOError, InterruptedError):
+            return packets
+        except ConnectionResetError:
+            continue  # a previous send bounced; nothing to read for it
+
+class NetHost:
+    """Authoritative end of a co-op game: the World runs here.
+
+    The first address to send inputs joins as a second ship. Its inputs are
+    queued and one is used per tick in order, so the client can tell from
+    the acknowledged sequence number exactly which of its inputs a snapshot
+    includes. Every TICK_RATE / NET_SNAPSHOT_RATE ticks the client gets a
+    snapshot delta-encoded against the newest one it has acknowledged (or
+    against nothing, until it has acknowledged one).
+    """
+
+    def __init__(self, world, port=NET_PORT, address="", sock=None, clock=time.perf_counter):
+        self.world = world
+        self.sock = sock if sock is not None else _open(address, port)
+        self.clock = clock
+        self.stats = NetStats(clock)
+        self.kinds = sprite_kinds(world)
+        self.interval = max(1, TICK_RATE // NET_SNAPSHOT_RATE)
+        self.client = None
+        self.ship = None
+        self.queue = deque()
+        self.queued = 0  # newest input seq queued
+        self.applied = 0  # newest input seq used in a tick
+        self.held = 0
+        self.acked = 0  # newest snapshot tick the client has
+        self.sent = {}  # tick -> entities sent, the baselines deltas can use
+        self.echo = None  # (client clock, our clock when it arrived)
+        self.heard = clock()
+        self.events = dict.fromkeys(EVENTS, 0)
+        self.ids = {}
+        self.next_id = 1
+
+    @property
+    def connected(self):
+        return self.client is not None and self.clock() - self.heard < NET_TIMEOUT
+
+    def poll(self):
+        """Take in every waiting input packet"""
+        for data, address in _receive(self.sock):
+            if len(data) < INPUT_HEADER.size or data[0] != INPUT:
+                continue
+            if self.client is None:
+                self.client = address
+                self.ship = self.world.add_player()
+            elif address != self.client:
+                continue
+            self.stats.received(len(data))
+            _, newest, acked, sent_ms, count = INPUT_HEADER.unpack_from(data)
+            inputs = data[INPUT_HEADER.size:INPUT_HEADER.size + count]
+            self.heard = self.clock()
+            if acked > self.acked:
+                self.acked = acked
+            if newest <= self.queued:
+                self.stats.late += 1
+                continue
+            self.echo = (sent_ms, self.heard)
+            for seq, bits in enumerate(inputs, newest - len(inputs) + 1):
+                if seq > self.queued:
+                    self.queue.append((seq, bits))
+                    self.queued = seq
+            # A backlog means the client runs ahead of us; let it catch up
+            # rather than adding latency
+            while len(self.queue) > INPUT_BUFFER:
+                self.applied = self.queue.popleft()[0]
+                self.stats.lost += 1
+
+    def next_input(self):
+        """The remote ship's inputs for this tick; movement carries on if none came in time"""
+        if not self.queue:
+            return self.held
+        self.applied, bits = self.queue.popleft()
+        self.held = bits & ~INPUT_FIRE
+        return bits
+
+    def after_tick(self):
+        """Count the tick's sound events and send a snapshot if one is due"""
+        world = self.world
+        for event in world.events:
+            if event in self.events:
+                self.events[event] += 1
+        if self.client is None:
+            return
+        if world.game_over:
+            # The last snapshot matters most; send it a few times
+            for _ in range(3):
+                self.send_snapshot()
+        elif world.tick % self.interval == 0:
+            self.send_snapshot()
+
+    def entities(self):
+        """{network id: (kind, qx, qy)} for everything drawn this tick"""
+        world, kinds = self.world, self.kinds
+        ids, self.ids = self.ids, {}
+        entities = {}
+
+        def add(key, kind, x, y):
+            i = ids.get(key)
+            if i is None:
+                i = self.next_id
+                self.next_id += 1
+            self.ids[key] = i
+            entities[i] = (kind, quantize(x), quantize(y))
+
+        for group in (world.player_group, world.bullets, world.enemies, world.explosions):
+            for sprite in group:
+                kind = kinds.get(sprite.image)
+                if kind is not None:
+                    add(sprite, kind, *sprite.rect.topleft)
+        swarm = world.swarm
+        if swarm is not None and swarm.size:
+            kind = kinds[swarm.image]
+            live = np.flatnonzero(swarm.alive[:swarm.size])
+            for i, generation, x, y in zip(live.tolist(), swarm.generation[live].tolist(),
+                                           swarm.x[live].tolist(), swarm.y[live].tolist()):
+                add(("swarm", i, generation), kind, x, y)
+        pool = world.projectiles
+        if pool.count:
+            from projectiles import BULLET_SIZE
+            n, half = pool.count, BULLET_SIZE // 2
+            kind = kinds[pool.sprite]
+            for i, x, y in zip(pool.ids[:n].tolist(), pool.x[:n].tolist(), pool.y[:n].tolist()):
+                add(("shot", i), kind, x - half, y - half)
+        return entities
+
+    def send_snapshot(self):
+        world, ship = self.world, self.ship
+        entities = self.entities()
+        baseline_tick = self.acked if self.acked in self.sent else 0
+        writer = BitWriter()
+        encode_delta(writer, self.sent.get(baseline_tick, {}), entities)
+
+        echo, held = 0, 0
+        if self.echo is not None:
+            echo = self.echo[0]
+            held = min(65535, int((self.clock() - self.echo[1]) * 1000))
+        packet = SNAPSHOT_HEADER.pack(
+            SNAPSHOT, world.tick, baseline_tick, self.applied, echo, held, world.score, world.health,
+            world.game_over, *(self.events[event] & 0xFF for event in EVENTS),
+            self.ids.get(ship, 0), *ship.rect.topleft) + writer.getvalue()
+        self.sock.sendto(packet, self.client)
+        self.stats.sent(len(packet))
+
+        self.sent[world.tick] = entities
+        for tick in [t for t in self.sent if t < baseline_tick]:
+            del self.sent[tick]
+        while len(self.sent) > BASELINES:
+            del self.sent[min(self.sent)]
+
+    def close(self):
+        self.sock.close()
+
+class NetClient:
+    """Joining end of a co-op game: sends inputs, receives snapshots, predicts its own ship.
+
+    Nothing is simulated here except the local ship's movement. Each input is
+    applied to the predicted ship as it is sent; when a snapshot arrives the
+    ship is put back where the host had it and every input the host had not
+    used yet is replayed on top, so the ship answers the keys at once and
+    still ends up wherever the host says.
+    """
+
+    def __init__(self, address, ship_image, port=NET_PORT, sock=None, clock=time.perf_counter):
+        from player import Player
+        from world import spawn_x
+        self.address = (socket.gethostbyname(address), port)
+        self.sock = sock if sock is not None else _open("", 0)
+        self.clock = clock
+        self.stats = NetStats(clock)
+        self.interval = max(1, TICK_RATE // NET_SNAPSHOT_RATE)
+        self.seq = 0
+        self.inputs = deque()  # (seq, bits) the host hasn't used yet
+        self.baselines = {0: {}}  # tick -> entities
+        self.snapshot = None  # newest Snapshot header
+        self.entities = {}
+        self.previous = {}  # entities of the snapshot before
+        self.received_at = clock()
+        self.heard = clock()
+        # Start where the host's World.add_player puts the second ship
+        self.ship = Player(spawn_x(1, 2), SCREEN_HEIGHT - 50, ship_image)
+
+    @property
+    def connected(self):
+        return self.clock() - self.heard < NET_TIMEOUT
+
+    def send_input(self, bits):
+        """Send this tick's input bitmask (with the ones not yet acknowledged) and predict its move"""
+        self.seq += 1
+        self.inputs.append((self.seq, bits))
+        while len(self.inputs) > MAX_INPUTS:
+            self.inputs.popleft()
+        acked = self.snapshot.tick if self.snapshot is not None else 0
+        packet = INPUT_HEADER.pack(INPUT, self.seq, acked, int(self.clock() * 1000) & 0xFFFFFFFF,
+                                   len(self.inputs)) + bytes(b for _, b in self.inputs)
+        self.sock.sendto(packet, self.address)
+        self.stats.sent(len(packet))
+        self.ship.update(bits)
+
+    def poll(self):
+        """Take in waiting snapshots; returns whether a newer one arrived"""
+        newer = False
+        for data, address in _receive(self.sock):
+            if address != self.address or len(data) < SNAPSHOT_HEADER.size or data[0] != SNAPSHOT:
+                continue
+            self.stats.received(len(data))
+            snapshot = Snapshot(*SNAPSHOT_HEADER.unpack_from(data)[1:])
+            if self.snapshot is not None and snapshot.tick <= self.snapshot.tick:
+                self.stats.late += 1
+                continue
+            baseline = self.baselines.get(snapshot.baseline)
+            if baseline is None:
+                self.stats.lost += 1  # can't decode it; the host rebases once we ack a newer one
+                continue
+            try:
+                entities = decode_delta(BitReader(data, SNAPSHOT_HEADER.size), baseline)
+            except (IndexError, KeyError):
+                self.stats.corrupt += 1
+                continue
+            self._accept(snapshot, entities)
+            newer = True
+        return newer
+
+    def _accept(self, snapshot, entities):
+        now = self.clock()
+        if self.snapshot is not None:
+            self.stats.lost += max(0, (snapshot.tick - self.snapshot.tick) // self.interval - 1)
+        if snapshot.echo:
+            rtt = ((int(now * 1000) - snapshot.echo) & 0xFFFFFFFF) - snapshot.held
+            self.stats.round_trip(max(0, rtt) / 1000)
+        self.snapshot = snapshot
+        self.previous, self.entities = self.entities, entities
+        self.received_at = self.heard = now
+        self.baselines[snapshot.tick] = entities
+        for tick in [t for t in self.baselines if 0 < t < snapshot.baseline]:
+            del self.baselines[tick]
+
+        # Reconcile: the host's position, plus every input it hasn't used yet
+        while self.inputs and self.inputs[0][0] <= snapshot.ack:
+            self.inputs.popleft()
+        predicted = self.ship.rect.topleft
+        self.ship.rect.topleft = (snapshot.ship_x, snapshot.ship_y)
+        for _, bits in self.inputs:
+            self.ship.update(bits)
+        x, y = self.ship.rect.topleft
+        self.stats.correction = ((x - predicted[0]) ** 2 + (y - predicted[1]) ** 2) ** 0.5
+
+    def blits(self, sources):
+        """(surface, position, area) for every entity, interpolated between the last two
+        snapshots, with the local ship at its predicted position"""
+        alpha = min(1.0, (self.clock() - self.received_at) * NET_SNAPSHOT_RATE)
+        previous, own = self.previous, self.snapshot.ship if self.snapshot is not None else 0
+        out = []
+        for i, (kind, x, y) in self.entities.items():
+            if i == own:
+                continue
+            last = previous.get(i)
+            if last is not None and last[0] == kind:
+                x = last[1] + (x - last[1]) * alpha
+                y = last[2] + (y - last[2]) * alpha
+            image, area = sources[kind]
+            out.append((image, (round(dequantize(x)), round(dequantize(y))), area))
+        if own:
+            image, area = sources[0]
+            out.append((image, self.ship.rect.topleft, area))
+        return out
+
+    def close(self):
+        self.sock.close()
+
+class LossySocket:
+    """UDP socket stand-in that drops and delays outgoing packets, for testing on one machine.
+
+    Each packet is dropped with probability loss, otherwise held for latency
+    plus up to jitter seconds, so packets also arrive out of order.
+    """
+
+    def __init__(self, sock, rng, loss=0.0, latency=0.0, jitter=0.0, clock=time.perf_counter):
+        self.sock = sock
+        self.rng = rng
+        self.loss = loss
+        self.latency = latency
+        self.jitter = jitter
+        self.clock = clock
+        self.queue = []
+        self.order = 0
+
+    def sendto(self, data, address):
+        self.flush()
+        if self.rng.random() < self.loss:
+            return len(data)
+        due = self.clock() + self.latency + self.rng.random() * self.jitter
+        self.order += 1
+        heapq.heappush(self.queue, (due, self.order, data, address))
+        return len(data)
+
+    def flush(self):
+        now = self.clock()
+        while self.queue and self.queue[0][0] <= now:
+            _, _, data, address = heapq.heappop(self.queue)
+            self.sock.sendto(data, address)
+
+    def recvfrom(self, size):
+        return self.sock.recvfrom(size)
+
+    def close(self):
+        self.sock.close()
+
+if __name__ == "__main__":
+    import argparse
+    import random
+    from world import create_headless_world
+    from policies import random_policy
+    parser = argparse.ArgumentParser(description="Run a host and a client over 127.0.0.1 with simulated loss and jitter")
+    parser.add_argument("--seconds", type=float, default=60.0, help="game time to run for")
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--loss", type=float, default=0.05, help="share of packets dropped each way")
+    parser.add_argument("--latency", type=float, default=0.03, help="one-way delay, seconds")
+    parser.add_argument("--jitter", type=float, default=0.04, help="extra random delay up to this, seconds")
+    parser.add_argument("--bullet-hell", action="store_true")
+    args = parser.parse_args()
+
+    # Both ends run in this loop on a shared game clock, one tick at a time,
+    # so the run is as fast as the machine and the delays are exact
+    now = [0.0]
+    clock = lambda: now[0]
+    rng = random.Random(args.seed)
+    world = create_headless_world(args.seed, bullet_hell=args.bullet_hell)
+
+    truth = {}
+    class CheckedHost(NetHost):
+        def entities(self):
+            entities = truth[self.world.tick] = super().entities()
+            return entities
+
+    host_sock = LossySocket(_open("127.0.0.1", 0), rng, args.loss, args.latency, args.jitter, clock)
+    client_sock = LossySocket(_open("127.0.0.1", 0), rng, args.loss, args.latency, args.jitter, clock)
+    host = CheckedHost(world, sock=host_sock, clock=clock)
+    client = NetClient("127.0.0.1", world.player.image, port=host_sock.sock.getsockname()[1],
+                       sock=client_sock, clock=clock)
+    host_policy, client_policy = random_policy(random.Random(args.seed)), random_policy(random.Random(args.seed + 1))
+
+    mismatched = snapshots = entities = 0
+    corrections = []
+    started = time.perf_counter()
+    while not world.game_over and world.tick < args.seconds * TICK_RATE:
+        now[0] += 1.0 / TICK_RATE
+        client_sock.flush()
+        host_sock.flush()
+        if client.poll():
+            snapshots += 1
+            entities += len(client.entities)
+            corrections.append(client.stats.correction)
+            if client.entities != truth[client.snapshot.tick]:
+                mismatched += 1
+        client.send_input(client_policy(world))
+        host.poll()
+        world.step(host_policy(world), host.next_input())
+        host.after_tick()
+        for tick in [t for t in truth if t < world.tick - TICK_RATE * 5]:
+            del truth[tick]
+    elapsed = time.perf_counter() - started
+
+    seconds = world.tick / TICK_RATE
+    down, up = host.stats, client.stats
+    print(f"{world.tick} ticks ({seconds:.1f}s of play, {elapsed:.1f}s to run), score {world.score}, "
+          f"loss {args.loss:.0%}, latency {args.latency * 1000:.0f}ms + jitter {args.jitter * 1000:.0f}ms")
+    print(f"  host -> client  {down.sent_packets} snapshots, {down.sent_bytes / max(1, down.sent_packets):.0f} B avg, "
+          f"{down.sent_bytes / seconds / 1024:.2f} KB/s ({(down.sent_bytes + UDP_OVERHEAD * down.sent_packets) / seconds / 1024:.2f} KB/s on the wire)")
+    print(f"  client -> host  {up.sent_packets} input packets, "
+          f"{up.sent_bytes / seconds / 1024:.2f} KB/s ({(up.sent_bytes + UDP_OVERHEAD * up.sent_packets) / seconds / 1024:.2f} KB/s on the wire)")
+    print(f"  client got {snapshots} snapshots ({up.lost} lost or without a baseline, {up.late} late, "
+          f"{up.corrupt} corrupt), "
+          f"{entities / max(1, snapshots):.0f} entities avg, {mismatched} decoded differently from what was sent")
+    print(f"  host dropped {down.lost} queued inputs, {down.late} input packets late; "
+          f"rtt {up.rtt * 1000 if up.rtt is not None else -1:.0f}ms")
+    if corrections:
+        print(f"  prediction corrections: mean {sum(corrections) / len(corrections):.2f}px, max {max(corrections):.1f}px")
+    host.close()
+    client.close()
@@ -1,9 +1,7 @@
 import pygame
-import time
 
-# Define screen dimensions
-SCREEN_WIDTH = 800  # Set this to your game's screen width
-SCREEN_HEIGHT = 640  # Set this to your game's screen height
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from inputs import INPUT_LEFT, INPUT_RIGHT, INPUT_UP, INPUT_DOWN
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y, image):
@@ -12,22 +10,25 @@ class Player(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(center=(x, y))
         self.speed = 5
         self.invulnerable = False
-        self.invulnerable_time = 0
+        self.invulnerable_timer = None
         
-    def update(self, keys):
-        if keys[pygame.K_LEFT] and self.rect.left > 0:
+    def update(self, inputs):
+        if inputs & INPUT_LEFT and self.rect.left > 0:
             self.rect.x -= self.speed
-        if keys[pygame.K_RIGHT] and self.rect.right < SCREEN_WIDTH:
+        if inputs & INPUT_RIGHT and self.rect.right < SCREEN_WIDTH:
             self.rect.x += self.speed
-        if keys[pygame.K_UP] and self.rect.top > 0:
+        if inputs & INPUT_UP and self.rect.top > 0:
             self.rect.y -= self.speed
-        if keys[pygame.K_DOWN] and self.rect.bottom < SCREEN_HEIGHT:
+        if inputs & INPUT_DOWN and self.rect.bottom < SCREEN_HEIGHT:
             self.rect.y += self.speed
             
-        # Update invulnerability timer
-        if self.invulnerable and pygame.time.get_ticks() > self.invulnerable_time:
-            self.invulnerable = False
-            
-    def make_invulnerable(self, duration):
+    def make_invulnerable(self, timers, duration):
+        """Invulnerable for the next duration ticks of the timing wheel timers"""
+        if self.invulnerable_timer is not None:
+            self.invulnerable_timer.cancel()
         self.invulnerable = True
-        self.invulnerable_time = pygame.time.get_ticks() + duration
\ No newline at end of file
+        self.invulnerable_timer = timers.after(duration, self.end_invulnerable)
+        
+    def end_invulnerable(self):
+        self.invulnerable = False
+        self.invulnerable_timer = None
@@ -0,0 +1,60 @@
+# src/policies.py
+#
+# Bot policies for headless runs. A policy factory takes an RNG and returns a
+# function mapping a World to that tick's input bitmask.
+
+import importlib
+
+from inputs import INPUT_LEFT, INPUT_RIGHT, INPUT_UP, INPUT_DOWN, INPUT_FIRE
+
+def idle_policy(rng):
+    """Never moves or fires; a floor for balancing numbers"""
+    def policy(world):
+        return 0
+    return policy
+
+def random_policy(rng):
+    """Wander randomly and fire now and then"""
+    moves = [0, INPUT_LEFT, INPUT_RIGHT, INPUT_UP, INPUT_DOWN]
+    def policy(world):
+        inputs = rng.choice(moves)
+        if rng.random() < 0.2:
+            inputs |= INPUT_FIRE
+        return inputs
+    return policy
+
+def dodge_policy(rng, reload_ticks=8):
+    """Slide under the nearest enemy to shoot it, but sidestep anything about to land on us"""
+    def policy(world):
+        player = world.player.rect
+        inputs = 0
+        threat = target = None
+        for x, y in world.enemy_centers():
+            if y > player.top - 120 and abs(x - player.centerx) < 60:
+                if threat is None or y > threat[1]:
+                    threat = (x, y)
+            elif y < player.top and (target is None or abs(x - player.centerx) < abs(target[0] - player.centerx)):
+                target = (x, y)
+        if threat is not None:
+            inputs |= INPUT_LEFT if threat[0] >= player.centerx else INPUT_RIGHT
+        elif target is not None and abs(target[0] - player.centerx) > 8:
+            inputs |= INPUT_RIGHT if target[0] > player.centerx else INPUT_LEFT
+        if target is not None and abs(target[0] - player.centerx) < 30 and world.tick % reload_ticks == 0:
+            inputs |= INPUT_FIRE
+        return inputs
+    return policy
+
+POLICIES = {
+    "idle": idle_policy,
+    "random": random_policy,
+    "dodge": dodge_policy,
+}
+
+def get_policy(name):
+    """Look a policy factory up by name, or import one given as "module:function\""""
+    if name in POLICIES:
+        return POLICIES[name]
+    module, _, attr = name.partition(":")
+    if not attr:
+        raise ValueError(f"unknown policy {name!r}; use one of {', '.join(POLICIES)} or module:function")
+    return getattr(importlib.import_module(module), attr)
@@ -0,0 +1,135 @@
+# src/profiler.py
+
+import os
+import time
+from collections import deque
+
+import pygame
+
+from settings import PROFILER_ENABLED, PROFILER_HISTORY
+
+class FrameProfiler:
+    """Per-phase frame timings with rolling percentiles and file export.
+
+    Call begin_frame() (SceneManager does, before it pumps events), then
+    lap("phase") after each piece of work (the time since the previous lap is
+    charged to that phase; repeated phases in one frame add up), then
+    end_frame(); skip() leaves idle time out. Every method returns straight
+    away while the profiler is disabled, so it can stay wired in for release
+    builds.
+    """
+
+    def __init__(self, enabled=PROFILER_ENABLED, history=PROFILER_HISTORY):
+        self.enabled = enabled
+        self.show_overlay = False
+        self.records = deque(maxlen=history)
+        self.frame = 0
+        self.dropped_frames = 0
+        self.phases = {}
+        self.counts = {}
+        self._start = self._last = 0.0
+        self._idle = 0.0
+        self._overlay = None
+        self._overlay_frame = -1
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.phases = {}
+        self.counts = {}
+        self._start = self._last = time.perf_counter()
+        self._idle = 0.0
+
+    def skip(self):
+        """Leave the time since the last lap out of the frame, e.g. a sleep between frames"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._idle += now - self._last
+        self._last = now
+
+    def lap(self, phase):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    def count(self, name, value):
+        if self.enabled:
+            self.counts[name] = value
+
+    def end_frame(self, frame_seconds, budget_seconds):
+        """Store the frame; it counts as dropped if its interval overran the budget"""
+        if not self.enabled:
+            return
+        self.frame += 1
+        dropped = frame_seconds > budget_seconds * 1.5
+        if dropped:
+            self.dropped_frames += 1
+        record = {"frame": self.frame, "interval_ms": frame_seconds * 1000,
+                  "work_ms": (time.perf_counter() - self._start - self._idle) * 1000, "dropped": int(dropped)}
+        for phase, seconds in self.phases.items():
+            record[phase + "_ms"] = seconds * 1000
+        record.update(self.counts)
+        self.records.append(record)
+
+    def percentiles(self, key, points=(50, 95, 99)):
+        values = sorted(r[key] for r in self.records if key in r)
+        if not values:
+            return [0.0 for _ in points]
+        return [values[min(len(values) - 1, len(values) * p // 100)] for p in points]
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        if self.show_overlay and not self.enabled:
+            self.enabled = True
+            self.begin_frame()  # start timing from here rather than from zero
+
+    def draw_overlay(self, surface, font, refresh_every=15):
+        """Blit the percentile table; it is only re-rendered every refresh_every frames"""
+        if not self.show_overlay:
+            return
+        if self._overlay is None or self.frame - self._overlay_frame >= refresh_every:
+            self._overlay = self._render_overlay(font)
+            self._overlay_frame = self.frame
+        surface.blit(self._overlay, (10, 40))
+
+    def _render_overlay(self, font):
+        keys = ["work_ms"] + [phase + "_ms" for phase in self.phases]
+        lines = [f"{'phase':<12}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for key in keys:
+            p50, p95, p99 = self.percentiles(key)
+            lines.append(f"{key[:-3]:<12}{p50:7.2f}{p95:7.2f}{p99:7.2f}")
+        lines.append(f"dropped {self.dropped_frames}  " + "  ".join(f"{k} {v}" for k, v in self.counts.items()))
+        rendered = [font.render(line, True, (0, 255, 0)) for line in lines]
+        height = font.get_linesize()
+        overlay = pygame.Surface((max(r.get_width() for r in rendered) + 8, height * len(rendered) + 8), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 160))
+        for i, line in enumerate(rendered):
+            overlay.blit(line, (4, 4 + i * height))
+        return overlay
+
+    def export(self, path):
+        """Write the stored per-frame records as .json, or .csv for any other extension"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        records = list(self.records)
+        if path.endswith(".json"):
+            import json
+            with open(path, "w") as f:
+                json.dump(records, f)
+            return path
+        import csv
+        fields = []
+        for record in records:
+            fields.extend(k for k in record if k not in fields)
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(records)
+        return path
+
+# Shared by the game loop and World
+profiler = FrameProfiler()
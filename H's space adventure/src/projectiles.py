@@ -0,0 +1,225 @@
+# src/projectiles.py
+
+import math
+from itertools import repeat
+
+import numpy as np
+import pygame
+
+from masks import mask_for, mask_hits
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, ENEMY_BULLET_CAPACITY, ENEMY_BULLET_SPEED
+
+BULLET_SIZE = 8
+CULL_MARGIN = BULLET_SIZE
+
+_sprite = None
+
+def bullet_sprite():
+    """The one enemy bullet image every projectile is drawn with, built on first use"""
+    global _sprite
+    if _sprite is None:
+        _sprite = pygame.Surface((BULLET_SIZE, BULLET_SIZE))
+        _sprite.fill((0, 0, 0))
+        radius = BULLET_SIZE // 2
+        pygame.draw.circle(_sprite, (255, 0, 0), (radius, radius), radius)
+        pygame.draw.circle(_sprite, (255, 200, 200), (radius, radius), radius // 2)
+        _sprite.set_colorkey((0, 0, 0))
+        if pygame.display.get_surface() is not None:
+            _sprite = _sprite.convert()
+    return _sprite
+
+class ProjectilePool:
+    """Every live enemy bullet, kept packed at the front of preallocated arrays.
+
+    Positions are bullet centres in float32 so angled shots move smoothly.
+    Emitting writes straight into the arrays; bullets that leave the screen or
+    hit something are removed by compacting the survivors to the front, so
+    nothing is allocated per bullet. When the pool is full, new shots are
+    dropped and counted in self.dropped.
+
+    target is the point aimed emitters shoot at; World sets it to the
+    player's centre every tick.
+
+    Each bullet also gets a serial number in self.ids when it is emitted,
+    which stays with it through compaction, so netplay can tell bullets apart
+    between snapshots.
+    """
+
+    def __init__(self, capacity=ENEMY_BULLET_CAPACITY):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.prev_x = np.zeros(capacity, dtype=np.float32)
+        self.prev_y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.arrays = (self.x, self.y, self.prev_x, self.prev_y, self.vx, self.vy, self.ids)
+        self.count = 0
+        self.next_id = 0
+        self.dropped = 0
+        self.sprite = bullet_sprite()
+        self.target = (SCREEN_WIDTH // 2, SCREEN_HEIGHT)
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, x, y, angles, speed):
+        """Fire one bullet from (x, y) per angle (degrees, 0 = right, 90 = straight down)"""
+        angles = np.radians(np.asarray(angles, dtype=np.float32).reshape(-1))
+        start = self.count
+        room = self.capacity - start
+        if len(angles) > room:
+            self.dropped += len(angles) - room
+            angles = angles[:room]
+        end = start + len(angles)
+        self.x[start:end] = self.prev_x[start:end] = x
+        self.y[start:end] = self.prev_y[start:end] = y
+        self.vx[start:end] = np.cos(angles) * speed
+        self.vy[start:end] = np.sin(angles) * speed
+        self.ids[start:end] = np.arange(self.next_id, self.next_id + end - start)
+        self.next_id += end - start
+        self.count = end
+
+    def update(self):
+        n = self.count
+        if not n:
+            return
+        x, y = self.x[:n], self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        x += self.vx[:n]
+        y += self.vy[:n]
+        inside = ((x > -CULL_MARGIN) & (x < SCREEN_WIDTH + CULL_MARGIN)
+                  & (y > -CULL_MARGIN) & (y < SCREEN_HEIGHT + CULL_MARGIN))
+        if not inside.all():
+            self._keep(inside)
+
+    def collide_rect(self, rect, mask=None):
+        """Remove every bullet overlapping rect and return how many there were.
+
+        Given mask, the mask of the image drawn at rect, bullets passing the
+        rect test only count if their sprite's opaque pixels touch it.
+        """
+        n = self.count
+        if not n:
+            return 0
+        half = BULLET_SIZE / 2
+        x, y = self.x[:n], self.y[:n]
+        hit = ((x + half > rect.left) & (x - half < rect.right)
+               & (y + half > rect.top) & (y - half < rect.bottom))
+        if mask is not None and hit.any():
+            candidates = np.flatnonzero(hit)
+            xs = (x[candidates] - BULLET_SIZE // 2).astype(np.int32).tolist()
+            ys = (y[candidates] - BULLET_SIZE // 2).astype(np.int32).tolist()
+            touching = mask_hits(mask, rect.left, rect.top, mask_for(self.sprite), xs, ys)
+            hit[candidates[~np.array(touching)]] = False
+        hits = int(np.count_nonzero(hit))
+        if hits:
+            self._keep(~hit)
+        return hits
+
+    def _keep(self, mask):
+        keep = np.flatnonzero(mask)
+        count = len(keep)
+        for array in self.arrays:
+            array[:count] = array[keep]
+        self.count = count
+
+    def centers(self):
+        n = self.count
+        return list(zip(self.x[:n].astype(np.int32).tolist(), self.y[:n].astype(np.int32).tolist()))
+
+    def positions(self, alpha=1.0):
+        """Top-left x and y lists of every bullet's sprite, alpha of the way from its previous position"""
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        if alpha < 1.0:
+            px, py = self.prev_x[:n], self.prev_y[:n]
+            x = px + (x - px) * alpha
+            y = py + (y - py) * alpha
+        half = BULLET_SIZE // 2
+        return (x - half).astype(np.int32).tolist(), (y - half).astype(np.int32).tolist()
+
+    def draw(self, surface, alpha=1.0):
+        """Blit every bullet with the shared sprite"""
+        xs, ys = self.positions(alpha)
+        surface.blits(zip(repeat(self.sprite), zip(xs, ys)), False)
+
+# Emitters decide what one shot looks like. fire(pool, x, y) emits from (x, y);
+# angles are in degrees with 90 pointing straight down the screen.
+
+class Straight:
+    """One bullet in a fixed direction; the classic enemy shot"""
+
+    def __init__(self, angle=90, speed=ENEMY_BULLET_SPEED):
+        self.angle = angle
+        self.speed = speed
+
+    def fire(self, pool, x, y):
+        pool.emit(x, y, self.angle, self.speed)
+
+class Aimed:
+    """count bullets at the pool's target, fanned over arc degrees"""
+
+    def __init__(self, count=1, arc=0, speed=ENEMY_BULLET_SPEED):
+        self.count = count
+        self.arc = arc
+        self.speed = speed
+
+    def fire(self, pool, x, y):
+        tx, ty = pool.target
+        angle = math.degrees(math.atan2(ty - y, tx - x))
+        pool.emit(x, y, _fan(angle, self.count, self.arc), self.speed)
+
+class Spread:
+    """A fixed fan of count bullets over arc degrees around angle"""
+
+    def __init__(self, count=5, arc=60, angle=90, speed=ENEMY_BULLET_SPEED):
+        self.angles = _fan(angle, count, arc)
+        self.speed = speed
+
+    def fire(self, pool, x, y):
+        pool.emit(x, y, self.angles, self.speed)
+
+class Ring:
+    """count bullets evenly around a full circle"""
+
+    def __init__(self, count=24, speed=3, offset=0):
+        self.angles = offset + np.arange(count, dtype=np.float32) * (360 / count)
+        self.speed = speed
+
+    def fire(self, pool, x, y):
+        pool.emit(x, y, self.angles, self.speed)
+
+class Spiral:
+    """arms evenly spaced bullets that rotate by turn degrees every shot"""
+
+    def __init__(self, arms=3, turn=12, speed=3):
+        self.base = np.arange(arms, dtype=np.float32) * (360 / arms)
+        self.turn = turn
+        self.angle = 0
+        self.speed = speed
+
+    def fire(self, pool, x, y):
+        pool.emit(x, y, self.base + self.angle, self.speed)
+        self.angle = (self.angle + self.turn) % 360
+
+def _fan(angle, count, arc):
+    if count == 1:
+        return np.float32(angle)
+    return np.linspace(angle - arc / 2, angle + arc / 2, count, dtype=np.float32)
+
+def bullet_hell_emitter(rng):
+    """A random pattern, and how many ticks between its shots, for bullet-hell enemies"""
+    kind = rng.choice(["aimed", "spread", "ring", "spiral"])
+    if kind == "aimed":
+        return Aimed(count=3, arc=20, speed=4), rng.randint(20, 40)
+    if kind == "spread":
+        return Spread(count=7, arc=90, speed=4), rng.randint(20, 40)
+    if kind == "ring":
+        return Ring(count=36, speed=3, offset=rng.randint(0, 9)), rng.randint(30, 60)
+    return Spiral(arms=4, turn=rng.choice([-11, 11]), speed=3), 4
@@ -0,0 +1,126 @@
+# src/renderer.py
+
+import pygame
+
+from settings import RENDER_MODE, DIRTY_FLIP_THRESHOLD
+from display import get_display, present
+
+class Renderer:
+    """Frame presenter used by every screen, in "full" or "dirty" mode.
+
+    "full" redraws the background and starfield and flips the whole window each
+    frame, like the game always did. "dirty" caches the background with the
+    starfield frozen into it, erases only what was drawn last frame and sends
+    just the changed rects to display.update. It falls back to a full flip
+    when the changed area goes over DIRTY_FLIP_THRESHOLD of the screen.
+
+    Screens draw through blit()/blits(), so Group.draw(renderer) works. Anything
+    drawn straight onto renderer.surface must be reported with mark().
+
+    On the "texture" display backend (see display.py) blits of uploaded
+    sprites are handed to the Display to draw as textures, and later blits
+    of anything else go on its overlay so they stay on top. Dirty rects
+    don't apply there; every frame is presented whole.
+    """
+
+    def __init__(self, screen, background, stars=None, mode=RENDER_MODE, threshold=DIRTY_FLIP_THRESHOLD):
+        self.surface = screen
+        if isinstance(background, tuple):
+            color = background
+            background = pygame.Surface(screen.get_size())
+            background.fill(color)
+        self.background = background
+        self.stars = stars
+        self.mode = mode
+        self.threshold = threshold
+        self.screen_area = screen.get_width() * screen.get_height()
+        self.cached_background = None
+        self.dirty = []
+        self.last_dirty = []
+        self.full_redraw = True
+        self.full_frames = 0
+        self.dirty_frames = 0
+        display = get_display()
+        self.display = display if display is not None and display.textured and display.surface is screen else None
+        self.over = False  # sprites queued this frame, so later blits go on the overlay
+
+    def invalidate(self):
+        """Force a full redraw next frame, e.g. when a screen becomes active again"""
+        self.full_redraw = True
+
+    def begin(self, seconds=None):
+        """Start a frame; seconds is the frame time the starfield scrolls by (default 1/FPS)"""
+        if self.display is not None:
+            self.display.begin()
+            self.over = False
+        if self.mode != "dirty" or self.display is not None:
+            self.surface.blit(self.background, (0, 0))
+            if self.stars is not None:
+                if seconds is None:
+                    self.stars.update()
+                else:
+                    self.stars.update(seconds)
+                self.stars.draw(self.surface)
+            return
+
+        if self.full_redraw or self.cached_background is None:
+            self.cached_background = self.background.copy()
+            if self.stars is not None:
+                self.stars.draw(self.cached_background)
+            self.surface.blit(self.cached_background, (0, 0))
+            self.last_dirty = []
+        else:
+            for rect in self.dirty:
+                self.surface.blit(self.cached_background, rect, rect)
+            self.last_dirty = self.dirty
+        self.dirty = []
+
+    def blit(self, image, dest, area=None, special_flags=0):
+        if self.display is not None:
+            return self._route(((image, dest, area),))[0]
+        rect = self.surface.blit(image, dest, area, special_flags)
+        self.dirty.append(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=1):
+        if self.display is not None:
+            rects = self._route(blit_sequence)
+            return rects if doreturn else None
+        rects = self.surface.blits(blit_sequence, True)
+        self.dirty.extend(rects)
+        return rects if doreturn else None
+
+    def _route(self, blit_sequence):
+        """Texture backend: queue uploaded sprites, blit the rest onto the surface
+        or, once sprites are queued this frame, the overlay above them"""
+        display = self.display
+        textures = display.textures
+        rects = []
+        for image, dest, *area in blit_sequence:
+            area = area[0] if area else None
+            if image in textures:
+                rects.append(display.queue(image, dest, area))
+                self.over = True
+            elif self.over:
+                rects.append(display.draw_over(image, dest, area))
+            else:
+                rects.append(self.surface.blit(image, dest, area))
+        return rects
+
+    def mark(self, rect):
+        self.dirty.append(pygame.Rect(rect))
+
+    def present(self):
+        if self.mode != "dirty" or self.full_redraw or self.display is not None:
+            self.full_redraw = False
+            self.full_frames += 1
+            present()
+            return
+
+        rects = self.last_dirty + self.dirty
+        if sum(r.width * r.height for r in rects) > self.threshold * self.screen_area:
+            self.full_frames += 1
+            present()
+        else:
+            self.dirty_frames += 1
+            present(rects)
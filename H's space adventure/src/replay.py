@@ -0,0 +1,155 @@
+# src/replay.py
+
+import os
+import struct
+import time
+from collections import namedtuple
+
+from settings import REPLAY_KEEP
+
+# File layout (little-endian):
+#   magic "H2RP", version u8, seed u64, ticks u32, final score u32, final health i32,
+#   bullet hell u8, enemy backend u8, collision mode u8, waves path length u16,
+#   the waves path in UTF-8, then (run length varint, input bitmask u8) pairs
+#   until end of file
+MAGIC = b"H2RP"
+VERSION = 5  # bumped whenever World rules change, so old replays are refused
+HEADER = struct.Struct("<4sBQIIiBBBH")
+ENEMY_BACKENDS = ("sprites", "numpy")
+COLLISION_MODES = ("rect", "mask")
+
+Replay = namedtuple("Replay", "seed ticks score health runs bullet_hell enemy_backend collision_mode waves_path")
+
+class ReplayRecorder:
+    """Collects one input bitmask per World tick, run-length encoded as it goes"""
+
+    def __init__(self, seed):
+        self.seed = seed
+        self.runs = []  # [inputs, count] pairs
+        self.ticks = 0
+
+    def record(self, inputs):
+        self.ticks += 1
+        if self.runs and self.runs[-1][0] == inputs:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([inputs, 1])
+
+    def save(self, path, world, keep=REPLAY_KEEP):
+        """Write the recording with world's final score and health to check playback against,
+        then delete all but the newest keep replays in its directory"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(encode(Replay(self.seed, self.ticks, world.score, world.health, self.runs, world.bullet_hell,
+                                  world.enemy_backend, world.collision_mode, world.waves_path)))
+        if keep:
+            prune(directory or ".", keep)
+        return path
+
+def _varint(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return out
+
+def encode(replay):
+    waves_path = replay.waves_path.encode("utf-8")
+    data = bytearray(HEADER.pack(MAGIC, VERSION, replay.seed, replay.ticks, replay.score, replay.health,
+                                 bool(replay.bullet_hell), ENEMY_BACKENDS.index(replay.enemy_backend),
+                                 COLLISION_MODES.index(replay.collision_mode), len(waves_path)))
+    data += waves_path
+    for inputs, count in replay.runs:
+        data += _varint(count)
+        data.append(inputs)
+    return bytes(data)
+
+def decode(data):
+    if len(data) < HEADER.size or data[:4] != MAGIC or data[4] != VERSION:
+        raise ValueError("not a replay file, or an unsupported version")
+    _, _, seed, ticks, score, health, bullet_hell, backend, collision, length = HEADER.unpack_from(data)
+    pos = HEADER.size + length
+    waves_path = data[HEADER.size:pos].decode("utf-8")
+    runs = []
+    while pos < len(data):
+        count = shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            count |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                break
+        runs.append((data[pos], count))
+        pos += 1
+    return Replay(seed, ticks, score, health, runs, bool(bullet_hell), ENEMY_BACKENDS[backend],
+                  COLLISION_MODES[collision], waves_path)
+
+def load(path):
+    with open(path, "rb") as f:
+        return decode(f.read())
+
+def replay_path(directory, seed):
+    return os.path.join(directory, time.strftime("%Y%m%d-%H%M%S") + f"-{seed}.rpl")
+
+def prune(directory, keep):
+    """Delete the oldest replays in directory beyond keep; names start with their timestamp"""
+    names = sorted(name for name in os.listdir(directory) if name.endswith(".rpl"))
+    for name in names[:-keep]:
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError:
+            pass
+
+def playback_world(replay):
+    """A headless World set up the way the recorded one was"""
+    from world import create_headless_world
+    world = create_headless_world(replay.seed, replay.enemy_backend, overrides={"WAVES_PATH": replay.waves_path},
+                                  bullet_hell=replay.bullet_hell)
+    world.collision_mode = replay.collision_mode
+    return world
+
+def play(replay, world):
+    """Feed the recorded inputs through world (from playback_world) as fast as possible.
+
+    Returns a list of mismatches between the recorded and replayed final state;
+    an empty list means the run reproduced exactly.
+    """
+    for inputs, count in replay.runs:
+        for _ in range(count):
+            world.step(inputs)
+    problems = []
+    for name, expected, actual in (("ticks", replay.ticks, world.tick),
+                                   ("score", replay.score, world.score),
+                                   ("health", replay.health, world.health)):
+        if expected != actual:
+            problems.append(f"{name}: recorded {expected}, replayed {actual}")
+    return problems
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Play replays back headless and check they reproduce")
+    parser.add_argument("files", nargs="+")
+    args = parser.parse_args()
+
+    failures = 0
+    total_ticks = 0
+    started = time.perf_counter()
+    for path in args.files:
+        replay = load(path)
+        problems = play(replay, playback_world(replay))
+        total_ticks += replay.ticks
+        if problems:
+            failures += 1
+            print(f"FAIL {path}: " + "; ".join(problems))
+        else:
+            print(f"ok   {path} ({replay.ticks} ticks, score {replay.score})")
+    elapsed = time.perf_counter() - started
+    print(f"{len(args.files) - failures}/{len(args.files)} reproduced, {total_ticks / elapsed:.0f} ticks/sec")
+    raise SystemExit(1 if failures else 0)
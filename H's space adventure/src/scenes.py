@@ -0,0 +1,187 @@
+# src/scenes.py
+
+import time
+
+import pygame
+
+from settings import FPS, IDLE_AFTER
+from display import get_display, present
+from profiler import profiler
+
+# Events that count as someone using the game, for idle throttling
+INPUT_EVENTS = (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN,
+                pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL, pygame.JOYBUTTONDOWN, pygame.JOYAXISMOTION)
+
+class Scene:
+    """One screen of the game, run by a SceneManager.
+
+    fps is how often the scene is drawn while nothing happens: None draws
+    only after an event set self.redraw (the manager sleeps in
+    pygame.event.wait meanwhile), 0 draws as fast as possible. idle_fps takes
+    over after IDLE_AFTER seconds without input.
+
+    handle() gets every event as it arrives; update(seconds) and draw() run
+    once per frame. Scenes move on through self.manager (push, pop, switch,
+    quit); exit() is called when a scene leaves the stack.
+    """
+
+    fps = None
+    idle_fps = None
+
+    def __init__(self):
+        self.manager = None
+        self.redraw = True
+
+    def enter(self):
+        """Called each time the scene becomes the top of the stack"""
+        self.redraw = True
+
+    def exit(self):
+        pass
+
+    def handle(self, event):
+        pass
+
+    def update(self, seconds):
+        pass
+
+    def draw(self):
+        pass
+
+    def run(self):
+        """Run this scene on its own until it quits; returns what it quit with"""
+        return SceneManager(self).run()
+
+class SceneManager:
+    """Scene stack with the one frame loop every screen shares.
+
+    Only the top scene gets events and frames. Between frames the manager
+    blocks in pygame.event.wait until the next frame is due or an event
+    comes in, instead of spinning or redrawing a screen nobody is touching.
+    """
+
+    def __init__(self, scene=None):
+        self.stack = []
+        self.result = None
+        self.frames = 0
+        self.waits = 0
+        self.last_input = time.perf_counter()
+        if scene is not None:
+            self.push(scene)
+
+    @property
+    def scene(self):
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene):
+        scene.manager = self
+        self.stack.append(scene)
+        scene.enter()
+
+    def pop(self):
+        scene = self.stack.pop()
+        scene.exit()
+        if self.stack:
+            self.stack[-1].enter()
+        return scene
+
+    def switch(self, scene):
+        """Replace the top scene"""
+        self.stack.pop().exit()
+        self.push(scene)
+
+    def quit(self, result=None):
+        """Empty the stack, which ends run(); run() returns result"""
+        self.result = result
+        while self.stack:
+            self.stack.pop().exit()
+
+    def frame_rate(self, scene, now):
+        return scene.fps if now - self.last_input < IDLE_AFTER else scene.idle_fps
+
+    def run(self):
+        clock = time.perf_counter
+        last = next_frame = clock()
+        frame_begun = False
+        while self.stack:
+            scene = self.stack[-1]
+            fps = self.frame_rate(scene, clock())
+
+            # A profiled frame starts here, so its "events" lap covers pumping
+            # and handling every event since the last frame was drawn
+            if not frame_begun:
+                profiler.begin_frame()
+                frame_begun = True
+            events = pygame.event.get()
+            if not events and not scene.redraw:
+                profiler.lap("events")
+                # Nothing to do yet: sleep until the next frame or the next event
+                if fps is None:
+                    events = [pygame.event.wait()]
+                    self.waits += 1
+                else:
+                    wait_ms = int((next_frame - clock()) * 1000)
+                    if wait_ms > 0:
+                        self.waits += 1
+                        event = pygame.event.wait(wait_ms)
+                        if event.type != pygame.NOEVENT:
+                            events = [event]
+                profiler.skip()  # the sleep isn't frame work
+
+            for event in events:
+                if event.type in INPUT_EVENTS:
+                    self.last_input = clock()
+                # With the texture display backend the game window isn't the
+                # display module's, so closing it only sends WINDOWCLOSE
+                if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
+                    self.quit("quit")
+                    break
+                scene.handle(event)
+                if self.scene is not scene:
+                    break
+            if self.scene is not scene:
+                last = next_frame = clock()
+                frame_begun = False
+                continue
+
+            now = clock()
+            if scene.redraw or (fps is not None and now >= next_frame):
+                scene.update(now - last)
+                last = now
+                frame_begun = False
+                if self.scene is not scene:
+                    next_frame = now
+                    continue
+                scene.draw()
+                scene.redraw = False
+                self.frames += 1
+                next_frame = max(next_frame + 1.0 / fps, now) if fps else now
+        return self.result
+
+class Flash(Scene):
+    """Timed transition: the screen flashes a color for duration seconds, then next takes over"""
+
+    fps = FPS
+    idle_fps = FPS
+
+    def __init__(self, screen, next_scene, duration=0.4, color=(255, 255, 255)):
+        super().__init__()
+        self.screen = screen
+        self.next_scene = next_scene
+        self.duration = duration
+        self.color = color
+        self.elapsed = 0.0
+
+    def update(self, seconds):
+        self.elapsed += seconds
+        if self.elapsed >= self.duration:
+            self.manager.switch(self.next_scene)
+
+    def draw(self):
+        # Start the frame through the display, or the texture backend keeps
+        # showing the HUD last drawn on its overlay
+        display = get_display()
+        if display is not None:
+            display.begin()
+        self.screen.fill(self.color)
+        present()
@@ -0,0 +1,157 @@
+# src/scheduler.py
+
+class Timer:
+    """Handle for one scheduled callback; cancel() stops it from firing"""
+
+    __slots__ = ("due", "callback", "args", "active")
+
+    def __init__(self, due, callback, args):
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+    def cancel(self):
+        self.active = False
+
+class TimingWheel:
+    """"Call this at tick N" scheduler on hierarchical timing wheels.
+
+    Level 0 has one slot per tick for the next 2**bits ticks, level 1 one slot
+    per 2**bits ticks, and so on up to 2**(bits * levels) ticks ahead; later
+    timers wait in an overflow list. A timer due within 2**bits ticks goes
+    straight into level 0, anything later into the lowest level that covers
+    the block its due tick is in, and whenever a level's slot comes round its
+    timers are moved down a level. advance() therefore only touches
+    the timers that expire this tick plus the ones being cascaded, however
+    many entities have timers pending. Cancelling just marks the timer; it is
+    dropped when its slot comes round.
+
+    Timers due on the same tick fire in the order they were scheduled, so a
+    seeded World replays the same way every time.
+    """
+
+    def __init__(self, bits=8, levels=3, tick=0):
+        self.bits = bits
+        self.levels = levels
+        self.mask = (1 << bits) - 1
+        self.wheels = [[[] for _ in range(1 << bits)] for _ in range(levels)]
+        self.overflow = []
+        self.tick = tick  # the last tick advance() ran
+        self.pending = 0
+        self.fired = 0
+        self.cascaded = 0
+
+    def __len__(self):
+        """Timers scheduled and not yet fired, cancelled ones included until they are dropped"""
+        return self.pending
+
+    def at(self, tick, callback, *args):
+        """Call callback(*args) during advance() to tick (the next advance if tick has passed)"""
+        timer = Timer(tick if tick > self.tick else self.tick + 1, callback, args)
+        self._place(timer)
+        self.pending += 1
+        return timer
+
+    def after(self, delay, callback, *args):
+        """Call callback(*args) delay ticks from now"""
+        timer = Timer(self.tick + (delay if delay > 0 else 1), callback, args)
+        self._place(timer)
+        self.pending += 1
+        return timer
+
+    def _place(self, timer):
+        due, tick, mask = timer.due, self.tick, self.mask
+        if due - tick <= mask:
+            # Every slot of level 0 comes round once in the next 2**bits ticks
+            self.wheels[0][due & mask].append(timer)
+            return
+        bits = self.bits
+        for level in range(1, self.levels):
+            shift = bits * (level + 1)
+            if due >> shift == tick >> shift:
+                self.wheels[level][(due >> (bits * level)) & mask].append(timer)
+                return
+        self.overflow.append(timer)
+
+    def advance(self, tick):
+        """Run every timer due up to and including tick"""
+        while self.tick < tick:
+            self.tick += 1
+            self._cascade()
+            index = self.tick & self.mask
+            slot = self.wheels[0][index]
+            self.wheels[0][index] = []
+            self.pending -= len(slot)
+            for timer in slot:
+                if timer.active:
+                    timer.active = False
+                    self.fired += 1
+                    timer.callback(*timer.args)
+
+    def _cascade(self):
+        """Move the timers of every level whose slot starts at this tick down a level"""
+        tick, bits, mask = self.tick, self.bits, self.mask
+        if tick & mask:
+            return
+        # Find the highest level whose slot boundary this is, then cascade from there down
+        level = 1
+        while level < self.levels and not (tick >> (bits * level)) & mask:
+            level += 1
+        if level == self.levels:
+            timers, self.overflow = self.overflow, []
+            self._replace(timers)
+            level -= 1
+        while level >= 1:
+            wheel = self.wheels[level]
+            index = (tick >> (bits * level)) & mask
+            timers, wheel[index] = wheel[index], []
+            self._replace(timers)
+            level -= 1
+
+    def _replace(self, timers):
+        for timer in timers:
+            if timer.active:
+                self.cascaded += 1
+                self._place(timer)
+            else:
+                self.pending -= 1
+
+if __name__ == "__main__":
+    import argparse
+    import random
+    import time
+    parser = argparse.ArgumentParser(description="Compare the timing wheel with ticking a counter per entity")
+    parser.add_argument("--entities", type=int, default=10000)
+    parser.add_argument("--ticks", type=int, default=3600)
+    args = parser.parse_args()
+
+    # Every entity fires every 60-120 ticks, like enemy shots
+    rng = random.Random(0)
+    delays = [rng.randint(60, 120) for _ in range(args.entities)]
+
+    fired = [0]
+    counters = [0] * args.entities
+    started = time.perf_counter()
+    for _ in range(args.ticks):
+        for i, delay in enumerate(delays):
+            counters[i] += 1
+            if counters[i] >= delay:
+                counters[i] = 0
+                fired[0] += 1
+    counted = time.perf_counter() - started
+    counter_fired, fired[0] = fired[0], 0
+
+    wheel = TimingWheel()
+    def fire(delay):
+        fired[0] += 1
+        wheel.after(delay, fire, delay)
+    for delay in delays:
+        wheel.after(delay, fire, delay)
+    started = time.perf_counter()
+    wheel.advance(args.ticks)
+    wheeled = time.perf_counter() - started
+
+    print(f"{args.entities} entities, {args.ticks} ticks")
+    print(f"  per-entity counters {counted / args.ticks * 1e6:8.1f} us/tick ({counter_fired} fired)")
+    print(f"  timing wheel        {wheeled / args.ticks * 1e6:8.1f} us/tick ({fired[0]} fired, {wheel.cascaded} cascaded)")
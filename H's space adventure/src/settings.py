@@ -8,6 +8,20 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 640
 FPS = 60
 
+# Simulation ticks per second (all speeds are per tick) and the game screen's
+# render cap, which can differ; 0 leaves rendering uncapped
+TICK_RATE = 60
+RENDER_FPS = 60
+# Most ticks simulated in one frame before the game slows down instead
+MAX_CATCHUP_STEPS = 5
+
+# Menu screens only animate the starfield, so they draw at MENU_FPS, and at
+# IDLE_FPS once nobody has touched anything for IDLE_AFTER seconds (None
+# freezes them until the next input event)
+MENU_FPS = 30
+IDLE_FPS = 10
+IDLE_AFTER = 10
+
 # Player settings
 PLAYER_SPEED = 8
 PLAYER_BULLET_SPEED = -8
@@ -17,7 +31,93 @@ PLAYER_SIZE = (64, 64)
 
 # Enemy settings
 ENEMY_SPEED = 2
-ENEMY_SPAWN_RATE = 40  # frames
+
+# Wave timeline enemies spawn from (format in waves.py); the default spawns
+# one enemy every 36 ticks, the pace the old fixed spawn rate gave
+WAVES_PATH = "assets/waves.json"
+
+# Enemy fire: every enemy bullet lives in one preallocated pool (shots past its
+# capacity are dropped). BULLET_HELL gives each enemy an aimed, spread, ring or
+# spiral pattern instead of the single straight shot
+ENEMY_BULLET_SPEED = 5
+ENEMY_BULLET_CAPACITY = 32768
+BULLET_HELL = False
+
+# Collision broadphase grid cell size in pixels (about one enemy sprite)
+COLLISION_CELL_SIZE = 64
+
+# "mask" tests hits against the images' opaque pixels (after a rect prefilter);
+# "rect" counts any overlap of the image rects, transparent corners included
+COLLISION_MODE = "mask"
+
+# "sprites" for one Enemy sprite each, "numpy" for the vectorized EnemySwarm
+ENEMY_BACKEND = "sprites"
+
+# Every gameplay sprite packed into one surface (rebuild with python src/atlas.py);
+# without the file, or with USE_ATLAS off, the separate PNGs are loaded instead
+ATLAS_PATH = "assets/images/sprites.atlas"
+USE_ATLAS = True
+
+# Max scaled/rotated sprite variants kept by transform_cache
+TRANSFORM_CACHE_SIZE = 256
+
+# Background starfield (shared by all screens; per-frame cost doesn't depend on it)
+STAR_COUNT = 100
+
+# "full" redraws and flips every frame; "dirty" only updates changed rects,
+# falling back to a flip when they cover more than the threshold share of the screen
+RENDER_MODE = "full"
+DIRTY_FLIP_THRESHOLD = 0.5
+
+# How the SCREEN_WIDTH x SCREEN_HEIGHT frame reaches the window (display.py):
+# "window" draws straight to it; "scaled" lets SDL stretch it to fit the
+# desktop (pygame's SCALED flag); "texture" presents it through
+# pygame._sdl2.video in a WINDOW_SIZE window, with sprites as textures.
+# RENDER_DRIVER picks SDL's renderer for the last two, e.g. "software" on a
+# machine without a GPU; None lets SDL choose
+DISPLAY_BACKEND = "window"
+WINDOW_SIZE = (1600, 1280)
+RENDER_DRIVER = None
+
+# Max rendered strings kept by text_cache
+TEXT_CACHE_SIZE = 128
+
+# Frame profiler: F3 shows the overlay (and turns profiling on), F4 exports
+# the stored frames to PROFILER_EXPORT_DIR as PROFILER_EXPORT_FORMAT
+PROFILER_ENABLED = False
+PROFILER_HISTORY = 3600  # frames kept for percentiles and export
+PROFILER_EXPORT_DIR = "profiles"
+PROFILER_EXPORT_FORMAT = "csv"  # or "json"
+
+# Run the World in a worker process (sim_worker.py) that shares its snapshots
+# with the render loop through shared memory, so the two use separate cores
+SIM_PROCESS = False
+
+# Two-cabinet co-op over UDP (netplay.py): start one with python src/main.py
+# --host and the other with --join HOST. The host runs the World and sends
+# NET_SNAPSHOT_RATE snapshots a second, positions rounded to NET_POSITION_STEP
+# pixels; either side gives up after NET_TIMEOUT seconds without a packet
+NET_PORT = 50210
+NET_SNAPSHOT_RATE = 20
+NET_POSITION_STEP = 2
+NET_TIMEOUT = 5.0
+
+# Turn on to save every game's seed and per-tick inputs to REPLAY_DIR, keeping
+# the newest REPLAY_KEEP; play them back with python src/replay.py replays/*.rpl
+RECORD_REPLAYS = False
+REPLAY_DIR = "replays"
+REPLAY_KEEP = 50
+
+# Leaderboard: every finished game is appended to SCORES_DIR/scores.log and the
+# best LEADERBOARD_SIZE are indexed in top.json; a background thread batches the
+# writes and fsyncs at most every SCORE_FLUSH_INTERVAL seconds
+SCORES_DIR = "scores"
+LEADERBOARD_SIZE = 10
+SCORE_FLUSH_INTERVAL = 1.0
+
+# Mixer channels reserved per sound category (see voices.py); "shared" ones
+# take overflow from any category
+SOUND_CHANNELS = {"weapons": 2, "explosions": 4, "alerts": 1, "shared": 1}
 
 # Colors
 WHITE = (255, 255, 255)
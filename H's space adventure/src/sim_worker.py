@@ -0,0 +1,245 @@
+# src/sim_worker.py
+
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from settings import TICK_RATE, MAX_CATCHUP_STEPS, ENEMY_BULLET_CAPACITY, RECORD_REPLAYS, REPLAY_DIR
+
+# Shared memory layout, all little-endian int64 words unless noted:
+#   control   CONTROL_WORDS words: LATEST (buffer last published, -1 before the
+#             first), QUIT, and the input ring's HEAD, TAIL and DROPPED counts
+#   ring      RING_SIZE input bitmasks
+#   buffer 0  SEQ, HEADER_WORDS header words, then MAX_ENTITIES rows of five
+#   buffer 1  int32s: sprite id, previous x, previous y, x, y (sprite top-left)
+LATEST, QUIT, HEAD, TAIL, DROPPED = range(5)
+CONTROL_WORDS = 8
+RING_SIZE = 256
+
+# Header words. SHOTS, EXPLOSIONS and HITS count World sound events since the
+# start, so a reader that skips snapshots still hears every one
+(TICK, SCORE, HEALTH, MAX_HEALTH, GAME_OVER, COUNT, SEED, KILLS,
+ SHOTS, EXPLOSIONS, HITS, STEP_US) = range(12)
+HEADER_WORDS = 16
+EVENT_WORDS = {"shoot": SHOTS, "explosion": EXPLOSIONS, "hit": HITS}
+
+MAX_ENTITIES = ENEMY_BULLET_CAPACITY + 4096
+ROW = 5
+class SharedState:
+    """numpy views of the control words, input ring and both snapshot buffers in one shared memory block"""
+
+    def __init__(self, shm):
+        self.shm = shm
+        buf = shm.buf
+        self.control = np.ndarray(CONTROL_WORDS, np.int64, buf, 0)
+        self.ring = np.ndarray(RING_SIZE, np.int64, buf, CONTROL_WORDS * 8)
+        offset = (CONTROL_WORDS + RING_SIZE) * 8
+        self.seqs, self.headers, self.rows = [], [], []
+        for _ in range(2):
+            self.seqs.append(np.ndarray(1, np.int64, buf, offset))
+            self.headers.append(np.ndarray(HEADER_WORDS, np.int64, buf, offset + 8))
+            offset += (1 + HEADER_WORDS) * 8
+            self.rows.append(np.ndarray((MAX_ENTITIES, ROW), np.int32, buf, offset))
+            offset += MAX_ENTITIES * ROW * 4
+
+    @staticmethod
+    def size():
+        return (CONTROL_WORDS + RING_SIZE) * 8 + 2 * ((1 + HEADER_WORDS) * 8 + MAX_ENTITIES * ROW * 4)
+
+    def release(self):
+        # Views must go before the block can be closed
+        self.control = self.ring = None
+        self.seqs = self.headers = self.rows = None
+        self.shm.close()
+
+class SimProcess:
+    """A World ticking at TICK_RATE in its own process, seen through shared memory.
+
+    The worker writes each tick's snapshot (HUD values, then every entity's
+    sprite id and positions) into whichever of the two buffers is not the
+    latest, then publishes it. A buffer's SEQ is odd while it is being
+    written, so read() can tell a copy torn by the writer and fall back to
+    the other buffer or the previous snapshot instead of waiting.
+
+    send() puts input bitmasks on a single-producer, single-consumer ring:
+    the main process only moves HEAD, the worker only TAIL, so neither locks.
+    When the ring is full the input is dropped (and counted) rather than
+    blocking the frame. With record the worker saves a replay when it stops.
+    """
+
+    def __init__(self, seed=None, bullet_hell=False, record=RECORD_REPLAYS):
+        self.shm = shared_memory.SharedMemory(create=True, size=SharedState.size())
+        self.state = SharedState(self.shm)
+        self.state.control[:] = 0
+        self.state.control[LATEST] = -1
+        self.snapshot = None
+        self.torn = 0
+        # spawn, not fork: the parent has SDL's window and audio open
+        context = multiprocessing.get_context("spawn")
+        self.process = context.Process(target=run_worker, args=(self.shm.name, seed, bullet_hell, record),
+                                       name="sim-worker", daemon=True)
+        self.process.start()
+
+    def send(self, inputs):
+        control, ring = self.state.control, self.state.ring
+        head = int(control[HEAD])
+        if head - int(control[TAIL]) >= RING_SIZE:
+            control[DROPPED] += 1
+            return False
+        ring[head % RING_SIZE] = inputs
+        control[HEAD] = head + 1  # publish only after the slot is written
+        return True
+
+    def read(self):
+        """The newest complete snapshot as (header, rows) copies; the last one again if none could be read"""
+        state = self.state
+        for _ in range(2):
+            latest = int(state.control[LATEST])
+            if latest < 0:
+                break
+            seq = int(state.seqs[latest][0])
+            if seq & 1:
+                continue
+            header = state.headers[latest].copy()
+            rows = state.rows[latest][:header[COUNT]].copy()
+            if int(state.seqs[latest][0]) == seq:
+                self.snapshot = header, rows
+                break
+            self.torn += 1
+        return self.snapshot
+
+    def alive(self):
+        return self.process.is_alive()
+
+    def close(self):
+        if self.state is None:
+            return
+        self.state.control[QUIT] = 1
+        self.process.join(2)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.state.release()
+        self.state = None
+        self.shm.unlink()
+
+def write_snapshot(world, header, rows, ids, events):
+    """Fill one buffer from world: HUD header words, then one row per visible entity"""
+    n = 0
+    prev = world.prev_positions
+    sprites = []
+    for group in (world.player_group, world.bullets, world.enemies):
+        for sprite in group:
+            x, y = sprite.rect.topleft
+            x0, y0 = prev.get(sprite, (x, y))
+            sprites.append((ids.get(sprite.image, -1), x0, y0, x, y))
+    if sprites:
+        n = min(len(sprites), MAX_ENTITIES)
+        rows[:n] = sprites[:n]
+
+    swarm = world.swarm
+    if swarm is not None and swarm.size:
+        live = np.flatnonzero(swarm.alive[:swarm.size])[:MAX_ENTITIES - n]
+        k = len(live)
+        block = rows[n:n + k]
+        block[:, 0] = ids[swarm.image]
+        block[:, 1], block[:, 2] = swarm.prev_x[live], swarm.prev_y[live]
+        block[:, 3], block[:, 4] = swarm.x[live], swarm.y[live]
+        n += k
+
+    pool = world.projectiles
+    k = min(pool.count, MAX_ENTITIES - n)
+    if k:
+        from projectiles import BULLET_SIZE
+        half = BULLET_SIZE // 2
+        block = rows[n:n + k]
+        block[:, 0] = ids[pool.sprite]
+        block[:, 1], block[:, 2] = pool.prev_x[:k] - half, pool.prev_y[:k] - half
+        block[:, 3], block[:, 4] = pool.x[:k] - half, pool.y[:k] - half
+        n += k
+
+    explosions = [(ids.get(e.image, -1), *e.rect.topleft, *e.rect.topleft) for e in world.explosions]
+    k = min(len(explosions), MAX_ENTITIES - n)
+    if k:
+        rows[n:n + k] = explosions[:k]
+        n += k
+
+    header[:] = 0
+    header[TICK], header[SCORE], header[HEALTH] = world.tick, world.score, world.health
+    header[MAX_HEALTH], header[GAME_OVER], header[COUNT] = world.max_health, world.game_over, n
+    header[SEED], header[KILLS] = world.seed, world.kills
+    for event, word in EVENT_WORDS.items():
+        header[word] = events[event]
+
+def draw_snapshot(renderer, sources, rows, alpha):
+    """Blit snapshot rows, each alpha of the way from its previous to its current position.
+
+    sources[id] is the (surface, area) to blit for each sprite id.
+    """
+    xs = np.rint(rows[:, 1] + (rows[:, 3] - rows[:, 1]) * alpha).astype(int).tolist()
+    ys = np.rint(rows[:, 2] + (rows[:, 4] - rows[:, 2]) * alpha).astype(int).tolist()
+    renderer.blits([(sources[i][0], (x, y), sources[i][1])
+                    for i, x, y in zip(rows[:, 0].tolist(), xs, ys) if i >= 0], False)
+
+def run_worker(name, seed, bullet_hell, record=RECORD_REPLAYS):
+    """Worker process body: step a headless World at TICK_RATE, publishing a snapshot after every tick"""
+    import signal
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C is the main process's to handle
+    from world import create_headless_world, sprite_images
+    from replay import ReplayRecorder, replay_path
+    from inputs import INPUT_FIRE
+
+    shm = shared_memory.SharedMemory(name=name)
+    state = SharedState(shm)
+    control, ring = state.control, state.ring
+    world = create_headless_world(seed, bullet_hell=bullet_hell)
+    ids = {image: i for i, image in enumerate(sprite_images(
+        world.player.image, world.bullet_img, world.enemy_img, world.explosion_frames))}
+    recorder = ReplayRecorder(world.seed) if record else None
+    events = dict.fromkeys(EVENT_WORDS, 0)
+
+    dt = 1.0 / TICK_RATE
+    held = 0
+    next_tick = time.perf_counter()
+    try:
+        while not control[QUIT] and not world.game_over:
+            now = time.perf_counter()
+            if now < next_tick:
+                time.sleep(next_tick - now)
+                continue
+            # Don't try to catch up on more than a few ticks after a stall
+            next_tick = max(next_tick + dt, now - MAX_CATCHUP_STEPS * dt)
+
+            # Movement keys are whatever was held last; fire counts if it was
+            # pressed in any frame since the previous tick
+            fire = 0
+            head, tail = int(control[HEAD]), int(control[TAIL])
+            while tail < head:
+                held = int(ring[tail % RING_SIZE])
+                fire |= held
+                tail += 1
+            control[TAIL] = tail
+            inputs = (held & ~INPUT_FIRE) | (fire & INPUT_FIRE)
+            held &= ~INPUT_FIRE
+
+            started = time.perf_counter()
+            if recorder is not None:
+                recorder.record(inputs)
+            world.step(inputs)
+            for event in world.events:
+                if event in events:
+                    events[event] += 1
+
+            target = 1 - int(control[LATEST]) if control[LATEST] >= 0 else 0
+            seq = state.seqs[target]
+            seq[0] += 1  # odd: being written
+            header = state.headers[target]
+            write_snapshot(world, header, state.rows[target], ids, events)
+            header[STEP_US] = int((time.perf_counter() - started) * 1e6)
+            seq[0] += 1  # even: complete
+            control[LATEST] = target
+    finally:
+        if recorder is not None and recorder.ticks:
+            recorder.save(replay_path(REPLAY_DIR, world.seed), world)
+        state.release()
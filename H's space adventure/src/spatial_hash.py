@@ -0,0 +1,78 @@
+# src/spatial_hash.py
+
+class SpatialHash:
+    """Uniform grid broadphase for sprite collisions.
+
+    Sprites register into the cells their rect covers; a query only looks at
+    sprites sharing a cell with the query rect, so a collision pass costs about
+    O(bullets + enemies) instead of O(bullets * enemies). Results keep the
+    registration order so they match pygame.sprite.spritecollide on the group.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.order = {}
+
+    def clear(self):
+        self.cells.clear()
+        self.order.clear()
+
+    def insert(self, sprite):
+        self.order[sprite] = len(self.order)
+        size = self.cell_size
+        rect = sprite.rect
+        cells = self.cells
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = [sprite]
+                else:
+                    cell.append(sprite)
+
+    def rebuild(self, group):
+        """Re-register every sprite in group; call once per tick after movement"""
+        self.clear()
+        for sprite in group:
+            self.insert(sprite)
+
+    def candidates(self, rect):
+        """Registered sprites sharing a cell with rect, unordered and possibly dead"""
+        size = self.cell_size
+        cells = self.cells
+        x0, x1 = rect.left // size, (rect.right - 1) // size
+        y0, y1 = rect.top // size, (rect.bottom - 1) // size
+        if x0 == x1 and y0 == y1:
+            return cells.get((x0, y0), ())
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return found
+
+    def query(self, rect):
+        """Live registered sprites sharing a cell with rect, in registration order"""
+        return self._ordered([s for s in self.candidates(rect) if s.alive()])
+
+    def spritecollide(self, sprite, dokill, collided=None):
+        """Drop-in for pygame.sprite.spritecollide against the registered sprites"""
+        rect = sprite.rect
+        if collided is None:
+            hits = [s for s in self.candidates(rect) if rect.colliderect(s.rect)]
+        else:
+            hits = [s for s in self.candidates(rect) if collided(sprite, s)]
+        if not hits:
+            return hits
+        hits = self._ordered([s for s in hits if s.alive()])
+        if dokill:
+            for s in hits:
+                s.kill()
+        return hits
+
+    def _ordered(self, sprites):
+        if len(sprites) > 1:
+            sprites.sort(key=self.order.__getitem__)
+        return sprites
@@ -0,0 +1,56 @@
+# src/starfield.py
+
+import random
+import pygame
+
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, STAR_COUNT, FPS, WHITE, BLACK
+
+# (share of stars, scroll speed in px per 1/FPS s, radius) per parallax layer, far to near
+STAR_LAYERS = [
+    (0.5, 0.5, 1),
+    (0.3, 1.0, 2),
+    (0.2, 2.0, 3),
+]
+
+class Starfield:
+    """Scrolling parallax starfield pre-rendered into one tile per layer.
+
+    Stars are drawn once at construction; each frame only scrolls the layers,
+    so drawing costs two blits per layer however many stars there are.
+    """
+
+    def __init__(self, star_count=STAR_COUNT, seed=2100, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        rng = random.Random(seed)
+        self.height = height
+        self.layers = []
+        for share, speed, size in STAR_LAYERS:
+            tile = pygame.Surface((width, height))
+            tile.fill(BLACK)
+            for _ in range(int(star_count * share)):
+                x, y = rng.randint(0, width), rng.randint(0, height)
+                # Repeat stars across the top/bottom seam so the tile wraps cleanly
+                for wrap in (-height, 0, height):
+                    pygame.draw.circle(tile, WHITE, (x, y + wrap), size)
+            # Mostly-transparent layers blit fastest as RLE colorkey surfaces
+            tile.set_colorkey(BLACK, pygame.RLEACCEL)
+            self.layers.append([tile, speed, 0.0])
+
+    def update(self, seconds=1.0 / FPS):
+        frames = seconds * FPS
+        for layer in self.layers:
+            layer[2] = (layer[2] + layer[1] * frames) % self.height
+
+    def draw(self, surface):
+        for tile, _, offset in self.layers:
+            y = int(offset)
+            surface.blit(tile, (0, y))
+            surface.blit(tile, (0, y - self.height))
+
+_starfield = None
+
+def get_starfield():
+    """The starfield shared by every screen, so switching screens doesn't reseed it"""
+    global _starfield
+    if _starfield is None:
+        _starfield = Starfield()
+    return _starfield
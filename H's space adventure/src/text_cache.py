@@ -0,0 +1,75 @@
+# src/text_cache.py
+
+from collections import OrderedDict
+
+from settings import TEXT_CACHE_SIZE
+
+class TextCache:
+    """LRU of rendered strings keyed by (font, text, antialias, color).
+
+    Static labels are rasterized once and then reused; only strings that were
+    never seen (or were evicted) reach font.render.
+    """
+
+    def __init__(self, maxsize=TEXT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        key = (font, text, antialias, tuple(color))
+        image = self.entries.get(key)
+        if image is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return image
+        self.misses += 1
+        image = font.render(text, antialias, color)
+        self.entries[key] = image
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return image
+
+    def stats(self):
+        return {"size": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+# Process-wide cache shared by every screen
+cache = TextCache()
+
+def render_text(font, text, antialias, color):
+    return cache.render(font, text, antialias, color)
+
+class GlyphAtlas:
+    """Per-character glyphs for text that changes every frame, like the score.
+
+    A fixed label is rendered once through the text cache and the changing part
+    is composed from cached glyph surfaces, so a new score costs a few blits
+    rather than a font.render call and a fresh surface.
+    """
+
+    def __init__(self, font, antialias, color, chars="0123456789-"):
+        self.font = font
+        self.antialias = antialias
+        self.color = color
+        self.glyphs = {}
+        for char in chars:
+            self.glyph(char)
+
+    def glyph(self, char):
+        image = self.glyphs.get(char)
+        if image is None:
+            image = self.glyphs[char] = self.font.render(char, self.antialias, self.color)
+        return image
+
+    def draw(self, surface, label, value, pos):
+        """Blit label (cached whole) followed by str(value) glyph by glyph; returns the rects"""
+        x, y = pos
+        head = render_text(self.font, label, self.antialias, self.color)
+        blits = [(head, (x, y))]
+        x += head.get_width()
+        for char in str(value):
+            image = self.glyph(char)
+            blits.append((image, (x, y)))
+            x += image.get_width()
+        return surface.blits(blits)
@@ -0,0 +1,33 @@
+# src/timestep.py
+
+from settings import TICK_RATE, MAX_CATCHUP_STEPS
+
+class FixedTimestep:
+    """Accumulator that turns variable frame times into fixed simulation ticks.
+
+    Each frame, advance() adds the frame's duration and says how many ticks to
+    run; alpha is how far the leftover time reaches into the next tick, for
+    interpolating what gets drawn. At most max_steps ticks run per frame and
+    any backlog past that is dropped, so one slow frame can't snowball.
+    """
+
+    def __init__(self, tick_rate=TICK_RATE, max_steps=MAX_CATCHUP_STEPS):
+        self.dt = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped_ticks = 0
+
+    def advance(self, frame_seconds):
+        self.accumulator += frame_seconds
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            self.dropped_ticks += steps - self.max_steps
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.dt
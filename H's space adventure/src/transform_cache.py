@@ -0,0 +1,66 @@
+# src/transform_cache.py
+
+from collections import OrderedDict
+
+import pygame
+
+from settings import TRANSFORM_CACHE_SIZE
+
+class TransformCache:
+    """Bounded LRU of scaled/rotated/flipped copies of source surfaces.
+
+    Keyed by (source surface, scale, rotation, flip), so every sprite asking for
+    the same variant shares one surface instead of allocating its own.
+    Variants made ahead of time (the texture atlas's) can be pinned: they are
+    returned like any hit and never evicted.
+    """
+
+    def __init__(self, maxsize=TRANSFORM_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.pinned = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, surface, scale=1.0, rotation=0, flip=(False, False)):
+        key = (surface, scale, rotation % 360, flip[0], flip[1])
+        image = self.pinned.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+        image = self.entries.get(key)
+        if image is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return image
+
+        self.misses += 1
+        image = surface
+        if flip[0] or flip[1]:
+            image = pygame.transform.flip(image, flip[0], flip[1])
+        if scale != 1.0:
+            image = pygame.transform.scale(image, (int(surface.get_width() * scale), int(surface.get_height() * scale)))
+        if rotation % 360:
+            image = pygame.transform.rotate(image, rotation)
+        self.entries[key] = image
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return image
+
+    def pin(self, surface, scale, image, rotation=0, flip=(False, False)):
+        """Serve image for this variant of surface from now on"""
+        self.pinned[(surface, scale, rotation % 360, flip[0], flip[1])] = image
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        return {"size": len(self.entries), "pinned": len(self.pinned), "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+# Process-wide cache shared by every sprite
+cache = TransformCache()
+
+def transformed(surface, scale=1.0, rotation=0, flip=(False, False)):
+    return cache.get(surface, scale, rotation, flip)
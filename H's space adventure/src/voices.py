@@ -0,0 +1,113 @@
+# src/voices.py
+
+import pygame
+
+from settings import SOUND_CHANNELS
+from assets import assets
+
+# World event -> (sound file, category, priority, minimum ticks between plays).
+# Higher priority voices can take over lower ones when a category is full.
+SOUND_EVENTS = {
+    "shoot": ("assets/sounds/shoot.wav", "weapons", 1, 4),
+    "explosion": ("assets/sounds/explosion.wav", "explosions", 2, 3),
+    "hit": ("assets/sounds/hit.wav", "alerts", 3, 10),
+}
+
+class VoiceManager:
+    """Plays World sound events on a fixed budget of mixer channels.
+
+    Each category gets its own channels (SOUND_CHANNELS), and the "shared"
+    ones overflow to any category. Per tick, an event only sounds once however
+    many times it fired (merged), and not again until its minimum interval
+    has passed (throttled). With every allowed channel busy, the voice with
+    the lowest priority, oldest first, is cut off for the new one if it
+    matters no more (stolen); otherwise the new sound is dropped.
+    """
+
+    def __init__(self, channels=SOUND_CHANNELS, events=SOUND_EVENTS):
+        total = sum(channels.values())
+        pygame.mixer.set_num_channels(max(total, pygame.mixer.get_num_channels()))
+        pygame.mixer.set_reserved(total)  # keep stray Sound.play() calls off our channels
+        self.channels = {}
+        index = 0
+        for category, count in channels.items():
+            self.channels[category] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            index += count
+        self.shared = self.channels.pop("shared", [])
+        self.events = events
+        self.sounds = {name: assets.sound(path) for name, (path, *_) in events.items()}
+        self.playing = {}  # channel -> (priority, tick started)
+        self.last_played = {}
+        self.tick = None
+        self.this_tick = set()
+        self.counters = {"played": 0, "merged": 0, "throttled": 0, "stolen": 0, "dropped": 0}
+
+    def play(self, event, tick):
+        """Sound a World event that happened on the given tick; returns whether it plays"""
+        if event not in self.events:
+            return False
+        if tick != self.tick:
+            self.tick = tick
+            self.this_tick.clear()
+        if event in self.this_tick:
+            self.counters["merged"] += 1
+            return False
+        self.this_tick.add(event)
+        _, category, priority, interval = self.events[event]
+        last = self.last_played.get(event)
+        if last is not None and tick - last < interval:
+            self.counters["throttled"] += 1
+            return False
+
+        candidates = self.channels.get(category, []) + self.shared
+        channel = next((c for c in candidates if not c.get_busy()), None)
+        if channel is None:
+            victim = min(candidates, key=lambda c: self.playing.get(c, (0, 0)), default=None)
+            if victim is None or self.playing.get(victim, (0, 0))[0] > priority:
+                self.counters["dropped"] += 1
+                return False
+            self.counters["stolen"] += 1
+            channel = victim
+        channel.play(self.sounds[event])
+        self.playing[channel] = (priority, tick)
+        self.last_played[event] = tick
+        self.counters["played"] += 1
+        return True
+
+    def busy(self):
+        """Voices sounding right now"""
+        return sum(c.get_busy() for group in (*self.channels.values(), self.shared) for c in group)
+
+    def stop(self):
+        for group in (*self.channels.values(), self.shared):
+            for channel in group:
+                channel.stop()
+        self.playing.clear()
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    import random
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from world import create_headless_world
+    from policies import get_policy
+    parser = argparse.ArgumentParser(description="Run a headless game through the voice manager and report its counters")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--ticks", type=int, default=3600)
+    parser.add_argument("--policy", default="dodge")
+    parser.add_argument("--bullet-hell", action="store_true")
+    args = parser.parse_args()
+
+    pygame.mixer.init()
+    world = create_headless_world(args.seed, bullet_hell=args.bullet_hell)
+    voices = VoiceManager()
+    policy = get_policy(args.policy)(random.Random(args.seed))
+    triggered = peak = 0
+    while world.tick < args.ticks and not world.game_over:
+        world.step(policy(world))
+        for event in world.events:
+            triggered += 1
+            voices.play(event, world.tick)
+        peak = max(peak, voices.busy())
+    print(f"{world.tick} ticks, {triggered} sound events, peak {peak} voices of {pygame.mixer.get_num_channels()}")
+    print("  " + "  ".join(f"{name} {count}" for name, count in voices.counters.items()))
@@ -0,0 +1,61 @@
+# src/waves.py
+
+import json
+
+from settings import SCREEN_WIDTH
+
+# Keys a wave may have, and their defaults
+WAVE_DEFAULTS = {"at": 0, "every": 1, "count": None, "group": 1, "x": None, "y": -50, "speed": None}
+
+class WaveTimeline:
+    """Enemy spawns read from a wave file rather than one fixed spawn rate.
+
+    The file holds {"waves": [...], "loop": ticks}. Each wave spawns its
+    first group on tick "at" and another every "every" ticks, "count" times
+    (for the rest of the game if left out). A group is "group" enemies at
+    y "y", each at the next of the "x" positions (taken in turn) or at a
+    random x, falling at "speed" (the World's enemy speed if left out).
+    With "loop", the whole timeline starts over every loop ticks.
+
+    Spawns run off the World's timing wheel, so a timeline costs nothing on
+    the ticks where it doesn't spawn.
+    """
+
+    def __init__(self, waves, loop=None):
+        self.waves = []
+        for wave in waves:
+            unknown = set(wave) - set(WAVE_DEFAULTS)
+            if unknown:
+                raise ValueError(f"unknown wave keys {', '.join(sorted(unknown))}")
+            self.waves.append({**WAVE_DEFAULTS, **wave})
+        self.loop = loop
+
+    def start(self, world, offset=0):
+        """Schedule the timeline on world.timers, shifted offset ticks later"""
+        for wave in self.waves:
+            world.timers.at(offset + wave["at"], self._spawn, world, wave, 0)
+        if self.loop:
+            world.timers.at(offset + self.loop, self.start, world, offset + self.loop)
+
+    def _spawn(self, world, wave, spawned):
+        xs = wave["x"]
+        for i in range(wave["group"]):
+            if xs:
+                x = xs[(spawned * wave["group"] + i) % len(xs)]
+            else:
+                x = world.rng.randint(30, SCREEN_WIDTH - 30)
+            world.spawn_enemy(x, wave["y"], wave["speed"])
+        spawned += 1
+        if wave["count"] is None or spawned < wave["count"]:
+            world.timers.after(wave["every"], self._spawn, world, wave, spawned)
+
+_timelines = {}
+
+def load_waves(path):
+    """The WaveTimeline in a wave file, read once per path"""
+    timeline = _timelines.get(path)
+    if timeline is None:
+        with open(path) as f:
+            data = json.load(f)
+        timeline = _timelines[path] = WaveTimeline(data["waves"], data.get("loop"))
+    return timeline
@@ -0,0 +1,345 @@
+# src/world.py
+
+import os
+import random
+import time
+from itertools import chain, repeat
+import pygame
+
+from settings import *
+from assets import assets
+from player import Player
+from bullet import Bullet
+from enemy import Enemy
+from spatial_hash import SpatialHash
+from masks import collide_mask, mask_for
+from projectiles import ProjectilePool, Straight, bullet_hell_emitter, bullet_sprite
+from transform_cache import transformed
+from profiler import profiler
+import enemy_swarm
+from inputs import INPUT_FIRE
+from scheduler import TimingWheel
+from waves import load_waves
+
+# Settings a World can override per instance, e.g. for batch balancing sweeps
+TUNABLE_SETTINGS = ("WAVES_PATH", "ENEMY_SPEED", "PLAYER_HEALTH", "PLAYER_BULLET_SPEED")
+
+# Explosion class for handling explosion animations; frames advance every
+# speed ticks off the World's timing wheel
+class Explosion(pygame.sprite.Sprite):
+    def __init__(self, x, y, frames, timers, scale=1.0, speed=5):
+        super().__init__()
+        # Scaled frames come from the shared transform cache, so explosions don't own copies
+        self.frames = [transformed(frame, scale) for frame in frames]
+        self.index = 0
+        self.image = self.frames[self.index]
+        self.rect = self.image.get_rect(center=(x, y))
+        self.speed = speed
+        self.timers = timers
+        timers.after(speed, self.next_frame)
+
+    def next_frame(self):
+        self.index += 1
+        if self.index >= len(self.frames):
+            self.kill()
+        else:
+            self.image = self.frames[self.index]
+            self.timers.after(self.speed, self.next_frame)
+
+def load_images():
+    """Load the sprite images the simulation needs (requires a display mode for convert_alpha).
+
+    With the texture atlas they are all views into its one surface.
+    """
+    atlas = assets.atlas()
+    if atlas is not None:
+        return atlas.image("player"), atlas.image("bullet"), atlas.image("enemy"), atlas.frames("explosion")
+    player_img = assets.image("assets/images/player.png")
+    bullet_img = assets.image("assets/images/bullet.png")
+    enemy_img = assets.image("assets/images/enemy.png")
+    frames = assets.sheet("assets/images/explosion.png", 64, 64)
+    return player_img, bullet_img, enemy_img, frames
+
+# The scales World draws explosions at, for the sprite table below
+EXPLOSION_SCALES = (1.5, 2)
+
+def sprite_images(player_img, bullet_img, enemy_img, explosion_frames):
+    """Every image World can show, in a fixed order: sim_worker's sprite ids
+    and netplay's kinds index this list.
+
+    Each side builds it from the same loaded images, so the numbers match.
+    """
+    images = [player_img, bullet_img, enemy_img, bullet_sprite()]
+    for scale in EXPLOSION_SCALES:
+        images += [transformed(frame, scale) for frame in explosion_frames]
+    return images
+
+class World:
+    """All gameplay state, advanced one tick at a time by step().
+
+    Nothing in here touches the window, the clock or the mixer, so the same
+    rules run in the windowed game and headless under the SDL dummy driver.
+    Sound cues are reported through self.events for the caller to play.
+    """
+
+    def __init__(self, player_img, bullet_img, enemy_img, explosion_frames, seed=None, enemy_backend=ENEMY_BACKEND, overrides=None,
+                 bullet_hell=BULLET_HELL):
+        tuning = {name: globals()[name] for name in TUNABLE_SETTINGS}
+        for name, value in (overrides or {}).items():
+            if name not in tuning:
+                raise ValueError(f"{name} is not one of {', '.join(TUNABLE_SETTINGS)}")
+            tuning[name] = value
+        self.waves_path = tuning["WAVES_PATH"]
+        self.waves = load_waves(self.waves_path)
+        self.enemy_speed = tuning["ENEMY_SPEED"]
+        self.max_health = tuning["PLAYER_HEALTH"]
+        self.bullet_speed = tuning["PLAYER_BULLET_SPEED"]
+
+        if seed is None:
+            seed = random.getrandbits(32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        self.atlas = assets.atlas()
+        self.bullet_img = bullet_img
+        self.enemy_img = enemy_img
+        self.explosion_frames = explosion_frames
+
+        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50, player_img)
+        self.players = [self.player]
+        self.player_group = pygame.sprite.Group(self.player)
+        self.bullets = pygame.sprite.Group()
+        self.enemies = pygame.sprite.Group()
+        self.explosions = pygame.sprite.Group()
+        self.enemy_hash = SpatialHash(COLLISION_CELL_SIZE)
+        self.collision_mode = COLLISION_MODE
+
+        # Every enemy shot, from either backend, goes into the projectile pool
+        self.projectiles = ProjectilePool()
+        self.bullet_hell = bullet_hell
+        self.classic_shot = Straight()
+
+        # With the numpy backend enemy ships live in the swarm arrays, with
+        # their bullet-hell emitters kept per slot
+        self.swarm = None
+        self.swarm_emitters = {}
+        self.enemy_backend = enemy_backend
+        if enemy_backend == "numpy":
+            self.swarm = enemy_swarm.EnemySwarm(enemy_img, self.rng)
+            self.swarm.speed_y = self.enemy_speed
+
+        self.score = 0
+        self.health = self.max_health
+        self.kills = 0
+        self.damage_taken = 0
+        self.tick = 0
+        self.game_over = False
+        self.events = []
+        self.prev_positions = {}
+
+        # Spawns, enemy shots, explosion frames and other "at tick N" work
+        self.timers = TimingWheel()
+        self.waves.start(self)
+
+    def add_player(self, image=None):
+        """Put another ship in play for co-op and return it.
+
+        Every ship shares the one score and health; step() takes an input
+        bitmask per ship, in the order they were added. Ships start spread out
+        (see spawn_x); before the first tick the ships already in play move
+        to their places too, later they stay put.
+        """
+        count = len(self.players) + 1
+        player = Player(spawn_x(count - 1, count), SCREEN_HEIGHT - 50, image or self.player.image)
+        if self.tick == 0:
+            for i, other in enumerate(self.players):
+                other.rect.centerx = spawn_x(i, count)
+        self.players.append(player)
+        self.player_group.add(player)
+        return player
+
+    def step(self, inputs, *partner_inputs):
+        """Advance the simulation by one tick using an input bitmask from inputs.py per ship"""
+        self.events = []
+        if self.game_over:
+            return
+        self.tick += 1
+        self.prev_positions = {s: s.rect.topleft for group in (self.player_group, self.bullets, self.enemies) for s in group}
+        controls = list(zip(self.players, chain((inputs,), partner_inputs, repeat(0))))
+
+        for player, bits in controls:
+            if bits & INPUT_FIRE:
+                bullet = Bullet(player.rect.centerx, player.rect.top, self.bullet_img)
+                bullet.speed = self.bullet_speed
+                self.bullets.add(bullet)
+                self.events.append("shoot")
+
+        self.timers.advance(self.tick)
+        profiler.lap("timers")
+
+        for player, bits in controls:
+            player.update(bits)
+        profiler.lap("player")
+        self.bullets.update()
+        profiler.lap("bullets")
+        self.projectiles.update()
+        # Aimed shots take turns between the ships
+        self.projectiles.target = self.players[self.tick % len(self.players)].rect.center
+        self.enemies.update()
+        if self.swarm is not None:
+            self.swarm.update()
+        profiler.lap("enemies")
+
+        # Enemies register into the grid; bullets and the player only test
+        # against the cells they overlap
+        self.enemy_hash.rebuild(self.enemies)
+        collided = collide_mask if self.collision_mode == "mask" else None
+        for bullet in self.bullets:
+            hit = [e.rect.center for e in self.enemy_hash.spritecollide(bullet, True, collided)]
+            if self.swarm is not None:
+                hit += self._swarm_collide(bullet)
+            if hit:
+                bullet.kill()
+                for x, y in hit:
+                    self.explosions.add(Explosion(x, y, self.explosion_frames, self.timers, scale=EXPLOSION_SCALES[0], speed=4))
+                self.score += 100
+                self.kills += len(hit)
+                self.events.append("explosion")
+
+        for player in self.players:
+            hits = self.enemy_hash.spritecollide(player, True, collided)
+            if self.swarm is not None:
+                hits += self._swarm_collide(player)
+            shots = self.projectiles.collide_rect(player.rect, self._mask(player))
+            if hits or shots:
+                self.health -= 1
+                self.damage_taken += 1
+                self.explosions.add(Explosion(player.rect.centerx, player.rect.centery, self.explosion_frames, self.timers, scale=EXPLOSION_SCALES[1], speed=4))
+                self.events.append("hit")
+                if self.health <= 0:
+                    self.game_over = True
+        profiler.lap("collision")
+
+    def spawn_enemy(self, x, y, speed=None):
+        speed = self.enemy_speed if speed is None else speed
+        if self.swarm is not None:
+            swarm = self.swarm
+            i = swarm.spawn(x, y, speed)
+            if self.bullet_hell:
+                self.swarm_emitters[i], swarm.shoot_delay[i] = bullet_hell_emitter(self.rng)
+            self.timers.after(int(swarm.shoot_delay[i]), self._swarm_shot, i, int(swarm.generation[i]))
+        else:
+            enemy = Enemy(x, y, self.enemy_img, self.rng, self.projectiles, self.classic_shot)
+            enemy.speed_y = speed
+            if self.bullet_hell:
+                enemy.emitter, enemy.shoot_delay = bullet_hell_emitter(self.rng)
+            self.add_enemy(enemy)
+
+    def add_enemy(self, enemy):
+        """Put an Enemy sprite in play, firing every shoot_delay ticks off the timing wheel"""
+        self.enemies.add(enemy)
+        self.timers.after(enemy.shoot_delay, self._enemy_shot, enemy)
+
+    def _enemy_shot(self, enemy):
+        # A killed enemy's timer is left to run out rather than cancelled
+        if enemy.alive():
+            enemy.shoot()
+            self.timers.after(enemy.shoot_delay, self._enemy_shot, enemy)
+
+    def _swarm_shot(self, i, generation):
+        swarm = self.swarm
+        if swarm.alive[i] and swarm.generation[i] == generation:  # not killed, slot not reused
+            self.swarm_emitters.get(i, self.classic_shot).fire(self.projectiles, *swarm.muzzle(i))
+            self.timers.after(int(swarm.shoot_delay[i]), self._swarm_shot, i, generation)
+
+    def enemy_count(self):
+        return len(self.enemies) + (len(self.swarm) if self.swarm is not None else 0)
+
+    def enemy_centers(self):
+        """(x, y) centre of every enemy ship and enemy shot, from either backend"""
+        centers = [e.rect.center for e in self.enemies]
+        if self.swarm is not None:
+            centers += self.swarm.centers()
+        return centers + self.projectiles.centers()
+
+    def _mask(self, sprite):
+        return mask_for(sprite.image) if self.collision_mode == "mask" else None
+
+    def _swarm_collide(self, sprite):
+        """Kill the swarm enemies sprite hits and return their centres"""
+        hit = self.swarm.collide_rect(sprite.rect, self._mask(sprite))
+        centers = [self.swarm.center(i) for i in hit]
+        self.swarm.kill(hit)
+        return centers
+
+    def draw(self, surface, alpha=1.0):
+        """Draw everything alpha of the way from last tick's positions to this tick's.
+
+        Every entity goes out in one blits call; sprites in the atlas are
+        blitted as (atlas surface, position, area) so they share one source.
+        The layers are chained generators, so no list of every blit is built.
+        """
+        layers = [self._group_blits(group, alpha) for group in (self.player_group, self.bullets, self.enemies)]
+        if self.swarm is not None:
+            layers.append(self._position_blits(self.swarm.image, *self.swarm.positions(alpha)))
+        layers.append(self._position_blits(self.projectiles.sprite, *self.projectiles.positions(alpha)))
+        layers.append(self._group_blits(self.explosions, 1.0))
+        surface.blits(chain.from_iterable(layers), False)
+
+    def _source(self, image):
+        if self.atlas is None:
+            return image, None
+        return self.atlas.source(image)
+
+    def _group_blits(self, group, alpha):
+        prev = self.prev_positions
+        source = self._source
+        for sprite in group:
+            x, y = sprite.rect.topleft
+            if alpha < 1.0:
+                last = prev.get(sprite)
+                if last is not None:
+                    x = round(last[0] + (x - last[0]) * alpha)
+                    y = round(last[1] + (y - last[1]) * alpha)
+            image, area = source(sprite.image)
+            yield image, (x, y), area
+
+    def _position_blits(self, image, xs, ys):
+        image, area = self._source(image)
+        return zip(repeat(image), zip(xs, ys), repeat(area))
+
+def spawn_x(index, count):
+    """Center x of ship index (from 0) of count when added: evenly spaced across the screen"""
+    return (index + 1) * SCREEN_WIDTH // (count + 1)
+
+def create_headless_world(seed=None, enemy_backend=ENEMY_BACKEND, overrides=None, bullet_hell=BULLET_HELL):
+    """Build a World without opening a real window, using the SDL dummy video driver"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+    return World(*load_images(), seed=seed, enemy_backend=enemy_backend, overrides=overrides, bullet_hell=bullet_hell)
+
+def run(world, max_ticks, policy=None):
+    """Step the world uncapped until game over or max_ticks; returns ticks run"""
+    start = world.tick
+    while not world.game_over and world.tick - start < max_ticks:
+        world.step(policy(world) if policy else 0)
+    return world.tick - start
+
+if __name__ == "__main__":
+    import argparse
+    from policies import random_policy
+    parser = argparse.ArgumentParser(description="Run the simulation headless as fast as possible")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--ticks", type=int, default=100000)
+    parser.add_argument("--enemies", choices=["sprites", "numpy"], default=ENEMY_BACKEND)
+    parser.add_argument("--bullet-hell", action="store_true", default=BULLET_HELL)
+    args = parser.parse_args()
+
+    world = create_headless_world(args.seed, args.enemies, bullet_hell=args.bullet_hell)
+    started = time.perf_counter()
+    ticks = run(world, args.ticks, random_policy(random.Random(world.seed)))
+    elapsed = time.perf_counter() - started
+    print(f"seed={world.seed} ticks={ticks} score={world.score} health={world.health} "
+          f"ticks/sec={ticks / elapsed:.0f}")
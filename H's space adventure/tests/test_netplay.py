@@ -0,0 +1,127 @@
+# tests/test_netplay.py
+#
+# Round trips through the snapshot codec in netplay.py.
+# Run from the game folder: python -m pytest tests
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from netplay import (BitWriter, BitReader, encode_delta, decode_delta, quantize, dequantize, NetClient,
+                     SNAPSHOT, SNAPSHOT_HEADER, DELTA_RANGE, POSITION_MAX, POSITION_OFFSET, KIND_BITS,
+                     MOVE, MORPH, FULL)
+
+def round_trip(baseline, current):
+    writer = BitWriter()
+    encode_delta(writer, baseline, current)
+    reader = BitReader(writer.getvalue())
+    return decode_delta(reader, baseline)
+
+def test_bits_round_trip():
+    writer = BitWriter()
+    fields = [(1, 1), (0, 3), (5, 3), (1023, 10), (-7 & 63, 6), (0xABCDE, 20), (2, 2)]
+    for value, bits in fields:
+        writer.write(value, bits)
+    for value in (0, 15, 16, 300, 1 << 30):
+        writer.varint(value)
+    writer.write(-DELTA_RANGE, 6)
+    reader = BitReader(writer.getvalue())
+    assert [reader.read(bits) for _, bits in fields] == [value for value, _ in fields]
+    assert [reader.varint() for _ in range(5)] == [0, 15, 16, 300, 1 << 30]
+    assert reader.signed(6) == -DELTA_RANGE
+
+def test_negative_moves():
+    baseline = {1: (3, 100, 200), 2: (4, 50, 50)}
+    current = {1: (3, 100 - DELTA_RANGE, 200 + DELTA_RANGE - 1), 2: (4, 49, 48)}
+    decoded = round_trip(baseline, current)
+    assert decoded == current
+
+def test_morph_full_and_removed():
+    baseline = {1: (3, 100, 200), 2: (4, 50, 50), 7: (5, 10, 10)}
+    current = {
+        1: (9, 102, 198),  # MORPH: new kind, small move
+        2: (4, 50 + DELTA_RANGE, 50),  # FULL: too far for a delta
+        9: ((1 << KIND_BITS) - 1, POSITION_MAX, 0),  # FULL: new entity
+    }
+    decoded = round_trip(baseline, current)
+    assert decoded == current
+
+def test_ops_chosen():
+    baseline = {1: (3, 100, 200), 2: (3, 100, 200)}
+    current = {1: (3, 101, 200), 2: (6, 101, 200), 3: (3, 0, 0)}
+    writer = BitWriter()
+    encode_delta(writer, baseline, current)
+    reader = BitReader(writer.getvalue())
+    assert reader.varint() == 0  # nothing removed
+    assert reader.varint() == 3
+    ops = []
+    for _ in range(3):
+        reader.varint()
+        op = reader.read(2)
+        ops.append(op)
+        if op == FULL:
+            reader.read(KIND_BITS)
+            reader.read(20)
+        else:
+            if op == MORPH:
+                reader.read(KIND_BITS)
+            reader.read(12)
+    assert ops == [MOVE, MORPH, FULL]
+
+def test_unchanged_costs_nothing():
+    baseline = {i: (1, i, i) for i in range(1, 50)}
+    writer = BitWriter()
+    encode_delta(writer, baseline, dict(baseline))
+    assert len(writer.getvalue()) == 2
+
+def test_clamped_positions():
+    assert quantize(-10 * POSITION_OFFSET) == 0
+    assert quantize(100000) == POSITION_MAX
+    assert dequantize(quantize(-POSITION_OFFSET)) == -POSITION_OFFSET
+    assert dequantize(quantize(300)) == 300
+    current = {1: (2, quantize(-10000), quantize(10000))}
+    decoded = round_trip({}, current)
+    assert decoded == {1: (2, 0, POSITION_MAX)}
+
+def test_truncated_delta_raises():
+    writer = BitWriter()
+    encode_delta(writer, {}, {i: (1, i, i) for i in range(1, 20)})
+    data = writer.getvalue()
+    try:
+        decode_delta(BitReader(data[:len(data) // 2]), {})
+    except IndexError:
+        pass
+    else:
+        raise AssertionError("a truncated delta decoded")
+
+class FakeSocket:
+    """Hands out the queued packets, then reports nothing waiting"""
+
+    def __init__(self, packets):
+        self.packets = list(packets)
+
+    def recvfrom(self, size):
+        if not self.packets:
+            raise BlockingIOError
+        return self.packets.pop(0)
+
+    def sendto(self, data, address):
+        return len(data)
+
+def test_client_counts_undecodable_snapshot_as_corrupt():
+    address = ("127.0.0.1", 50210)
+    header = SNAPSHOT_HEADER.pack(SNAPSHOT, 3, 0, 0, 0, 0, 0, 100, 0, 0, 0, 0, 0, 0, 0)
+    writer = BitWriter()
+    writer.varint(0)
+    writer.varint(1)
+    writer.varint(5)
+    writer.write(MOVE, 2)  # a move for an entity the client never had
+    writer.write(0, 12)
+    sock = FakeSocket([(header + writer.getvalue(), address)])
+    client = NetClient(address[0], pygame.Surface((10, 10)), port=address[1], sock=sock)
+    assert not client.poll()
+    assert (client.stats.corrupt, client.stats.late, client.stats.lost) == (1, 0, 0)